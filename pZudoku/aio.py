@@ -0,0 +1,152 @@
+"""
+Solving of HB6DBoard boards from asyncio code, without blocking the event
+loop.
+
+The search is run in slices of a few nodes with `Search.run()`, either on
+the event loop, which runs other tasks between slices, or in an executor.
+Either way, cancelling the task (e.g. with `asyncio.wait_for()`) stops the
+search within a slice, and restores the board.
+"""
+import asyncio
+import threading
+
+import numpy as np
+
+from pZudoku.hb6d_board import ConsistencyError, Search, _check_option
+
+
+# Valid values of the `mode` argument of solve()
+_MODES = ('yield', 'executor')
+
+# Default number of search nodes per slice, i.e. between two chances for
+# the event loop to run other tasks, or to cancel the search
+_DEFAULT_NODES_PER_SLICE = 4
+
+
+def _run_slices(search, nodes_per_slice, stop):
+    """
+    Run the search in slices until it's solved or exhausted, or until `stop`
+    is set.
+
+    Returns
+    -------
+    state : {Search.PAUSED, Search.SOLVED, Search.EXHAUSTED}
+    """
+    while True:
+        state = search.run(nodes_per_slice)
+        if state != Search.PAUSED or stop.is_set():
+            return state
+
+
+async def _wait_uncancellable(future):
+    """
+    Wait until the given future is done, even if the task is cancelled in
+    the meantime.
+    """
+    while not future.done():
+        try:
+            await asyncio.wait([future])
+        except asyncio.CancelledError:
+            pass
+
+
+async def _run_on_loop(search, nodes_per_slice):
+    """
+    Run the search in slices on the event loop, yielding to it between
+    slices.
+    """
+    while True:
+        state = search.run(nodes_per_slice)
+        if state != Search.PAUSED:
+            return state
+        await asyncio.sleep(0)
+
+
+async def _run_in_executor(search, nodes_per_slice, executor):
+    """
+    Run the search in slices in the given executor. If the task is
+    cancelled, stop it after the current slice, and wait for that before
+    raising, so that the board isn't touched by two threads.
+    """
+    stop = threading.Event()
+    future = asyncio.get_event_loop().run_in_executor(
+        executor, _run_slices, search, nodes_per_slice, stop
+    )
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        stop.set()
+        await _wait_uncancellable(future)
+        raise
+
+
+async def solve(board, branching='mrv', backtracking='trail', stats=None,
+                propagation='singles', mode='yield',
+                nodes_per_slice=_DEFAULT_NODES_PER_SLICE, executor=None):
+    """
+    Fill in the given board with a solution, like `HB6DBoard.solve()` with
+    the 'search' algorithm, without blocking the event loop.
+
+    The board must not be used by anything else until this returns. If the
+    task is cancelled, e.g. by a timeout of `asyncio.wait_for()`, the search
+    stops within `nodes_per_slice` nodes, and the board is restored before
+    `asyncio.CancelledError` is raised.
+
+    Parameters
+    ----------
+    board : HB6DBoard
+        Board to solve in-place.
+    branching : {'mrv', 'first'}, optional
+        Branching policy. See `HB6DBoard.solve()`. Default is 'mrv'.
+    backtracking : {'trail', 'copy'}, optional
+        Backtracking mode. See `HB6DBoard.solve()`. Default is 'trail'.
+    stats : SolveStats or None, optional
+        If given, add the statistics of the search to it. Default is None.
+    propagation : {'singles', 'locked', 'subsets', 'fish'}, optional
+        Propagation level. See `HB6DBoard.solve()`. Default is 'singles'.
+    mode : {'yield', 'executor'}, optional
+        Where to run the search.
+
+        - 'yield': on the event loop, letting it run other tasks after
+          every slice of `nodes_per_slice` nodes.
+        - 'executor': in `executor`, so that the event loop is free
+          throughout. The search checks for cancellation after every slice.
+
+        Default is 'yield'.
+    nodes_per_slice : int, optional
+        Number of search nodes per slice. Smaller slices keep the latency of
+        the other tasks lower, but add overhead. Default is 4.
+    executor : concurrent.futures.Executor or None, optional
+        Executor of the 'executor' mode. It must run in this process, e.g. a
+        ThreadPoolExecutor. Default is None, i.e. the default executor of
+        the event loop.
+
+    Raises
+    ------
+    ConsistencyError
+        If the board has no solution.
+    ValueError
+        If an option is unknown, or if `nodes_per_slice` isn't positive.
+    asyncio.CancelledError
+        If the task is cancelled.
+    """
+    _check_option(mode, _MODES, 'mode')
+    if nodes_per_slice < 1:
+        msg = "Number of nodes per slice must be positive, not {}."
+        raise ValueError(msg.format(nodes_per_slice))
+
+    _cells = board._cells.copy()
+    search = Search(board, branching, backtracking, stats, propagation)
+    try:
+        if mode == 'yield':
+            state = await _run_on_loop(search, nodes_per_slice)
+        else:
+            state = await _run_in_executor(search, nodes_per_slice, executor)
+    except asyncio.CancelledError:
+        np.copyto(board._cells, _cells)
+        raise
+    finally:
+        search.close()
+
+    if state != Search.SOLVED:
+        raise ConsistencyError("No solution found.")
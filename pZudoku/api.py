@@ -1 +1,45 @@
+from pZudoku.bitmask_board import BitmaskBoard
+from pZudoku.cache import SolutionCache  # noqa: F401
+from pZudoku.hb6d_board import ConsistencyError  # noqa: F401
+from pZudoku.hb6d_board import HB6DBoard
 from pZudoku.hb6d_board import HB6DBoard as Board  # noqa: F401
+from pZudoku.stats import SolveStats  # noqa: F401
+from pZudoku.store import SolutionStore  # noqa: F401
+
+
+# Board classes by backend name
+BACKENDS = {
+    'hb6d': HB6DBoard,
+    'bitmask': BitmaskBoard,
+}
+
+
+def board_class(backend='hb6d'):
+    """
+    Return the board class of the given backend.
+
+    Every backend exposes the same `from_array`, `insert`, `candidates`,
+    `solve` and `__str__` API.
+
+    Parameters
+    ----------
+    backend : {'hb6d', 'bitmask'}, optional
+        Name of the backend. 'hb6d' stores the candidates in a 6-D boolean
+        NumPy array, while 'bitmask' stores them in a 9-bit mask per square,
+        which is faster for solving single boards. Default is 'hb6d'.
+
+    Returns
+    -------
+    cls : type
+        The board class, e.g. `HB6DBoard`.
+
+    Raises
+    ------
+    ValueError
+        If the backend is unknown.
+    """
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        msg = "Unknown backend: {!r}."
+        raise ValueError(msg.format(backend))
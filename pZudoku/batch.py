@@ -0,0 +1,470 @@
+import collections
+import concurrent.futures
+import itertools
+import os
+
+import numpy as np
+
+from pZudoku.hb6d_board import (
+    ConsistencyError,
+    HB6DBoard,
+    _CONSTRAINT_AXES,
+    _SHAPE,
+)
+from pZudoku.stats import SolveStats
+
+
+# Values of the status array returned by `solve_many()`
+SOLVED = 0  # Solved by propagation alone
+SOLVED_BY_SEARCH = 1  # Solved by backtracking
+NO_SOLUTION = 2  # Inconsistent puzzle
+ERROR = 3  # Puzzle couldn't be processed, e.g. because it's malformed
+
+# Prefix of the keys of the puzzles of `solve_many()` in a SolutionStore,
+# apart from the keys of `HB6DBoard.solve()`
+_STORE_KEY_PREFIX = b'grid:'
+
+# Axes of the stacked (N, 3, 3, 3, 3, 3, 3) array to reduce along in order to
+# get one value per square, numrow, numcol and numbox of each puzzle
+_BATCH_CONSTRAINT_AXES = tuple(
+    tuple(axis + 1 for axis in axes) for axes in _CONSTRAINT_AXES
+)
+
+
+def _grids_to_givens(grids):
+    """
+    Convert a stack of 9-by-9 grids to a stack of 6-D one-hot arrays.
+
+    Parameters
+    ----------
+    grids : array_like of int or None and of shape (N, 9, 9)
+        Fill values of each square of each puzzle. Values other than 1 to 9
+        (e.g. 0 or None) correspond to empty squares.
+
+    Returns
+    -------
+    givens : numpy.ndarray of bool and of shape (N, 3, 3, 3, 3, 3, 3)
+        True for the given number of every filled square.
+    """
+    grids = np.asarray(grids)
+    if grids.dtype == object:
+        grids = np.where(np.equal(grids, None), 0, grids).astype(int)
+    # Array of shape (N, 9, 9, 9), indexed by [puzzle, _num, _row, _col]
+    givens = grids[:, np.newaxis, :, :] == np.arange(1, 10).reshape(9, 1, 1)
+    return givens.reshape((len(grids),) + _SHAPE)
+
+
+def _cells_to_grids(cells):
+    """
+    Convert a stack of solved 6-D boolean arrays to a stack of 9-by-9 grids.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray of bool and of shape (N, 3, 3, 3, 3, 3, 3)
+        Candidates of each puzzle. Every square must have exactly one.
+
+    Returns
+    -------
+    grids : numpy.ndarray of int and of shape (N, 9, 9)
+        Number in each square of each puzzle. One-based.
+    """
+    # Array of shape (N, 9, 9, 9), indexed by [puzzle, _num, _row, _col]
+    cells = cells.reshape((len(cells), 9, 9, 9))
+    return cells.argmax(axis=1) + 1
+
+
+def _propagate(cells, singles):
+    """
+    Insert the given candidates into a stack of boards and then repeatedly
+    apply "hidden single" and "unique candidate" to all of them at once, until
+    every board is either inconsistent or stops changing.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray of bool and of shape (N, 3, 3, 3, 3, 3, 3)
+        Candidates of each puzzle. Modified in-place.
+    singles : numpy.ndarray of bool and of shape (N, 3, 3, 3, 3, 3, 3)
+        Candidates to insert first, e.g. the givens.
+
+    Returns
+    -------
+    consistent : numpy.ndarray of bool and of shape (N,)
+        False for every board found to be inconsistent: either a constraint
+        has no candidates, or two insertions clash.
+    """
+    n_boards = len(cells)
+    consistent = np.ones(n_boards, dtype=bool)
+    # Boards that might still change, and their next insertions
+    active = np.arange(n_boards)
+    sub_singles = singles
+
+    while len(active):
+        sub_cells = cells[active]
+
+        # Number of insertions touching each constraint
+        sums = [
+            sub_singles.sum(axis=axes, keepdims=True)
+            for axes in _BATCH_CONSTRAINT_AXES
+        ]
+        clash = np.zeros(len(active), dtype=bool)
+        for s in sums:
+            clash |= (s > 1).reshape(len(active), -1).any(axis=1)
+
+        # Set the peers of every insertion, except for the inserted cells
+        # themselves, to False
+        peers = (sums[0] > 0) | (sums[1] > 0) | (sums[2] > 0) | (sums[3] > 0)
+        removed = sub_cells & peers & ~sub_singles
+        sub_cells &= ~removed
+        cells[active] = sub_cells
+
+        # Count the remaining candidates of every constraint
+        counts = [
+            sub_cells.sum(axis=axes, keepdims=True)
+            for axes in _BATCH_CONSTRAINT_AXES
+        ]
+        empty = np.zeros(len(active), dtype=bool)
+        for c in counts:
+            empty |= (c == 0).reshape(len(active), -1).any(axis=1)
+
+        inconsistent = clash | empty
+        consistent[active[inconsistent]] = False
+        changed = removed.reshape(len(active), -1).any(axis=1)
+
+        # Find the next insertions of the boards that are still changing
+        keep = changed & ~inconsistent
+        active = active[keep]
+        sub_singles = sub_cells[keep] & np.logical_or.reduce(
+            np.broadcast_arrays(*[c[keep] == 1 for c in counts])
+        )
+
+    return consistent
+
+
+def _store_keys(givens):
+    """
+    Return the key of every puzzle in a SolutionStore: its givens packed
+    into bytes, one bit per cell.
+
+    Parameters
+    ----------
+    givens : numpy.ndarray of bool and of shape (N, 3, 3, 3, 3, 3, 3)
+
+    Returns
+    -------
+    keys : list of bytes
+    """
+    packed = np.packbits(givens.reshape(len(givens), -1), axis=1)
+    return [_STORE_KEY_PREFIX + row.tobytes() for row in packed]
+
+
+def _store_key(puzzle):
+    """
+    Return the key of a puzzle in a SolutionStore, or None if the puzzle is
+    malformed.
+    """
+    try:
+        return _store_keys(_grids_to_givens([puzzle]))[0]
+    except Exception:
+        return None
+
+
+def _from_store(outcomes, keys, solutions, status):
+    """
+    Fill in the solutions and status of the puzzles found in a store.
+
+    Parameters
+    ----------
+    outcomes : dict
+        (status, solution) tuple by key, as returned by
+        `SolutionStore.get_many()`.
+    keys : list of bytes or None
+        Key of every puzzle.
+    solutions : numpy.ndarray of int and of shape (N, 9, 9)
+        Modified in-place.
+    status : numpy.ndarray of int and of shape (N,)
+        Modified in-place.
+
+    Returns
+    -------
+    missing : list of int
+        Indices of the puzzles that weren't found.
+    """
+    missing = []
+    for n, key in enumerate(keys):
+        try:
+            status[n], solution = outcomes[key]
+        except KeyError:
+            missing.append(n)
+        else:
+            solutions[n] = np.frombuffer(solution, dtype=np.uint8).reshape(
+                9, 9
+            )
+    return missing
+
+
+def _to_store(store, keys, solutions, status):
+    """
+    Store the solutions and status of the given puzzles, except for the ones
+    that couldn't be processed.
+    """
+    store.put_many([
+        (key, (puzzle_status, solution.astype(np.uint8).tobytes()))
+        for key, solution, puzzle_status in zip(keys, solutions, status)
+        if key is not None and puzzle_status != ERROR
+    ])
+
+
+def _solve_givens(givens, return_stats):
+    """
+    Solve a batch of sudoku puzzles given as a stack of 6-D one-hot arrays.
+    See `solve_many()`.
+
+    Returns
+    -------
+    solutions : numpy.ndarray of int and of shape (N, 9, 9)
+    status : numpy.ndarray of int and of shape (N,)
+    stats : list of SolveStats or None
+        None unless `return_stats` is True.
+    """
+    n_puzzles = len(givens)
+    cells = np.ones_like(givens)
+
+    consistent = _propagate(cells, givens)
+    status = np.where(consistent, SOLVED, NO_SOLUTION)
+
+    # Search the consistent puzzles with more than one candidate somewhere
+    n_candidates = cells.reshape(n_puzzles, -1).sum(axis=1)
+    stats = [SolveStats() for _ in range(n_puzzles)] if return_stats else None
+    for n in np.flatnonzero(consistent & (n_candidates > 81)):
+        board = HB6DBoard()
+        board._cells = cells[n].copy()
+        try:
+            board.solve(stats=None if stats is None else stats[n])
+        except ConsistencyError:
+            status[n] = NO_SOLUTION
+        else:
+            cells[n] = board._cells
+            status[n] = SOLVED_BY_SEARCH
+
+    solutions = _cells_to_grids(cells)
+    solutions[status == NO_SOLUTION] = 0
+    return solutions, status, stats
+
+
+def solve_many(puzzles, return_stats=False, store=None):
+    """
+    Solve a batch of sudoku puzzles.
+
+    Load every puzzle into one stacked boolean array and apply the simple
+    techniques of `HB6DBoard._quick_fill()` to all of them at once. Only the
+    puzzles that are neither solved nor found to be inconsistent by then are
+    solved one by one with `HB6DBoard.solve()`.
+
+    Parameters
+    ----------
+    puzzles : array_like of int or None and of shape (N, 9, 9)
+        Nine-by-nine array of fill values for each square of each puzzle.
+        Values other than 1 to 9 (e.g. 0 or None) correspond to empty squares.
+    return_stats : bool, optional
+        If True, also return the search statistics of each puzzle. Default
+        is False.
+    store : SolutionStore or None, optional
+        If given, look every puzzle up in it first, and only solve (and then
+        store) the ones that aren't found. Default is None.
+
+    Returns
+    -------
+    solutions : numpy.ndarray of int and of shape (N, 9, 9)
+        Solution of each puzzle. All zeros for puzzles without a solution.
+    status : numpy.ndarray of int and of shape (N,)
+        SOLVED, SOLVED_BY_SEARCH or NO_SOLUTION for each puzzle.
+    stats : list of SolveStats
+        Only returned if `return_stats` is True. Statistics of the search of
+        each puzzle, all zeros for the ones that weren't searched (or were
+        found in the store). Add them up to aggregate them, e.g.
+        ``sum(stats, SolveStats())``.
+    """
+    givens = _grids_to_givens(puzzles)
+    if store is None:
+        solutions, status, stats = _solve_givens(givens, return_stats)
+    else:
+        n_puzzles = len(givens)
+        keys = _store_keys(givens)
+        solutions = np.zeros((n_puzzles, 9, 9), dtype=int)
+        status = np.zeros(n_puzzles, dtype=int)
+        missing = _from_store(store.get_many(keys), keys, solutions, status)
+
+        stats = (
+            [SolveStats() for _ in range(n_puzzles)] if return_stats else None
+        )
+        if missing:
+            sub_solutions, sub_status, sub_stats = _solve_givens(
+                givens[missing], return_stats
+            )
+            solutions[missing] = sub_solutions
+            status[missing] = sub_status
+            if return_stats:
+                for n, puzzle_stats in zip(missing, sub_stats):
+                    stats[n] = puzzle_stats
+            _to_store(
+                store, [keys[n] for n in missing], sub_solutions, sub_status
+            )
+
+    if return_stats:
+        return solutions, status, stats
+    return solutions, status
+
+
+def _solve_chunk(puzzles):
+    """
+    Solve a chunk of puzzles with `solve_many()`, isolating failures.
+
+    If the chunk as a whole can't be solved, e.g. because one of its puzzles
+    is malformed, solve the puzzles one by one, and report ERROR for the ones
+    that fail.
+
+    Parameters
+    ----------
+    puzzles : list of array_like of int or None and of shape (9, 9)
+
+    Returns
+    -------
+    solutions : numpy.ndarray of int and of shape (N, 9, 9)
+    status : numpy.ndarray of int and of shape (N,)
+        See `solve_many()`.
+    """
+    try:
+        return solve_many(puzzles)
+    except Exception:
+        solutions = np.zeros((len(puzzles), 9, 9), dtype=int)
+        status = np.full(len(puzzles), ERROR, dtype=int)
+        for n, puzzle in enumerate(puzzles):
+            try:
+                solution, puzzle_status = solve_many([puzzle])
+            except Exception:
+                continue
+            solutions[n] = solution[0]
+            status[n] = puzzle_status[0]
+        return solutions, status
+
+
+def _lookup_chunk(puzzles, store):
+    """
+    Look the puzzles of a chunk up in a store.
+
+    Returns
+    -------
+    keys : list of bytes or None
+        Key of every puzzle, None for malformed ones.
+    solutions : numpy.ndarray of int and of shape (N, 9, 9)
+    status : numpy.ndarray of int and of shape (N,)
+        Solution and status of every puzzle found.
+    missing : list of int
+        Indices of the puzzles to solve.
+    """
+    keys = [_store_key(puzzle) for puzzle in puzzles]
+    outcomes = store.get_many(key for key in keys if key is not None)
+    solutions = np.zeros((len(puzzles), 9, 9), dtype=int)
+    status = np.zeros(len(puzzles), dtype=int)
+    missing = _from_store(outcomes, keys, solutions, status)
+    return keys, solutions, status, missing
+
+
+def solve_parallel(puzzles, n_workers=None, chunk_size=1000,
+                   max_in_flight=None, store=None):
+    """
+    Solve an iterable of sudoku puzzles in a pool of worker processes.
+
+    The puzzles are read lazily and split into chunks, and each chunk is
+    solved with `solve_many()` in a worker process. At most `max_in_flight`
+    chunks are read ahead, so memory use doesn't depend on the number of
+    puzzles.
+
+    Parameters
+    ----------
+    puzzles : iterable of array_like of int or None and of shape (9, 9)
+        Nine-by-nine array of fill values for each square of each puzzle.
+        Values other than 1 to 9 (e.g. 0 or None) correspond to empty squares.
+    n_workers : int or None, optional
+        Number of worker processes. Default is None, i.e. the number of CPUs.
+    chunk_size : int, optional
+        Number of puzzles per chunk. Default is 1000.
+    max_in_flight : int or None, optional
+        Maximum number of chunks submitted to the pool but not yet yielded.
+        Default is None, i.e. twice the number of worker processes.
+    store : SolutionStore or None, optional
+        If given, look every chunk up in it, only send the puzzles that
+        aren't found to the workers, and store their outcomes. Default is
+        None.
+
+    Yields
+    ------
+    solution : numpy.ndarray of int and of shape (9, 9)
+        Solution of the next puzzle, in input order. All zeros if the puzzle
+        has no solution or couldn't be processed.
+    status : int
+        SOLVED, SOLVED_BY_SEARCH, NO_SOLUTION or ERROR.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` or `max_in_flight` is less than one.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * n_workers
+    if chunk_size < 1:
+        msg = "Chunk size must be positive, not {}."
+        raise ValueError(msg.format(chunk_size))
+    if max_in_flight < 1:
+        msg = "Maximum number of chunks in flight must be positive, not {}."
+        raise ValueError(msg.format(max_in_flight))
+
+    puzzles = iter(puzzles)
+    with concurrent.futures.ProcessPoolExecutor(n_workers) as executor:
+        futures = collections.deque()
+        try:
+            while True:
+                # Read ahead until enough chunks are in flight
+                while len(futures) < max_in_flight:
+                    chunk = list(itertools.islice(puzzles, chunk_size))
+                    if not chunk:
+                        break
+                    if store is None:
+                        futures.append(
+                            (executor.submit(_solve_chunk, chunk), None)
+                        )
+                        continue
+                    found = _lookup_chunk(chunk, store)
+                    missing = found[-1]
+                    future = executor.submit(
+                        _solve_chunk, [chunk[n] for n in missing]
+                    ) if missing else None
+                    futures.append((future, found))
+
+                if not futures:
+                    # Every puzzle is yielded
+                    return
+
+                # Yield the results of the oldest chunk
+                future, found = futures.popleft()
+                if found is None:
+                    solutions, status = future.result()
+                else:
+                    keys, solutions, status, missing = found
+                    if missing:
+                        sub_solutions, sub_status = future.result()
+                        solutions[missing] = sub_solutions
+                        status[missing] = sub_status
+                        _to_store(
+                            store, [keys[n] for n in missing], sub_solutions,
+                            sub_status,
+                        )
+                for solution, puzzle_status in zip(solutions, status):
+                    yield solution, int(puzzle_status)
+        finally:
+            # Don't start solving chunks that won't be yielded
+            for future, _ in futures:
+                if future is not None:
+                    future.cancel()
@@ -0,0 +1,6 @@
+"""
+Benchmarks for the pZudoku solver.
+
+Every module in this package can be run as a script, e.g.
+`python -m pZudoku.benchmarks.quick_fill`.
+"""
@@ -0,0 +1,80 @@
+"""
+Measure the latency of an unrelated task of the event loop while hard puzzles
+are solved: blocking with `HB6DBoard.solve()`, and with both modes of
+`pZudoku.aio.solve()`.
+
+Run as `python -m pZudoku.benchmarks.aio`.
+"""
+import asyncio
+
+import numpy as np
+
+from pZudoku import aio
+from pZudoku.benchmarks.tiers import make_tier
+from pZudoku.hb6d_board import HB6DBoard
+
+
+# Interval of the unrelated task, in seconds
+_TICK = 0.001
+
+
+async def _ticker(delays):
+    """
+    Sleep for `_TICK` seconds over and over, recording how late every wake
+    up is.
+    """
+    loop = asyncio.get_event_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(_TICK)
+        delays.append(loop.time() - start - _TICK)
+
+
+async def _solve_all(puzzles, mode):
+    """
+    Solve the given puzzles one after the other, in the given mode.
+    """
+    for squares in puzzles:
+        board = HB6DBoard.from_array(squares)
+        if mode == 'blocking':
+            board.solve()
+        else:
+            await aio.solve(board, mode=mode)
+
+
+async def _latencies(puzzles, mode):
+    """
+    Return the wake up delays of the unrelated task while the puzzles are
+    solved.
+    """
+    delays = []
+    task = asyncio.ensure_future(_ticker(delays))
+    await asyncio.sleep(_TICK)
+    await _solve_all(puzzles, mode)
+    # Let the last late wake up be recorded
+    await asyncio.sleep(2 * _TICK)
+    task.cancel()
+    return delays
+
+
+def main(number=6):
+    """
+    Print the median and 99th percentile of the wake up delays of the
+    unrelated task for every way of solving.
+    """
+    puzzles = make_tier('pathological', number)
+    loop = asyncio.new_event_loop()
+    try:
+        header = '{:<10} {:>12} {:>12}'
+        row = '{:<10} {:>9.2f} ms {:>9.2f} ms'
+        print(header.format('mode', 'p50', 'p99'))
+        for mode in ('blocking', 'yield', 'executor'):
+            delays = loop.run_until_complete(_latencies(puzzles, mode))
+            p50, p99 = 1e3 * np.percentile(delays, [50, 99])
+            print(row.format(mode, p50, p99))
+    finally:
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
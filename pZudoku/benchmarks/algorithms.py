@@ -0,0 +1,43 @@
+"""
+Compare the solving algorithms of `HB6DBoard.solve()`.
+
+Run as `python -m pZudoku.benchmarks.algorithms`.
+"""
+import timeit
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.hb6d_board import HB6DBoard
+
+
+def _time_per_solve(squares, algorithm, number):
+    """
+    Return the mean time in seconds of solving the given puzzle.
+    """
+    def run():
+        HB6DBoard.from_array(squares).solve(algorithm=algorithm)
+
+    return timeit.timeit(run, number=number) / number
+
+
+def main(number=5):
+    """
+    Print the time per puzzle of every algorithm.
+
+    Parameters
+    ----------
+    number : int, optional
+        Number of repetitions per puzzle. Default is 5.
+    """
+    header = '{:<8} {:>12} {:>12} {:>9}'
+    row = '{:<8} {:>9.1f} ms {:>9.1f} ms {:>8.1f}x'
+    print(header.format('puzzle', 'search', 'dlx', 'speedup'))
+    for name, squares in PUZZLES.items():
+        t_search = _time_per_solve(squares, 'search', number)
+        t_dlx = _time_per_solve(squares, 'dlx', number)
+        print(row.format(
+            name, 1e3 * t_search, 1e3 * t_dlx, t_search / t_dlx,
+        ))
+
+
+if __name__ == '__main__':
+    main()
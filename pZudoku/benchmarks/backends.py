@@ -0,0 +1,43 @@
+"""
+Compare the solving time of the board backends of `pZudoku.api`.
+
+Run as `python -m pZudoku.benchmarks.backends`.
+"""
+import timeit
+
+from pZudoku.api import BACKENDS
+from pZudoku.benchmarks.puzzles import PUZZLES
+
+
+def _time_per_solve(cls, squares, number):
+    """
+    Return the mean time in seconds of creating and solving the given puzzle.
+    """
+    def run():
+        cls.from_array(squares).solve()
+
+    return timeit.timeit(run, number=number) / number
+
+
+def main(number=5):
+    """
+    Print the time per puzzle of every backend.
+
+    Parameters
+    ----------
+    number : int, optional
+        Number of repetitions per puzzle. Default is 5.
+    """
+    header = '{:<8}' + ' {:>12}' * len(BACKENDS)
+    row = '{:<8}' + ' {:>9.2f} ms' * len(BACKENDS)
+    print(header.format('puzzle', *BACKENDS))
+    for name, squares in PUZZLES.items():
+        times = [
+            1e3 * _time_per_solve(cls, squares, number)
+            for cls in BACKENDS.values()
+        ]
+        print(row.format(name, *times))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Compare the backtracking modes of `HB6DBoard.solve()`.
+
+Run as `python -m pZudoku.benchmarks.backtracking`.
+"""
+import timeit
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.hb6d_board import HB6DBoard
+
+
+def _time_per_solve(squares, backtracking, number):
+    """
+    Return the mean time in seconds of solving the given puzzle.
+    """
+    def run():
+        HB6DBoard.from_array(squares).solve(backtracking=backtracking)
+
+    return timeit.timeit(run, number=number) / number
+
+
+def main(number=5):
+    """
+    Print the time per puzzle of both backtracking modes.
+
+    Parameters
+    ----------
+    number : int, optional
+        Number of repetitions per puzzle. Default is 5.
+    """
+    header = '{:<8} {:>12} {:>12} {:>9}'
+    row = '{:<8} {:>9.1f} ms {:>9.1f} ms {:>8.1f}x'
+    print(header.format('puzzle', 'copy', 'trail', 'speedup'))
+    for name, squares in PUZZLES.items():
+        t_copy = _time_per_solve(squares, 'copy', number)
+        t_trail = _time_per_solve(squares, 'trail', number)
+        print(row.format(name, 1e3 * t_copy, 1e3 * t_trail, t_copy / t_trail))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare `solve_many()` and `solve_parallel()` with solving the same puzzles
+one by one.
+
+Run as `python -m pZudoku.benchmarks.batch`.
+"""
+import time
+
+import numpy as np
+
+from pZudoku.batch import solve_many, solve_parallel
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.hb6d_board import HB6DBoard
+
+
+def _relabelled(squares, n_puzzles, seed=0):
+    """
+    Return copies of the given puzzle with randomly relabelled numbers.
+    """
+    rng = np.random.RandomState(seed)
+    squares = np.asarray(squares)
+    puzzles = np.zeros((n_puzzles, 9, 9), dtype=int)
+    for puzzle in puzzles:
+        labels = np.concatenate([[0], rng.permutation(9) + 1])
+        puzzle[...] = labels[squares]
+    return puzzles
+
+
+def main(n_puzzles=1000):
+    """
+    Print the time per puzzle of both approaches.
+
+    Parameters
+    ----------
+    n_puzzles : int, optional
+        Number of puzzles per batch. Default is 1000.
+    """
+    header = '{:<8} {:>12} {:>12} {:>12}'
+    row = '{:<8} {:>9.3f} ms {:>9.3f} ms {:>9.3f} ms'
+    print(header.format('puzzle', 'one by one', 'batch', 'parallel'))
+    for name in ('easy', 'medium'):
+        puzzles = _relabelled(PUZZLES[name], n_puzzles)
+
+        start = time.perf_counter()
+        for puzzle in puzzles:
+            HB6DBoard.from_array(puzzle).solve()
+        t_single = (time.perf_counter() - start) / n_puzzles
+
+        start = time.perf_counter()
+        solve_many(puzzles)
+        t_batch = (time.perf_counter() - start) / n_puzzles
+
+        start = time.perf_counter()
+        for _ in solve_parallel(puzzles, chunk_size=100):
+            pass
+        t_parallel = (time.perf_counter() - start) / n_puzzles
+
+        print(row.format(
+            name, 1e3 * t_single, 1e3 * t_batch, 1e3 * t_parallel,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare the branching policies of `HB6DBoard.solve()`.
+
+Run as `python -m pZudoku.benchmarks.branching`.
+"""
+import time
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.hb6d_board import HB6DBoard
+from pZudoku.stats import SolveStats
+
+
+def _solve(squares, branching):
+    """
+    Solve the given puzzle. Return the wall time in seconds and the number of
+    search nodes.
+    """
+    board = HB6DBoard.from_array(squares)
+    stats = SolveStats()
+    start = time.perf_counter()
+    board.solve(branching=branching, stats=stats)
+    return time.perf_counter() - start, stats.nodes
+
+
+def main():
+    """
+    Print the wall time and the number of search nodes per puzzle for every
+    branching policy.
+    """
+    header = '{:<8} {:<6} {:>12} {:>8}'
+    row = '{:<8} {:<6} {:>9.1f} ms {:>8}'
+    print(header.format('puzzle', 'policy', 'time', 'nodes'))
+    for name, squares in PUZZLES.items():
+        for branching in ('first', 'mrv'):
+            wall_time, n_nodes = _solve(squares, branching)
+            print(row.format(name, branching, 1e3 * wall_time, n_nodes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Measure the throughput of the puzzle generator, per target number of clues.
+
+Run as `python -m pZudoku.benchmarks.generator`.
+"""
+import time
+
+from pZudoku.generator import generate_many
+
+
+# Target numbers of clues to compare, None for minimal puzzles
+_TARGETS = (36, 30, 25, None)
+
+
+def main(number=100):
+    """
+    Print the number of puzzles generated per minute and their average
+    number of clues for every target.
+    """
+    header = '{:<8} {:>16} {:>8}'
+    row = '{:<8} {:>16.0f} {:>8.1f}'
+    print(header.format('target', 'puzzles/minute', 'clues'))
+    for n_clues in _TARGETS:
+        start = time.perf_counter()
+        puzzles = list(generate_many(number, n_clues, seed=0))
+        wall_time = time.perf_counter() - start
+        clues = sum((puzzle > 0).sum() for puzzle in puzzles) / number
+        print(row.format(
+            'minimal' if n_clues is None else n_clues,
+            60 * number / wall_time, clues,
+        ))
+
+
+if __name__ == '__main__':
+    main()
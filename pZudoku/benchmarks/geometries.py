@@ -0,0 +1,72 @@
+"""
+Compare the solving time of HB6DBoard for every box geometry.
+
+Run as `python -m pZudoku.benchmarks.geometries`.
+"""
+import timeit
+
+import numpy as np
+
+from pZudoku.hb6d_board import HB6DBoard, _make_shape, _peers
+
+
+# Box shapes to benchmark, from 4-by-4 to 25-by-25 boards
+GEOMETRIES = ((2, 2), (2, 3), (3, 3), (3, 4), (4, 4), (5, 5))
+
+# Fraction of the squares of a solved grid to empty for every puzzle
+_EMPTY_FRACTION = 0.45
+
+
+def _make_puzzle(box_shape, seed):
+    """
+    Return a reproducible puzzle with boxes of the given shape, made by
+    emptying squares of a relabelled pattern grid.
+    """
+    box_rows, box_cols = box_shape
+    size = box_rows * box_cols
+    rng = np.random.RandomState(seed)
+    _rows, _cols = np.indices((size, size))
+    solution = ((_rows % box_rows) * box_cols + _rows // box_rows + _cols)
+    solution = rng.permutation(size)[solution % size] + 1
+    return np.where(rng.rand(size, size) < _EMPTY_FRACTION, 0, solution)
+
+
+def _time_per_solve(puzzles, box_shape, algorithm):
+    """
+    Return the mean time in seconds of solving one of the given puzzles.
+    """
+    def run():
+        for puzzle in puzzles:
+            board = HB6DBoard.from_array(puzzle, box_shape)
+            board.solve(algorithm=algorithm)
+
+    return timeit.timeit(run, number=1) / len(puzzles)
+
+
+def main(number=5):
+    """
+    Print the time per puzzle of every geometry and algorithm.
+
+    Parameters
+    ----------
+    number : int, optional
+        Number of puzzles per geometry. Default is 5.
+    """
+    header = '{:<6} {:>7} {:>12} {:>12}'
+    row = '{:<6} {:>7} {:>9.1f} ms {:>9.1f} ms'
+    print(header.format('box', 'board', 'search', 'dlx'))
+    for box_shape in GEOMETRIES:
+        puzzles = [_make_puzzle(box_shape, seed) for seed in range(number)]
+        size = box_shape[0] * box_shape[1]
+        # Build the cached index tables of the geometry beforehand
+        _peers(_make_shape(box_shape))
+        t_search = _time_per_solve(puzzles, box_shape, 'search')
+        t_dlx = _time_per_solve(puzzles, box_shape, 'dlx')
+        print(row.format(
+            '{}x{}'.format(*box_shape), '{0}x{0}'.format(size),
+            1e3 * t_search, 1e3 * t_dlx,
+        ))
+
+
+if __name__ == '__main__':
+    main()
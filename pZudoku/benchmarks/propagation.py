@@ -0,0 +1,52 @@
+"""
+Compare the propagation levels of `HB6DBoard.solve()`: stronger levels visit
+fewer nodes, but spend more time per node.
+
+Run as `python -m pZudoku.benchmarks.propagation`.
+"""
+import time
+
+from pZudoku.benchmarks.tiers import make_tier
+from pZudoku.hb6d_board import HB6DBoard, _PROPAGATION_LEVELS
+from pZudoku.stats import SolveStats
+
+
+# Difficulty tiers to compare the propagation levels on, and the number of
+# puzzles of each
+_TIERS = (('medium', 10), ('hard', 10), ('pathological', 6), ('17-clue', 8))
+
+
+def _solve(puzzles, propagation):
+    """
+    Solve the given puzzles. Return the wall time in seconds and the
+    statistics of the search.
+    """
+    stats = SolveStats()
+    start = time.perf_counter()
+    for squares in puzzles:
+        HB6DBoard.from_array(squares).solve(
+            stats=stats, propagation=propagation
+        )
+    return time.perf_counter() - start, stats
+
+
+def main():
+    """
+    Print the wall time, the number of search nodes and the number of
+    eliminations per tier for every propagation level.
+    """
+    header = '{:<13} {:<8} {:>12} {:>8} {:>12}'
+    row = '{:<13} {:<8} {:>9.1f} ms {:>8} {:>12}'
+    print(header.format('tier', 'level', 'time', 'nodes', 'eliminations'))
+    for tier, number in _TIERS:
+        puzzles = make_tier(tier, number)
+        for propagation in _PROPAGATION_LEVELS:
+            wall_time, stats = _solve(puzzles, propagation)
+            print(row.format(
+                tier, propagation, 1e3 * wall_time, stats.nodes,
+                stats.eliminations,
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Puzzles shared by the benchmarks and the tests.
+"""
+
+
+PUZZLES = {
+    # Solved completely by quick filling
+    'easy': [
+        [0, 0, 3, 0, 2, 0, 6, 0, 0],
+        [9, 0, 0, 3, 0, 5, 0, 0, 1],
+        [0, 0, 1, 8, 0, 6, 4, 0, 0],
+        [0, 0, 8, 1, 0, 2, 9, 0, 0],
+        [7, 0, 0, 0, 0, 0, 0, 0, 8],
+        [0, 0, 6, 7, 0, 8, 2, 0, 0],
+        [0, 0, 2, 6, 0, 9, 5, 0, 0],
+        [8, 0, 0, 2, 0, 3, 0, 0, 9],
+        [0, 0, 5, 0, 1, 0, 3, 0, 0],
+    ],
+    # Partially filled in by quick filling
+    'medium': [
+        [0, 8, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 3, 0, 0, 9, 0, 7],
+        [0, 7, 6, 0, 2, 0, 3, 0, 0],
+        [0, 0, 0, 0, 7, 0, 0, 3, 0],
+        [0, 0, 1, 2, 0, 5, 4, 0, 0],
+        [0, 9, 0, 0, 4, 0, 0, 0, 0],
+        [0, 0, 5, 0, 6, 0, 2, 9, 0],
+        [6, 0, 4, 0, 0, 1, 0, 0, 0],
+        [0, 0, 0, 0, 0, 0, 0, 5, 0],
+    ],
+    # Hardly changed by quick filling
+    'hard': [
+        [4, 0, 0, 0, 0, 0, 8, 0, 5],
+        [0, 3, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 0, 7, 0, 0, 0, 0, 0],
+        [0, 2, 0, 0, 0, 0, 0, 6, 0],
+        [0, 0, 0, 0, 8, 0, 4, 0, 0],
+        [0, 0, 0, 0, 1, 0, 0, 0, 0],
+        [0, 0, 0, 6, 0, 3, 0, 7, 0],
+        [5, 0, 0, 2, 0, 0, 0, 0, 0],
+        [1, 0, 4, 0, 0, 0, 0, 0, 0],
+    ],
+    # One of the hardest known puzzles for backtracking solvers
+    'hardest': [
+        [8, 0, 0, 0, 0, 0, 0, 0, 0],
+        [0, 0, 3, 6, 0, 0, 0, 0, 0],
+        [0, 7, 0, 0, 9, 0, 2, 0, 0],
+        [0, 5, 0, 0, 0, 7, 0, 0, 0],
+        [0, 0, 0, 0, 4, 5, 7, 0, 0],
+        [0, 0, 0, 1, 0, 0, 0, 3, 0],
+        [0, 0, 1, 0, 0, 0, 0, 6, 8],
+        [0, 0, 8, 5, 0, 0, 0, 1, 0],
+        [0, 9, 0, 0, 0, 0, 4, 0, 0],
+    ],
+}
+
+# Consistent givens without a solution, which quick filling and
+# `HB6DBoard._check_consistency()` don't find out: both candidates of the
+# empty square (2, 8), 4 and 9, lead to a clash
+NO_SOLUTION_PUZZLE = [
+    [4, 1, 7, 3, 6, 9, 8, 2, 5],
+    [2, 3, 6, 1, 5, 8, 7, 0, 0],
+    [0, 5, 0, 7, 2, 4, 0, 1, 0],
+    [0, 2, 5, 4, 3, 7, 1, 6, 0],
+    [0, 0, 1, 0, 8, 0, 4, 0, 0],
+    [0, 4, 0, 0, 1, 0, 0, 0, 0],
+    [0, 0, 2, 6, 4, 3, 5, 7, 1],
+    [5, 0, 3, 2, 0, 1, 0, 0, 0],
+    [1, 0, 4, 8, 0, 5, 0, 0, 0],
+]
@@ -0,0 +1,107 @@
+"""
+Compare the vectorised `_quick_fill()` with the original, loop-based
+implementation, `quick_fill_sequential()`.
+
+Run as `python -m pZudoku.benchmarks.quick_fill`.
+"""
+import timeit
+
+import numpy as np
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.hb6d_board import HB6DBoard, _CONSTRAINT_AXES, _kept_axes
+
+
+def quick_fill_sequential(board):
+    """
+    Fill in some squares of the given board by applying four simple
+    techniques one square at a time.
+
+    This is the original implementation of `HB6DBoard._quick_fill()`, kept
+    as the baseline of this benchmark and as a reference for the tests. It
+    reaches the same fixpoint as the vectorised version on consistent
+    boards, but much more slowly.
+
+    Parameters
+    ----------
+    board : HB6DBoard
+        Board to fill in, in-place.
+    """
+
+    # Dimensions of the four coordinates fixed by each type of constraint
+    square_shape, numrow_shape, numcol_shape, numbox_shape = (
+        tuple(board._shape[axis] for axis in _kept_axes(axes))
+        for axes in _CONSTRAINT_AXES
+    )
+
+    # Repeat until there are definitely no more insertions
+    n_candidates = None
+    while n_candidates != np.count_nonzero(board._cells):
+        n_candidates = np.count_nonzero(board._cells)
+
+        for _linear_idx in range(np.prod(board._shape[:4])):
+
+            # Inspect a single square
+            _p, _q, _r, _s = np.unravel_index(_linear_idx, square_shape)
+            x, y = board._cells[:, :, _p, _q, _r, _s].nonzero()
+            if len(x) == 1:
+                board._put((x[0], y[0], _p, _q, _r, _s))
+
+            # Inspect a number in a single row
+            _p, _q, _r, _s = np.unravel_index(_linear_idx, numrow_shape)
+            x, y = board._cells[_p, _q, _r, _s, :, :].nonzero()
+            if len(x) == 1:
+                board._put((_p, _q, _r, _s, x[0], y[0]))
+
+            # Inspect a number in a single column
+            _p, _q, _r, _s = np.unravel_index(_linear_idx, numcol_shape)
+            x, y = board._cells[_p, _q, :, :, _r, _s].nonzero()
+            if len(x) == 1:
+                board._put((_p, _q, x[0], y[0], _r, _s))
+
+            # Inspect a number in a single box
+            _p, _q, _r, _s = np.unravel_index(_linear_idx, numbox_shape)
+            x, y = board._cells[_p, _q, _r, :, _s, :].nonzero()
+            if len(x) == 1:
+                board._put((_p, _q, _r, x[0], _s, y[0]))
+
+
+def _time_per_call(board, quick_fill, number):
+    """
+    Return the mean time in seconds of calling the given quick filling
+    function on a fresh copy of the given board.
+    """
+    def run():
+        copied_board = HB6DBoard()
+        copied_board._cells = board._cells.copy()
+        quick_fill(copied_board)
+
+    return timeit.timeit(run, number=number) / number
+
+
+def main(number=20):
+    """
+    Print the time per puzzle of both quick filling implementations.
+
+    Parameters
+    ----------
+    number : int, optional
+        Number of repetitions per puzzle. Default is 20.
+    """
+    header = '{:<8} {:>14} {:>14} {:>9}'
+    row = '{:<8} {:>11.3f} ms {:>11.3f} ms {:>8.1f}x'
+    print(header.format('puzzle', 'sequential', 'vectorised', 'speedup'))
+    for name, squares in PUZZLES.items():
+        board = HB6DBoard.from_array(squares)
+        t_sequential = _time_per_call(board, quick_fill_sequential, number)
+        t_vectorised = _time_per_call(board, HB6DBoard._quick_fill, number)
+        print(row.format(
+            name,
+            1e3 * t_sequential,
+            1e3 * t_vectorised,
+            t_sequential / t_vectorised,
+        ))
+
+
+if __name__ == '__main__':
+    main()
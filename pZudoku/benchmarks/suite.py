@@ -0,0 +1,259 @@
+"""
+Time the main operations of HB6DBoard on every difficulty tier, and report
+percentiles and throughput as JSON.
+
+Run as `python -m pZudoku.benchmarks.suite`, e.g. save a baseline with
+
+    python -m pZudoku.benchmarks.suite --output baseline.json
+
+and check a later version for regressions against it with
+
+    python -m pZudoku.benchmarks.suite --compare baseline.json
+
+which exits with status 1 if any regression is found.
+"""
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from pZudoku.benchmarks.tiers import TIERS, make_tier
+from pZudoku.hb6d_board import HB6DBoard
+
+
+OPERATIONS = (
+    'from_array', 'quick_fill', 'check_consistency', 'solve', 'str', 'repr',
+)
+
+# Percentiles of the time per puzzle to report
+PERCENTILES = (50, 90, 99)
+
+# Statistic compared with the baseline
+_COMPARED_STATISTIC = 'p50_ms'
+
+# Relative slowdown above which a statistic is a regression
+_DEFAULT_THRESHOLD = 0.2
+
+
+def _time_operations(puzzle):
+    """
+    Return the time in seconds of every operation on the given puzzle.
+
+    Every operation is timed once, on a board in the state it's meant to be
+    used in, e.g. `_check_consistency()` after `_quick_fill()`.
+    """
+    timer = time.perf_counter
+    times = {}
+
+    start = timer()
+    board = HB6DBoard.from_array(puzzle)
+    times['from_array'] = timer() - start
+
+    filled_board = copy.deepcopy(board)
+    start = timer()
+    filled_board._quick_fill()
+    times['quick_fill'] = timer() - start
+
+    start = timer()
+    filled_board._check_consistency()
+    times['check_consistency'] = timer() - start
+
+    solved_board = copy.deepcopy(board)
+    start = timer()
+    solved_board.solve()
+    times['solve'] = timer() - start
+
+    start = timer()
+    str(board)
+    times['str'] = timer() - start
+
+    start = timer()
+    repr(board)
+    times['repr'] = timer() - start
+
+    return times
+
+
+def _statistics(times):
+    """
+    Summarise the times of one operation on every puzzle of a tier.
+
+    Parameters
+    ----------
+    times : list of float
+        Time in seconds per puzzle.
+
+    Returns
+    -------
+    statistics : dict
+        Mean, minimum, maximum and percentiles of the time per puzzle in
+        milliseconds, and the number of puzzles per second.
+    """
+    times_ms = 1e3 * np.array(times)
+    statistics = {
+        'mean_ms': float(times_ms.mean()),
+        'min_ms': float(times_ms.min()),
+        'max_ms': float(times_ms.max()),
+    }
+    for percentile in PERCENTILES:
+        statistics['p{}_ms'.format(percentile)] = float(
+            np.percentile(times_ms, percentile)
+        )
+    statistics['puzzles_per_second'] = float(
+        len(times_ms) / (1e-3 * times_ms.sum())
+    )
+    return statistics
+
+
+def run(number=20, seed=0, tiers=TIERS):
+    """
+    Time every operation on every puzzle of the given tiers.
+
+    Parameters
+    ----------
+    number : int, optional
+        Number of puzzles per tier. Default is 20.
+    seed : int, optional
+        Seed of the puzzle sets. See `tiers.make_tier()`. Default is 0.
+    tiers : iterable of str, optional
+        Difficulty tiers. Default is every tier.
+
+    Returns
+    -------
+    report : dict
+        The 'meta' item describes the run and its environment, and the
+        'tiers' item maps every tier and operation to its statistics. See
+        `_statistics()`.
+    """
+    report = {
+        'meta': {
+            'number': number,
+            'seed': seed,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+        },
+        'tiers': {},
+    }
+    for tier in tiers:
+        times = {operation: [] for operation in OPERATIONS}
+        for puzzle in make_tier(tier, number, seed):
+            for operation, t in _time_operations(puzzle).items():
+                times[operation].append(t)
+        report['tiers'][tier] = {
+            operation: _statistics(times[operation])
+            for operation in OPERATIONS
+        }
+    return report
+
+
+def compare(report, baseline, threshold=_DEFAULT_THRESHOLD):
+    """
+    Find the operations that got slower than in the baseline.
+
+    Only the tiers and operations found in both reports are compared.
+
+    Parameters
+    ----------
+    report : dict
+        Report returned by `run()`.
+    baseline : dict
+        Report of an earlier run, e.g. of the last release.
+    threshold : float, optional
+        Relative slowdown of the median time per puzzle above which an
+        operation is a regression. Default is 0.2, i.e. 20% slower.
+
+    Returns
+    -------
+    regressions : list of tuple of (str, str, float, float)
+        Tier, operation, and baseline and current median time in
+        milliseconds of every regression.
+    """
+    regressions = []
+    for tier, operations in sorted(report['tiers'].items()):
+        for operation, statistics in sorted(operations.items()):
+            try:
+                old = baseline['tiers'][tier][operation][_COMPARED_STATISTIC]
+            except KeyError:
+                continue
+            new = statistics[_COMPARED_STATISTIC]
+            if new > (1 + threshold) * old:
+                regressions.append((tier, operation, old, new))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Run the benchmark suite from the command line.
+
+    Parameters
+    ----------
+    argv : list of str or None, optional
+        Command line arguments. Default is None, i.e. `sys.argv[1:]`.
+
+    Returns
+    -------
+    status : int
+        1 if regressions are found when comparing with a baseline, else 0.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m pZudoku.benchmarks.suite',
+        description="Time HB6DBoard on standard difficulty tiers.",
+    )
+    parser.add_argument(
+        '--number', type=int, default=20,
+        help="number of puzzles per tier (default: %(default)s)",
+    )
+    parser.add_argument(
+        '--seed', type=int, default=0,
+        help="seed of the puzzle sets (default: %(default)s)",
+    )
+    parser.add_argument(
+        '--tiers', nargs='+', choices=TIERS, default=TIERS,
+        help="difficulty tiers to run (default: all)",
+    )
+    parser.add_argument(
+        '--output', help="write the JSON report to this file, not stdout",
+    )
+    parser.add_argument(
+        '--compare', metavar='BASELINE',
+        help="flag regressions against this JSON report",
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=_DEFAULT_THRESHOLD,
+        help="relative slowdown of the median time that counts as a "
+             "regression (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.number, args.seed, args.tiers)
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    for tier, operation, old, new in regressions:
+        msg = "Regression: {} {}: {:.3f} ms -> {:.3f} ms ({:+.0%})"
+        print(msg.format(tier, operation, old, new, new / old - 1),
+              file=sys.stderr)
+    if regressions:
+        return 1
+    print("No regressions found.", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
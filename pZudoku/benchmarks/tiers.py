@@ -0,0 +1,123 @@
+"""
+Deterministic sets of puzzles of standard difficulty tiers.
+
+Every set is made locally from a seed, so the same seed always gives the same
+puzzles:
+
+- 'easy': solved by quick filling alone, with 36 clues.
+- 'medium': proper (i.e. with a unique solution), with 30 clues.
+- 'hard': proper and minimal, i.e. removing any clue makes it improper.
+- 'pathological': puzzles built to defeat backtracking solvers.
+- '17-clue': proper puzzles with 17 clues, the fewest possible.
+
+The first three tiers are made with the `generator` module. The 17-clue tier
+is made by shuffling known puzzles with transformations that keep the
+solution unique, e.g. relabelling the numbers. The pathological puzzles are
+used as they are, in turn, since the same transformations would undo what
+makes them hard for a solver trying the squares and the numbers in order.
+"""
+import numpy as np
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.generator import generate, shuffle
+from pZudoku.hb6d_board import HB6DBoard
+
+
+TIERS = ('easy', 'medium', 'hard', 'pathological', '17-clue')
+
+# Number of clues of the easy and the medium puzzles
+_EASY_CLUES = 36
+_MEDIUM_CLUES = 30
+
+# Proper puzzles with 17 clues, in row-major order, with zeros for empty
+# squares
+_SEVENTEEN_CLUE_PUZZLES = (
+    '000000010400000000020000000000050407008000300001090000300400200'
+    '050100000000806000',
+    '000000000000003085001020000000507000004000100090000000500000073'
+    '002010000000040009',
+    '000000012000035000000600070700000300000400800100000000000120000'
+    '080000040050000600',
+    '000000012003600000000007000410020000000500300700000600280000040'
+    '000300500000000000',
+)
+
+# Puzzles that take backtracking solvers the longest
+_PATHOLOGICAL_PUZZLES = (
+    PUZZLES['hardest'],
+    PUZZLES['hard'],
+    # The first row of its solution is 987654321, and is empty in the puzzle:
+    # the worst case for trying the numbers of the squares in order
+    _SEVENTEEN_CLUE_PUZZLES[1],
+)
+
+
+def _to_grid(puzzle):
+    """
+    Convert a puzzle given as a string or as a list of lists to an array.
+    """
+    if isinstance(puzzle, str):
+        return np.array([int(char) for char in puzzle]).reshape(9, 9)
+    return np.array(puzzle)
+
+
+def _is_easy(puzzle):
+    """
+    Return whether quick filling alone solves the given puzzle.
+    """
+    board = HB6DBoard.from_array(puzzle)
+    board._quick_fill()
+    return board._cells.sum() == 81
+
+
+def make_tier(tier, number, seed=0):
+    """
+    Generate the puzzles of the given difficulty tier.
+
+    Parameters
+    ----------
+    tier : {'easy', 'medium', 'hard', 'pathological', '17-clue'}
+        Difficulty tier, see the module docstring.
+    number : int
+        Number of puzzles.
+    seed : int, optional
+        Seed of the random number generator. Default is 0.
+
+    Returns
+    -------
+    puzzles : list of numpy.ndarray of int and of shape (9, 9)
+        Nine-by-nine array of fill values for each square of each puzzle,
+        with zeros for empty squares.
+
+    Raises
+    ------
+    ValueError
+        If the tier is unknown.
+    """
+    if tier not in TIERS:
+        msg = "Unknown tier: {!r}."
+        raise ValueError(msg.format(tier))
+
+    rng = np.random.RandomState([seed, TIERS.index(tier)])
+    puzzles = []
+    for n in range(number):
+        if tier == 'pathological':
+            puzzles.append(_to_grid(
+                _PATHOLOGICAL_PUZZLES[n % len(_PATHOLOGICAL_PUZZLES)]
+            ))
+        elif tier == '17-clue':
+            puzzle = _to_grid(
+                _SEVENTEEN_CLUE_PUZZLES[n % len(_SEVENTEEN_CLUE_PUZZLES)]
+            )
+            puzzles.append(shuffle(puzzle, rng))
+        elif tier == 'easy':
+            # Most proper puzzles with this many clues are easy already
+            puzzle = generate(_EASY_CLUES, seed=rng)
+            while not _is_easy(puzzle):
+                puzzle = generate(_EASY_CLUES, seed=rng)
+            puzzles.append(puzzle)
+        elif tier == 'medium':
+            puzzles.append(generate(_MEDIUM_CLUES, seed=rng))
+        else:
+            puzzles.append(generate(seed=rng))
+    return puzzles
@@ -0,0 +1,335 @@
+from pZudoku.hb6d_board import (
+    ConsistencyError,
+    _NO_CANDIDATE_STR,
+    _STR_HORIZONTAL_SEP_MEDIUM,
+    _STR_HORIZONTAL_SEP_SMALL,
+    _STR_VERTICAL_SEP_SMALL,
+    _STR_VERTICAL_SQUARE_MEDIUM,
+)
+
+
+# Bit mask with every candidate set
+_ALL = 0b111111111
+
+# Number of set bits of every 9-bit mask
+_POPCOUNT = [bin(_mask).count('1') for _mask in range(_ALL + 1)]
+
+# Squares of every row, column and box
+# Squares are indexed linearly, in row-major order
+_ROWS = [[9 * _row + _col for _col in range(9)] for _row in range(9)]
+_COLS = [[9 * _row + _col for _row in range(9)] for _col in range(9)]
+_BOXES = [
+    [
+        9 * (3 * _boxrow + _subrow) + 3 * _boxcol + _subcol
+        for _subrow in range(3)
+        for _subcol in range(3)
+    ]
+    for _boxrow in range(3)
+    for _boxcol in range(3)
+]
+
+# Squares of every unit: nine rows, nine columns, then nine boxes
+_UNITS = _ROWS + _COLS + _BOXES
+
+# Units of every square: its row, its column, and its box
+_SQUARE_UNITS = [
+    [_unit for _unit, _squares in enumerate(_UNITS) if _square in _squares]
+    for _square in range(81)
+]
+
+# Peers of every square, i.e. the other squares sharing a unit with it
+_PEERS = [
+    sorted(
+        set(
+            _peer
+            for _unit in _SQUARE_UNITS[_square]
+            for _peer in _UNITS[_unit]
+        ) - {_square}
+    )
+    for _square in range(81)
+]
+
+
+class BitmaskBoard(object):
+    """
+    Data structure for storing and solving a sudoku board, using a 9-bit
+    candidate mask per square.
+
+    Bit ``d - 1`` of the mask of a square is set if number ``d`` is a
+    candidate in it. This is a drop-in alternative to HB6DBoard that avoids
+    the per-call overhead of NumPy on the small operations of the search.
+    """
+
+    def __init__(self):
+        # Candidate mask of every square, in row-major order
+        self._cells = [_ALL] * 81
+        # Mask of the numbers inserted into every unit
+        self._placed = [0] * len(_UNITS)
+
+    def _put(self, _square, bit):
+        """
+        Insert a number into the given square.
+
+        Parameters
+        ----------
+        _square : int between 0 and 80 inclusive
+            Linear index of the square. Zero-based.
+        bit : int
+            Mask with only the bit of the number to insert set.
+
+        Raises
+        ------
+        ValueError
+            If the number is not a candidate in the given square.
+        """
+        _cells = self._cells
+        if not _cells[_square] & bit:
+            msg = "Number {} is not a candidate in square ({}, {})."
+            _row, _col = divmod(_square, 9)
+            raise ValueError(msg.format(bit.bit_length() - 1, _row, _col))
+
+        _cells[_square] = bit
+        for _unit in _SQUARE_UNITS[_square]:
+            self._placed[_unit] |= bit
+        not_bit = ~bit
+        for _peer in _PEERS[_square]:
+            _cells[_peer] &= not_bit
+
+    @classmethod
+    def from_array(cls, array):
+        """
+        Create a BitmaskBoard instance from the given 2-D array.
+
+        Parameters
+        ----------
+        array : numpy.ndarray of int or None and of shape (9, 9)
+            Nine-by-nine array of fill values for each square. None values
+            correspond to empty squares.
+
+            Candidate numbers are one-based (i.e. 1 to 9).
+
+        Raises
+        ------
+        ConsistencyError
+            If the given 2-D array is inconsistent.
+
+            Note: this function is not guaranteed to raise for every invalid
+            sudoku board.
+        """
+        obj = cls()
+
+        for _row, row in enumerate(array):
+            for _col, number in enumerate(row):
+                if number in range(1, 10):
+                    try:
+                        obj._put(9 * _row + _col, 1 << (int(number) - 1))
+                    except ValueError:
+                        msg = "Clash found during instantiation: {} ({}, {})."
+                        raise ConsistencyError(
+                            msg.format(number, _row + 1, _col + 1)
+                        )
+
+        return obj
+
+    def candidates(self, row, column):
+        """
+        Valid candidate numbers in the given square in increasing order.
+
+        Parameters
+        ----------
+        row : int between 1 and 9
+        column : int between 1 and 9
+
+        Returns
+        -------
+        numbers : list of int
+            Numbers that are valid candidates in the given square. One-based.
+        """
+        mask = self._cells[9 * (row - 1) + column - 1]
+        return [number for number in range(1, 10) if mask >> (number - 1) & 1]
+
+    def __str__(self):
+        result = ''
+
+        for _row in range(9):
+            for _col in range(9):
+                mask = self._cells[9 * _row + _col]
+                if _POPCOUNT[mask] == 1:
+                    result += str(mask.bit_length())
+                else:
+                    result += _NO_CANDIDATE_STR
+
+                # Append a vertical separator if this is not the last column
+                if _col in (2, 5):
+                    result += _STR_VERTICAL_SQUARE_MEDIUM
+                elif _col != 8:
+                    result += _STR_VERTICAL_SEP_SMALL
+
+            # Append a horizontal separator if this is not the last row
+            if _row in (2, 5):
+                result += _STR_HORIZONTAL_SEP_MEDIUM
+            elif _row != 8:
+                result += _STR_HORIZONTAL_SEP_SMALL
+
+        # Append a newline to the end
+        result += '\n'
+
+        return result
+
+    def insert(self, number, row, column):
+        """
+        Insert a number into the given square.
+
+        Parameters
+        ----------
+        number : int between 1 and 9 (inclusive)
+        row : int between 1 and 9 (inclusive)
+        column : int between 1 and 9 (inclusive)
+
+        Raises
+        ------
+        ValueError
+            If the number is not a condidate in the given square.
+        """
+        try:
+            self._put(9 * (row - 1) + column - 1, 1 << (number - 1))
+        except ValueError:
+            msg = "Number {} is not a valid candidate in square ({}, {})."
+            raise ValueError(msg.format(number, row, column))
+
+    def _quick_fill(self):
+        """
+        Fill in some squares by repeatedly applying "hidden single" for rows,
+        columns and boxes, and "unique candidate", until neither of them
+        results in new insertions.
+
+        Raises
+        ------
+        ConsistencyError
+            If a square without candidates, or a number without a valid place
+            in a unit, is found.
+        """
+        _cells = self._cells
+        _placed = self._placed
+
+        changed = True
+        while changed:
+            changed = False
+
+            # Unique candidates
+            for _square in range(81):
+                mask = _cells[_square]
+                if not mask:
+                    msg = "Inconsistency found at _row {} and _col {}."
+                    raise ConsistencyError(msg.format(*divmod(_square, 9)))
+                single = not mask & (mask - 1)
+                if single and not mask & _placed[_SQUARE_UNITS[_square][0]]:
+                    self._put(_square, mask)
+                    changed = True
+
+            # Hidden singles
+            for _unit, _squares in enumerate(_UNITS):
+                # Numbers that are candidates at least once, and at least
+                # twice in this unit
+                once = twice = 0
+                for _square in _squares:
+                    mask = _cells[_square]
+                    twice |= once & mask
+                    once |= mask
+                if once != _ALL:
+                    msg = "Inconsistency found for _num mask {} in _unit {}."
+                    raise ConsistencyError(msg.format(_ALL & ~once, _unit))
+
+                hidden = once & ~twice & ~_placed[_unit]
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for _square in _squares:
+                        if _cells[_square] & bit:
+                            break
+                    else:
+                        # Another hidden single took the only place
+                        msg = "Inconsistency found for _num {} in _unit {}."
+                        raise ConsistencyError(
+                            msg.format(bit.bit_length() - 1, _unit)
+                        )
+                    self._put(_square, bit)
+                    changed = True
+
+    def _fewest_candidates_square(self):
+        """
+        Find the square with the fewest (but more than one) candidates.
+
+        Returns
+        -------
+        _square : int between 0 and 80 inclusive, or None
+            Linear index of the square found, or None if every square has at
+            most one candidate.
+        """
+        _cells = self._cells
+        best_square = None
+        best_count = 10
+        for _square in range(81):
+            count = _POPCOUNT[_cells[_square]]
+            if 1 < count < best_count:
+                best_square = _square
+                best_count = count
+                if count == 2:
+                    break
+        return best_square
+
+    def _recursive_solve(self):
+        """
+        Solve completely this board, in-place.
+
+        Raises
+        ------
+        ConsistencyError
+            If a clash is found during the solution.
+        """
+
+        # Fill in some easy squares, raise if an inconsistency is found
+        self._quick_fill()
+
+        # Find the square to branch on
+        _square = self._fewest_candidates_square()
+        if _square is None:
+            # Every square has exactly one candidate, so (one of) the
+            # solution(s) is found
+            return
+
+        # Try a different valid candidate on each iteration
+        _cells = self._cells[:]
+        _placed = self._placed[:]
+        mask = _cells[_square]
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+
+            self._put(_square, bit)
+            try:
+                self._recursive_solve()
+            except ConsistencyError:
+                # Clash found with this candidate, so restore the board
+                self._cells = _cells[:]
+                self._placed = _placed[:]
+                continue
+            return
+
+        # No candidate results in a valid solution
+        raise ConsistencyError('No solution found.')
+
+    def solve(self):
+        """
+        Fill in this board with a solution.
+
+        Raises
+        ------
+        ConsistencyError
+            If a clash is found during the solution.
+        """
+        try:
+            self._recursive_solve()
+        except ConsistencyError:
+            msg = "No solution found."
+            raise ConsistencyError(msg)
@@ -0,0 +1,135 @@
+"""
+Bounded in-memory cache of the outcomes of `HB6DBoard.solve()`, for
+workloads that solve the same puzzles over and over.
+"""
+import collections
+import threading
+
+
+# Default maximum number of outcomes kept by a SolutionCache
+_DEFAULT_MAXSIZE = 1024
+
+
+class SolutionCache(object):
+    """
+    Least-recently-used cache of solve outcomes, safe to share between
+    threads.
+
+    Pass it to `HB6DBoard.solve()` to look the board up before solving it.
+    Boards are keyed on their packed candidates, box shape and the solve
+    options that can change the outcome, and both solutions and
+    `ConsistencyError` outcomes are cached, so a cached answer leaves the
+    board exactly as a fresh solve would.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of outcomes to keep. When it's reached, the least
+        recently used outcome is evicted. Default is 1024.
+
+    Attributes
+    ----------
+    maxsize : int
+    hits : int
+        Number of lookups that found an outcome.
+    misses : int
+        Number of lookups that didn't.
+    evictions : int
+        Number of outcomes evicted to make room for new ones.
+
+    Raises
+    ------
+    ValueError
+        If `maxsize` isn't positive.
+    """
+
+    def __init__(self, maxsize=_DEFAULT_MAXSIZE):
+        if maxsize < 1:
+            msg = "Maximum size must be positive, not {}."
+            raise ValueError(msg.format(maxsize))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._outcomes = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._outcomes)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._outcomes
+
+    def get(self, key):
+        """
+        Look up an outcome, and mark it as the most recently used one.
+
+        Parameters
+        ----------
+        key : hashable
+
+        Returns
+        -------
+        outcome : object or None
+            The outcome stored under `key`, or None if there's none.
+        """
+        with self._lock:
+            try:
+                outcome = self._outcomes[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._outcomes.move_to_end(key)
+            self.hits += 1
+            return outcome
+
+    def put(self, key, outcome):
+        """
+        Store an outcome, evicting the least recently used ones if the cache
+        is full.
+
+        Parameters
+        ----------
+        key : hashable
+        outcome : object
+            Anything but None.
+        """
+        with self._lock:
+            self._outcomes[key] = outcome
+            self._outcomes.move_to_end(key)
+            while len(self._outcomes) > self.maxsize:
+                self._outcomes.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every outcome, and reset the counters.
+        """
+        with self._lock:
+            self._outcomes.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """
+        Return the counters and the size of this cache.
+
+        Returns
+        -------
+        info : dict
+            'hits', 'misses', 'evictions', 'size' and 'maxsize'.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._outcomes),
+                'maxsize': self.maxsize,
+            }
+
+    def __repr__(self):
+        return '{}(maxsize={})'.format(type(self).__name__, self.maxsize)
@@ -0,0 +1,409 @@
+"""
+Canonical forms of nine-by-nine sudoku grids under the symmetries of the
+game, for recognising the same puzzle in disguise.
+
+These transformations keep a grid valid, and map its solutions to the
+solutions of the transformed grid:
+
+- relabelling the numbers,
+- permuting the bands (groups of three rows), and the rows within them,
+- permuting the stacks (groups of three columns), and the columns within
+  them,
+- transposing the grid.
+
+The canonical form of a grid is the lexicographically smallest grid (in
+row-major order, with zeros for empty squares) that it can be transformed
+into. Two grids have the same canonical form if and only if one can be
+transformed into the other.
+"""
+import hashlib
+import itertools
+
+import numpy as np
+
+
+# Every permutation of the columns that keeps the stacks together, i.e. the
+# permutations of the stacks and of the columns within every stack
+_COLUMN_PERMUTATIONS = np.array([
+    [3 * stack + col for stack, cols in zip(stacks, within) for col in cols]
+    for stacks in itertools.permutations(range(3))
+    for within in itertools.product(itertools.permutations(range(3)),
+                                    repeat=3)
+], dtype=np.intp)
+
+# Band of every row (or stack of every column)
+_BANDS = np.arange(9) // 3
+
+# Weights of the squares of a row when comparing rows as integers, i.e. the
+# row read as a decimal number
+_ROW_WEIGHTS = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+# Label of the numbers not labelled yet
+_UNLABELLED = -1
+
+# Number of search states per grid above which the states bound to give the
+# same rows are merged, since finding them costs more than it saves for few
+# states
+_PRUNING_THRESHOLD = 64
+
+# Default number of grids to search at once by `canonical_forms()`. Every
+# grid takes about 1 MB at the start of the search.
+_DEFAULT_CHUNK_SIZE = 16
+
+
+class Transform(object):
+    """
+    Transformation of a nine-by-nine grid that keeps it valid.
+
+    The transformed grid is ``labels[grid.T if transpose else grid][rows]``
+    with its columns permuted by `cols`.
+
+    Attributes
+    ----------
+    transpose : bool
+        Whether the grid is transposed first.
+    rows : numpy.ndarray of int and of shape (9,)
+        Row of the (transposed) grid of every row of the transformed grid.
+    cols : numpy.ndarray of int and of shape (9,)
+        Column of the (transposed) grid of every column of the transformed
+        grid.
+    labels : numpy.ndarray of int and of shape (10,)
+        New label of every number, and 0 for empty squares.
+    """
+
+    def __init__(self, transpose, rows, cols, labels):
+        self.transpose = bool(transpose)
+        self.rows = np.asarray(rows, dtype=int)
+        self.cols = np.asarray(cols, dtype=int)
+        self.labels = np.asarray(labels, dtype=int)
+
+    def apply(self, grid):
+        """
+        Transform the given grid, e.g. a puzzle to its canonical form.
+
+        Parameters
+        ----------
+        grid : array_like of int and of shape (9, 9)
+            Numbers of each square, with zeros for empty squares.
+
+        Returns
+        -------
+        grid : numpy.ndarray of int and of shape (9, 9)
+        """
+        grid = np.asarray(grid)
+        if self.transpose:
+            grid = grid.T
+        return self.labels[grid[self.rows][:, self.cols]]
+
+    def invert(self, grid):
+        """
+        Undo the transformation of the given grid, e.g. to map the solution
+        of a canonical puzzle back to the solution of the original one.
+
+        Parameters
+        ----------
+        grid : array_like of int and of shape (9, 9)
+            Numbers of each square, with zeros for empty squares.
+
+        Returns
+        -------
+        grid : numpy.ndarray of int and of shape (9, 9)
+        """
+        original = np.zeros((9, 9), dtype=int)
+        original[np.ix_(self.rows, self.cols)] = np.argsort(self.labels)[
+            np.asarray(grid)
+        ]
+        if self.transpose:
+            original = original.T
+        return original
+
+    def __repr__(self):
+        return (
+            'Transform(transpose={!r}, rows={!r}, cols={!r}, labels={!r})'
+        ).format(
+            self.transpose, self.rows.tolist(), self.cols.tolist(),
+            self.labels.tolist(),
+        )
+
+
+def _to_grids(grids):
+    """
+    Convert a stack of grids, like the ones given to `HB6DBoard.from_array`,
+    to an array with zeros for empty squares.
+
+    Raises
+    ------
+    ValueError
+        If the grids aren't nine-by-nine.
+    """
+    grids = np.asarray(grids)
+    if grids.dtype == object:
+        grids = np.where(np.equal(grids, None), 0, grids)
+    grids = grids.astype(int)
+    if grids.shape[1:] != (9, 9):
+        msg = "Expected nine-by-nine grids, got shape {!r}."
+        raise ValueError(msg.format(grids.shape[1:]))
+    return np.where((grids >= 1) & (grids <= 9), grids, 0)
+
+
+def _group_minima(groups, keys):
+    """
+    Return whether every key is the smallest one of its group. Groups must
+    be sorted.
+    """
+    starts = np.r_[True, groups[1:] != groups[:-1]]
+    minima = np.minimum.reduceat(keys, np.flatnonzero(starts))
+    return keys == minima[np.cumsum(starts) - 1]
+
+
+def _distinct_futures(sources, grid, transpose, perm, rows, labels):
+    """
+    Return the indices of the search states to keep, one per group of states
+    bound to give the same rows from now on, e.g. the column permutations of
+    a grid that are the same on its filled squares. Without this, sparse
+    grids would keep hundreds of thousands of tied states.
+
+    States give the same rows if they are of the same grid, have the same
+    rows left, and their column permutations and labels turn these rows into
+    the same numbers. Numbers not labelled yet are compared as they are.
+    """
+    idx = np.arange(len(grid))
+    values = sources[grid, transpose][
+        idx[:, np.newaxis, np.newaxis], np.arange(9)[:, np.newaxis],
+        _COLUMN_PERMUTATIONS[perm][:, np.newaxis, :],
+    ]
+    # Array of shape (S, 9, 9), indexed by [state, row, col], of the labels
+    # of the numbers, or 10 plus the number if it isn't labelled yet, and -1
+    # in the rows already chosen
+    future = labels[idx[:, np.newaxis, np.newaxis], values]
+    future = np.where(future == _UNLABELLED, values + 10, future)
+    future[idx[:, np.newaxis], rows] = -1
+    # Compare the signatures of the states as raw bytes
+    signatures = np.ascontiguousarray(np.column_stack([
+        grid.astype(np.int32).view(np.int8).reshape(-1, 4),
+        future.reshape(len(grid), -1).astype(np.int8),
+    ]))
+    signatures = signatures.view(
+        np.dtype((np.void, signatures.shape[1]))
+    ).ravel()
+    _, first = np.unique(signatures, return_index=True)
+    return np.sort(first)
+
+
+def _search(grids):
+    """
+    Find the transformation of every grid to its canonical form.
+
+    The canonical form is built row by row. Every state of the search is a
+    grid, whether it's transposed, a column permutation, the rows chosen so
+    far, and the labels given so far (in order of first appearance, which
+    gives the smallest grid for given positions). At every step, each state
+    is extended with every row that can come next, and only the states with
+    the smallest new row are kept, for every grid at once.
+
+    Parameters
+    ----------
+    grids : numpy.ndarray of int and of shape (N, 9, 9)
+
+    Returns
+    -------
+    transforms : list of Transform
+    """
+    n_grids = len(grids)
+    n_perms = len(_COLUMN_PERMUTATIONS)
+    # Every grid and its transpose, indexed by [grid, transpose, row, col]
+    sources = np.stack([grids, grids.transpose(0, 2, 1)], axis=1)
+
+    # Start with every grid, transposed or not, and every column permutation
+    grid = np.repeat(np.arange(n_grids), 2 * n_perms)
+    transpose = np.tile(np.repeat([0, 1], n_perms), n_grids)
+    perm = np.tile(np.arange(n_perms), 2 * n_grids)
+    rows = np.zeros((len(grid), 0), dtype=np.int8)
+    labels = np.full((len(grid), 10), _UNLABELLED, dtype=np.int8)
+    labels[:, 0] = 0
+    n_labels = np.zeros(len(grid), dtype=np.int8)
+
+    for depth in range(9):
+        # Rows that can come next: the rest of the current band, or any row
+        # of a new band
+        if depth % 3:
+            valid = _BANDS == _BANDS[rows[:, [depth - 1]]]
+        else:
+            valid = ~(
+                _BANDS[:, np.newaxis] == _BANDS[rows[:, np.newaxis, ::3]]
+            ).any(axis=2)
+        valid &= ~(np.arange(9)[:, np.newaxis] == rows[:, np.newaxis]).any(
+            axis=2
+        )
+        state, row = valid.nonzero()
+        grid, transpose, perm = grid[state], transpose[state], perm[state]
+        rows = np.column_stack([rows[state], row]).astype(np.int8)
+        labels, n_labels = labels[state], n_labels[state]
+
+        # Label the numbers of the new row in order of first appearance
+        idx = np.arange(len(grid))
+        values = sources[grid, transpose, row][
+            idx[:, np.newaxis], _COLUMN_PERMUTATIONS[perm]
+        ]
+        for col in range(9):
+            number = values[:, col]
+            new = labels[idx, number] == _UNLABELLED
+            n_labels += new
+            labels[idx[new], number[new]] = n_labels[new]
+
+        # Keep the states with the smallest new row
+        keys = labels[idx[:, np.newaxis], values].astype(np.int64).dot(
+            _ROW_WEIGHTS
+        )
+        keep = np.flatnonzero(_group_minima(grid, keys))
+        if depth < 8 and len(keep) > _PRUNING_THRESHOLD * n_grids:
+            keep = keep[_distinct_futures(
+                sources, grid[keep], transpose[keep], perm[keep], rows[keep],
+                labels[keep],
+            )]
+        grid, transpose, perm = grid[keep], transpose[keep], perm[keep]
+        rows, labels, n_labels = rows[keep], labels[keep], n_labels[keep]
+
+    # Any of the states left gives the canonical form, so keep the first one
+    # of every grid
+    first = np.r_[True, grid[1:] != grid[:-1]]
+    transforms = []
+    for _transpose, _rows, _perm, _labels, _n_labels in zip(
+        transpose[first], rows[first], perm[first], labels[first],
+        n_labels[first],
+    ):
+        # Label the numbers missing from the grid too, in increasing order
+        _labels = _labels.astype(int)
+        missing = _labels == _UNLABELLED
+        _labels[missing] = _n_labels + 1 + np.arange(missing.sum())
+        transforms.append(Transform(
+            _transpose, _rows, _COLUMN_PERMUTATIONS[_perm], _labels
+        ))
+    return transforms
+
+
+def canonical_forms(grids, chunk_size=_DEFAULT_CHUNK_SIZE):
+    """
+    Find the canonical form of every given grid, in bulk.
+
+    Parameters
+    ----------
+    grids : array_like of int or None and of shape (N, 9, 9)
+        Fill values of each square of each grid. Values other than 1 to 9
+        (e.g. 0 or None) correspond to empty squares.
+    chunk_size : int, optional
+        Number of grids to search at once. Larger chunks are faster, but
+        need more memory. Default is 16.
+
+    Returns
+    -------
+    canonical_grids : numpy.ndarray of int and of shape (N, 9, 9)
+        Canonical form of every grid, with zeros for empty squares.
+    transforms : list of Transform
+        Transformation of every grid to its canonical form. Use its
+        `invert()` method to map a solution of the canonical grid back.
+
+    Raises
+    ------
+    ValueError
+        If the grids aren't nine-by-nine, or if the chunk size isn't
+        positive.
+    """
+    if chunk_size < 1:
+        msg = "Chunk size must be positive, not {}."
+        raise ValueError(msg.format(chunk_size))
+    grids = _to_grids(grids)
+
+    transforms = []
+    for start in range(0, len(grids), chunk_size):
+        transforms.extend(_search(grids[start:start + chunk_size]))
+    canonical_grids = np.array([
+        transform.apply(grid) for transform, grid in zip(transforms, grids)
+    ], dtype=int).reshape(-1, 9, 9)
+    return canonical_grids, transforms
+
+
+def canonical_form(grid):
+    """
+    Find the canonical form of the given grid.
+
+    Parameters
+    ----------
+    grid : array_like of int or None and of shape (9, 9)
+        Fill values of each square. Values other than 1 to 9 (e.g. 0 or
+        None) correspond to empty squares.
+
+    Returns
+    -------
+    canonical_grid : numpy.ndarray of int and of shape (9, 9)
+    transform : Transform
+        Transformation of the grid to its canonical form.
+
+    Raises
+    ------
+    ValueError
+        If the grid isn't nine-by-nine.
+    """
+    canonical_grids, transforms = canonical_forms([grid])
+    return canonical_grids[0], transforms[0]
+
+
+def canonical_hash(grid):
+    """
+    Return a stable hash of the canonical form of the given grid, e.g. as a
+    key of a cache of solutions.
+
+    Parameters
+    ----------
+    grid : array_like of int or None and of shape (9, 9)
+        See `canonical_form()`.
+
+    Returns
+    -------
+    digest : str
+        SHA-1 digest of the canonical form, in hexadecimal.
+    """
+    canonical_grid, _ = canonical_form(grid)
+    return hashlib.sha1(canonical_grid.astype(np.uint8).tobytes()).hexdigest()
+
+
+def deduplicate(grids, chunk_size=_DEFAULT_CHUNK_SIZE):
+    """
+    Find the distinct grids among the given ones, up to symmetry.
+
+    Solve every unique canonical grid once, and map the solution back to
+    every original grid with ``transforms[n].invert(solutions[index[n]])``.
+
+    Parameters
+    ----------
+    grids : array_like of int or None and of shape (N, 9, 9)
+        See `canonical_forms()`.
+    chunk_size : int, optional
+        See `canonical_forms()`. Default is 16.
+
+    Returns
+    -------
+    unique_grids : numpy.ndarray of int and of shape (M, 9, 9)
+        Canonical form of every distinct grid, in order of first
+        appearance.
+    index : numpy.ndarray of int and of shape (N,)
+        Index of the canonical form of every grid in `unique_grids`.
+    transforms : list of Transform
+        Transformation of every grid to its canonical form.
+    """
+    canonical_grids, transforms = canonical_forms(grids, chunk_size)
+    flat = canonical_grids.reshape(len(canonical_grids), 81)
+    if not len(flat):
+        return canonical_grids, np.zeros(0, dtype=int), transforms
+
+    _, first, index = np.unique(
+        flat, axis=0, return_index=True, return_inverse=True
+    )
+    # Sort the unique grids by first appearance
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return (
+        flat[first[order]].reshape(-1, 9, 9), rank[index.reshape(-1)],
+        transforms,
+    )
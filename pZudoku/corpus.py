@@ -0,0 +1,293 @@
+"""
+Streaming readers and writers for files of sudoku puzzles and solutions.
+
+Two plain text formats are supported, optionally gzip-compressed:
+
+- 'line': one puzzle per line, as a string of ``n * n`` characters in
+  row-major order, e.g. 81 characters for a 9-by-9 puzzle. Digits are
+  numbers, any other character (usually '.' or '0') is an empty square.
+  Anything after the first comma or whitespace is ignored.
+- 'grid': one row per line, as a string of ``n`` characters, with puzzles
+  separated by blank lines (see `tests/examples`). Spaces, '|' characters and
+  lines of '-' characters are ignored, so the output of `str(board)` can be
+  read back too.
+
+Lines starting with '#' are comments in both formats.
+"""
+import gzip
+import itertools
+
+import numpy as np
+
+
+# Number of bytes to read at once
+_BUFFER_SIZE = 1 << 20
+
+# Number of grids to encode at once
+_CHUNK_SIZE = 10000
+
+# Magic number at the start of every gzip file
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# Character written for empty squares
+_EMPTY_BYTE = b'.'
+
+# Number represented by every byte: 1 to 9 for digits, 0 otherwise
+_BYTE_TO_NUMBER = np.zeros(256, dtype=np.uint8)
+_BYTE_TO_NUMBER[ord('1'):ord('9') + 1] = np.arange(1, 10)
+
+# Byte representing every number, with zero for empty squares
+_NUMBER_TO_BYTE = np.frombuffer(_EMPTY_BYTE + b'123456789', dtype=np.uint8)
+
+# Characters ignored in the 'grid' format
+_GRID_SEPARATORS = b' |\t'
+
+# Widest row of the 'grid' format, used for telling the formats apart
+_MAX_GRID_WIDTH = 9
+
+FORMATS = ('line', 'grid')
+
+
+def _open(source, mode):
+    """
+    Open the given file in binary mode, decompressing it if needed.
+
+    Parameters
+    ----------
+    source : str or path-like
+        Path of the file. When reading, gzip files are recognised by their
+        contents. When writing, they're recognised by the '.gz' extension.
+    mode : {'rb', 'wb'}
+
+    Returns
+    -------
+    f : file object
+    """
+    if mode == 'wb':
+        if str(source).endswith('.gz'):
+            return gzip.open(source, mode)
+        return open(source, mode)
+
+    f = open(source, mode)
+    if f.read(len(_GZIP_MAGIC)) == _GZIP_MAGIC:
+        f.close()
+        return gzip.open(source, mode)
+    f.seek(0)
+    return f
+
+
+def _data_lines(f, format):
+    """
+    Read the given file in blocks. Yield lists of stripped data lines.
+
+    Comments are dropped, as are the separators and blank lines of the 'grid'
+    format.
+
+    Raises
+    ------
+    ValueError
+        If a line of the 'line' format starts with a comma.
+    """
+    # Number of lines read before the current block
+    n_lines = 0
+    while True:
+        block = f.readlines(_BUFFER_SIZE)
+        if not block:
+            return
+        if format == 'grid':
+            lines = [
+                line.translate(None, _GRID_SEPARATORS).strip()
+                for line in block
+            ]
+            lines = [
+                line for line in lines
+                if line and not line.startswith(b'#') and line.strip(b'-')
+            ]
+        else:
+            lines = [line.strip() for line in block]
+            lines = [
+                line.split(b',', 1)[0].split(None, 1)
+                if line and not line.startswith(b'#') else None
+                for line in lines
+            ]
+            if [] in lines:
+                msg = "Missing puzzle before the comma at line {}."
+                raise ValueError(msg.format(n_lines + lines.index([]) + 1))
+            lines = [line[0] for line in lines if line is not None]
+        n_lines += len(block)
+        if lines:
+            yield lines
+
+
+def _decode(lines, n_chars):
+    """
+    Decode lines of equal length into an array of numbers in bulk.
+
+    Returns
+    -------
+    numbers : numpy.ndarray of uint8 and of shape (len(lines), n_chars)
+
+    Raises
+    ------
+    ValueError
+        If a line doesn't have `n_chars` characters.
+    """
+    for line in lines:
+        if len(line) != n_chars:
+            msg = "Expected {} characters per line, got {!r}."
+            raise ValueError(msg.format(n_chars, line.decode('latin-1')))
+    buffer = np.frombuffer(b''.join(lines), dtype=np.uint8)
+    return _BYTE_TO_NUMBER[buffer].reshape(len(lines), n_chars)
+
+
+def _guess_format(f):
+    """
+    Guess the format of the given file from the length of its first line
+    that isn't blank or a comment.
+
+    Returns
+    -------
+    format : {'line', 'grid'}
+    """
+    for lines in _data_lines(f, 'grid'):
+        if len(lines[0]) > _MAX_GRID_WIDTH:
+            return 'line'
+        return 'grid'
+    return 'line'
+
+
+def _grid_blocks(blocks, size):
+    """
+    Decode the data lines of the 'grid' format. Yield arrays of puzzles.
+    """
+    leftover = []
+    for lines in blocks:
+        lines = leftover + lines
+        n_complete = len(lines) - len(lines) % size
+        leftover = lines[n_complete:]
+        if n_complete:
+            yield _decode(lines[:n_complete], size).reshape(-1, size, size)
+    if leftover:
+        msg = "Incomplete puzzle at the end of the file: {} rows of {}."
+        raise ValueError(msg.format(len(leftover), size))
+
+
+def read_grids(source, format='auto', board_class=None):
+    """
+    Lazily read the puzzles (or solutions) of the given file.
+
+    The file is read in blocks, and each block is decoded at once, so files
+    of any size are read in constant memory.
+
+    Parameters
+    ----------
+    source : str or path-like
+        Path of the file, which can be gzip-compressed.
+    format : {'auto', 'line', 'grid'}, optional
+        Format of the file, see the module docstring. 'auto' guesses it from
+        the length of the first line. Default is 'auto'.
+    board_class : type or None, optional
+        If given, e.g. HB6DBoard, yield instances created by its `from_array`
+        method instead of arrays. Default is None.
+
+    Yields
+    ------
+    grid : numpy.ndarray of int and of shape (n, n), or board_class
+        Numbers of each square, with zeros for empty squares.
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown, or if the file is malformed.
+    """
+    if format not in FORMATS + ('auto',):
+        msg = "Unknown format: {!r}."
+        raise ValueError(msg.format(format))
+
+    with _open(source, 'rb') as f:
+        if format == 'auto':
+            format = _guess_format(f)
+            f.seek(0)
+
+        blocks = _data_lines(f, format)
+        try:
+            first_block = next(blocks)
+        except StopIteration:
+            return
+        blocks = itertools.chain([first_block], blocks)
+
+        if format == 'line':
+            size = int(round(len(first_block[0]) ** 0.5))
+            grids = (
+                _decode(lines, size * size).reshape(-1, size, size)
+                for lines in blocks
+            )
+        else:
+            size = len(first_block[0])
+            grids = _grid_blocks(blocks, size)
+
+        for block in grids:
+            for grid in block.astype(int):
+                if board_class is None:
+                    yield grid
+                else:
+                    yield board_class.from_array(grid)
+
+
+def write_grids(destination, grids, format='line'):
+    """
+    Write the given puzzles (or solutions) to a file.
+
+    Parameters
+    ----------
+    destination : str or path-like
+        Path of the file. It's gzip-compressed if it ends with '.gz'.
+    grids : iterable of array_like of int and of shape (n, n)
+        Numbers of each square, with zeros (or None) for empty squares, e.g.
+        the solutions returned by `solve_many()`. It's read lazily.
+    format : {'line', 'grid'}, optional
+        Format of the file, see the module docstring. Default is 'line'.
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown, or if a number isn't between 0 and 9.
+    """
+    if format not in FORMATS:
+        msg = "Unknown format: {!r}."
+        raise ValueError(msg.format(format))
+
+    grids = iter(grids)
+    with _open(destination, 'wb') as f:
+        first = True
+        while True:
+            chunk = list(itertools.islice(grids, _CHUNK_SIZE))
+            if not chunk:
+                return
+            chunk = np.array(chunk)
+            if chunk.dtype == object:
+                chunk = np.where(np.equal(chunk, None), 0, chunk)
+            chunk = chunk.astype(int)
+            invalid = (chunk < 0) | (chunk >= len(_NUMBER_TO_BYTE))
+            if invalid.any():
+                msg = "Expected numbers between 0 and 9, got {}."
+                raise ValueError(msg.format(chunk[invalid][0]))
+            chunk = _NUMBER_TO_BYTE[chunk]
+            n_grids, size, _ = chunk.shape
+
+            newlines = np.full((n_grids, size, 1), ord('\n'), dtype=np.uint8)
+            if format == 'line':
+                lines = np.concatenate(
+                    [chunk.reshape(n_grids, -1), newlines[:, 0]], axis=-1
+                )
+                f.write(lines.tobytes())
+            else:
+                # Terminate every row, and start every puzzle but the first
+                # one with a blank line
+                rows = np.concatenate([chunk, newlines], axis=-1)
+                rows = np.concatenate(
+                    [newlines[:, 0], rows.reshape(n_grids, -1)], axis=-1
+                )
+                data = rows.tobytes()
+                f.write(data[1:] if first else data)
+            first = False
@@ -0,0 +1,179 @@
+"""
+Knuth's Algorithm X for exact cover problems, using dancing links.
+
+A sudoku board is an exact cover problem: every candidate (a cell of the
+HB6DBoard's boolean array) is a row, and every square, numrow, numcol and
+numbox is a column that must be covered by exactly one of the chosen rows.
+"""
+
+
+class DancingLinks(object):
+    """
+    Exact cover problem stored as a sparse matrix of circular doubly linked
+    lists.
+
+    Nodes are integers: 0 to n_columns - 1 are the column headers,
+    n_columns is the root, and every other node is a nonzero entry of the
+    matrix. The links are stored in plain lists indexed by node.
+    """
+
+    def __init__(self, n_columns, rows):
+        """
+        Initialise this DancingLinks object.
+
+        Parameters
+        ----------
+        n_columns : int
+            Number of columns (i.e. constraints) to cover.
+        rows : list of list of int
+            Columns covered by each row (i.e. choice). Column indices are
+            between 0 and n_columns - 1 inclusive.
+        """
+        self._root = n_columns
+        n_headers = n_columns + 1
+
+        # Column headers, linked horizontally into a circle with the root
+        self._left = [(node - 1) % n_headers for node in range(n_headers)]
+        self._right = [(node + 1) % n_headers for node in range(n_headers)]
+        self._up = list(range(n_headers))
+        self._down = list(range(n_headers))
+        self._column = list(range(n_headers))
+        self._row = [None] * n_headers
+        self._size = [0] * n_columns
+
+        left = self._left
+        right = self._right
+        up = self._up
+        down = self._down
+        column = self._column
+        row_of = self._row
+        size = self._size
+
+        for row, columns in enumerate(rows):
+            first = len(column)
+            for col in columns:
+                node = len(column)
+                # Insert the node at the bottom of its column
+                up.append(up[col])
+                down.append(col)
+                down[up[col]] = node
+                up[col] = node
+                column.append(col)
+                row_of.append(row)
+                size[col] += 1
+                # Insert the node at the end of its row
+                left.append(node - 1)
+                right.append(node + 1)
+            # Close the circle of the row
+            last = len(column) - 1
+            if last >= first:
+                left[first] = last
+                right[last] = first
+
+    def _cover(self, col):
+        """
+        Remove the given column, and every row covering it, from the matrix.
+        """
+        left = self._left
+        right = self._right
+        up = self._up
+        down = self._down
+        column = self._column
+        size = self._size
+
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, col):
+        """
+        Undo `_cover(col)`.
+        """
+        left = self._left
+        right = self._right
+        up = self._up
+        down = self._down
+        column = self._column
+        size = self._size
+
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+
+    def _search(self, solution):
+        """
+        Yield every exact cover extending the given partial solution.
+        """
+        root = self._root
+        right = self._right
+        left = self._left
+        down = self._down
+        column = self._column
+        size = self._size
+
+        if right[root] == root:
+            # Every column is covered
+            yield list(solution)
+            return
+
+        # Branch on the column with the fewest rows
+        best_col = right[root]
+        col = right[best_col]
+        while col != root and size[best_col] > 1:
+            if size[col] < size[best_col]:
+                best_col = col
+            col = right[col]
+        if not size[best_col]:
+            # Dead end: this column can't be covered
+            return
+
+        self._cover(best_col)
+        r = down[best_col]
+        while r != best_col:
+            solution.append(self._row[r])
+            j = right[r]
+            while j != r:
+                self._cover(column[j])
+                j = right[j]
+
+            for cover in self._search(solution):
+                yield cover
+
+            j = left[r]
+            while j != r:
+                self._uncover(column[j])
+                j = left[j]
+            solution.pop()
+            r = down[r]
+        self._uncover(best_col)
+
+    def solutions(self):
+        """
+        Lazily find every exact cover.
+
+        The matrix is restored once the generator is exhausted. If it's closed
+        early, this object must not be searched again.
+
+        Yields
+        ------
+        rows : list of int
+            Indices of the rows forming an exact cover, in the order they were
+            chosen.
+        """
+        return self._search([])
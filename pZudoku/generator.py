@@ -0,0 +1,229 @@
+"""
+Generator of random nine-by-nine sudoku puzzles with a unique solution.
+
+Every puzzle starts as a random solved grid, whose squares are emptied one by
+one in a random order, skipping the ones that would make the solution
+ambiguous. Emptying a square of a proper puzzle keeps it proper if and only
+if no solution has another number in that square, so every step is a single
+search that stops at the first solution found, on the fast `BitmaskBoard`.
+
+The same seed always gives the same puzzles.
+"""
+import numpy as np
+
+from pZudoku.bitmask_board import BitmaskBoard
+from pZudoku.corpus import write_grids
+from pZudoku.hb6d_board import ConsistencyError
+
+
+def _random_state(seed):
+    """
+    Return a random number generator for the given seed, or the seed itself
+    if it's a generator already.
+    """
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    return np.random.RandomState(seed)
+
+
+def shuffle(grid, seed=None):
+    """
+    Apply a random transformation to the given grid that keeps it valid:
+    relabel the numbers, permute the bands, the stacks, and the rows and
+    columns within them, and maybe transpose it.
+
+    Parameters
+    ----------
+    grid : array_like of int and of shape (9, 9)
+        Numbers of each square, with zeros for empty squares.
+    seed : int, numpy.random.RandomState or None, optional
+        Seed of the random number generator, or the generator itself.
+        Default is None, i.e. a different transformation every time.
+
+    Returns
+    -------
+    grid : numpy.ndarray of int and of shape (9, 9)
+    """
+    grid = np.asarray(grid)
+    rng = _random_state(seed)
+    labels = np.concatenate([[0], rng.permutation(9) + 1])
+    rows = np.concatenate([3 * band + rng.permutation(3)
+                           for band in rng.permutation(3)])
+    cols = np.concatenate([3 * stack + rng.permutation(3)
+                           for stack in rng.permutation(3)])
+    grid = labels[grid][rows][:, cols]
+    if rng.rand() < 0.5:
+        grid = grid.T
+    return grid
+
+
+def _random_solution(rng):
+    """
+    Return a random solved grid.
+    """
+    # The boxes on the diagonal don't share any units, so they can be filled
+    # in independently, and the rest of the grid always has a solution
+    grid = np.zeros((9, 9), dtype=int)
+    for box in range(3):
+        grid[3 * box:3 * box + 3, 3 * box:3 * box + 3] = (
+            rng.permutation(9).reshape(3, 3) + 1
+        )
+    board = BitmaskBoard.from_array(grid.tolist())
+    board.solve()
+    solution = np.array([mask.bit_length() for mask in board._cells])
+    return shuffle(solution.reshape(9, 9), rng)
+
+
+def _has_other_solution(puzzle, _square, number):
+    """
+    Return whether the given puzzle has a solution with another number than
+    the given one in the given square.
+
+    Parameters
+    ----------
+    puzzle : list of int
+        Number of every square, in row-major order, with zeros for empty
+        squares.
+    _square : int between 0 and 80 inclusive
+        Linear index of an empty square. Zero-based.
+    number : int between 1 and 9 inclusive
+    """
+    board = BitmaskBoard.from_array(
+        [puzzle[_row:_row + 9] for _row in range(0, 81, 9)]
+    )
+    board._cells[_square] &= ~(1 << (number - 1))
+    try:
+        board._recursive_solve()
+    except ConsistencyError:
+        return False
+    return True
+
+
+def _check_n_clues(n_clues):
+    """
+    Raise a ValueError if the given target number of clues isn't None or
+    between 0 and 81.
+    """
+    if n_clues is not None and not 0 <= n_clues <= 81:
+        msg = "Number of clues must be between 0 and 81, not {}."
+        raise ValueError(msg.format(n_clues))
+
+
+def _generate(rng, n_clues):
+    """
+    Generate a proper puzzle and its solution. See `generate()`.
+    """
+    solution = _random_solution(rng)
+    puzzle = solution.reshape(-1).tolist()
+    clues = 81
+    for _square in rng.permutation(81).tolist():
+        if n_clues is not None and clues <= n_clues:
+            break
+        number = puzzle[_square]
+        puzzle[_square] = 0
+        if _has_other_solution(puzzle, _square, number):
+            puzzle[_square] = number
+        else:
+            clues -= 1
+    return np.array(puzzle).reshape(9, 9), solution
+
+
+def generate(n_clues=None, seed=None, return_solution=False):
+    """
+    Generate a random puzzle with a unique solution.
+
+    Parameters
+    ----------
+    n_clues : int or None, optional
+        Number of clues to stop at. Squares are only emptied while the
+        solution stays unique, so the puzzle may end up with more clues, e.g.
+        for targets below about 20. Default is None, i.e. generate a minimal
+        puzzle, from which no clue can be removed.
+    seed : int, numpy.random.RandomState or None, optional
+        Seed of the random number generator, or the generator itself.
+        Default is None, i.e. a different puzzle every time.
+    return_solution : bool, optional
+        If True, also return the solution. Default is False.
+
+    Returns
+    -------
+    puzzle : numpy.ndarray of int and of shape (9, 9)
+        Nine-by-nine array of fill values for each square, with zeros for
+        empty squares.
+    solution : numpy.ndarray of int and of shape (9, 9)
+        Only returned if `return_solution` is True.
+
+    Raises
+    ------
+    ValueError
+        If `n_clues` isn't between 0 and 81.
+    """
+    _check_n_clues(n_clues)
+    puzzle, solution = _generate(_random_state(seed), n_clues)
+    if return_solution:
+        return puzzle, solution
+    return puzzle
+
+
+def generate_many(number, n_clues=None, seed=None, start=0):
+    """
+    Lazily generate random puzzles with a unique solution.
+
+    Puzzle `n` only depends on `seed` and ``start + n``, so several processes
+    can generate disjoint parts of the same sequence of puzzles by giving
+    them different `start` values.
+
+    Parameters
+    ----------
+    number : int
+        Number of puzzles.
+    n_clues : int or None, optional
+        See `generate()`. Default is None, i.e. minimal puzzles.
+    seed : int or None, optional
+        Seed of the sequence of puzzles. Default is None, i.e. a random
+        sequence.
+    start : int, optional
+        Index of the first puzzle in the sequence. Default is 0.
+
+    Yields
+    ------
+    puzzle : numpy.ndarray of int and of shape (9, 9)
+
+    Raises
+    ------
+    ValueError
+        If `n_clues` isn't between 0 and 81.
+    """
+    _check_n_clues(n_clues)
+    if seed is None:
+        seed = np.random.randint(2 ** 31)
+    for n in range(start, start + number):
+        puzzle, _ = _generate(np.random.RandomState([seed, n]), n_clues)
+        yield puzzle
+
+
+def write_puzzles(destination, number, n_clues=None, seed=None,
+                  format='line'):
+    """
+    Generate random puzzles with a unique solution straight into a file.
+
+    Parameters
+    ----------
+    destination : str or path-like
+        Path of the file. It's gzip-compressed if it ends with '.gz'.
+    number : int
+        Number of puzzles.
+    n_clues : int or None, optional
+        See `generate()`. Default is None, i.e. minimal puzzles.
+    seed : int or None, optional
+        See `generate_many()`. Default is None.
+    format : {'line', 'grid'}, optional
+        Format of the file, see the `corpus` module. Default is 'line'.
+
+    Raises
+    ------
+    ValueError
+        If `n_clues` isn't between 0 and 81, or if the format is unknown.
+    """
+    _check_n_clues(n_clues)
+    write_grids(destination, generate_many(number, n_clues, seed), format)
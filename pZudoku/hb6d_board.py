@@ -1,16 +1,53 @@
 import copy
+import functools
+import itertools
+import time
 
 import numpy as np
 
+from pZudoku.dlx import DancingLinks
+from pZudoku.propagation import fish, locked_candidates, subsets
+
+
+# Valid values of the `algorithm` argument of HB6DBoard.solve()
+_ALGORITHMS = ('search', 'dlx')
+
+# Valid values of the `backtracking` argument of HB6DBoard.solve()
+_BACKTRACKING_MODES = ('trail', 'copy')
+
+# Valid values of the `branching` argument of HB6DBoard.solve()
+_BRANCHING_POLICIES = ('mrv', 'first')
+
+# Valid values of the `propagation` argument of HB6DBoard.solve(), from the
+# cheapest to the strongest
+_PROPAGATION_LEVELS = ('singles', 'locked', 'subsets', 'fish')
+
+# Elimination techniques added by every propagation level, from the cheapest
+# to the strongest. See the `propagation` module.
+_PROPAGATION_TECHNIQUES = {
+    'singles': (),
+    'locked': (locked_candidates,),
+    'subsets': (
+        functools.partial(subsets, size=2),
+        functools.partial(subsets, size=3),
+    ),
+    'fish': tuple(
+        functools.partial(fish, size=size) for size in (2, 3, 4)
+    ),
+}
+
+# Error messages for empty squares, numrows, numcols and numboxes
+_INCONSISTENCY_MESSAGES = (
+    "Inconsistency found at _row {} and _col {}.",
+    "Inconsistency found for _num {} in _row {}.",
+    "Inconsistency found for _num {} in _col {}.",
+    "Inconsistency found for _num {} in _box {}.",
+)
 
 _NO_CANDIDATE_STR = '.'
 
 _REPR_HORIZONTAL_SEP_BIG = '\n\n'
 
-_REPR_HORIZONTAL_SEP_MEDIUM = (
-    '\n---------------------  ---------------------  ---------------------\n'
-)
-
 _REPR_HORIZONTAL_SEP_SMALL = '\n'
 
 _REPR_VERTICAL_SEP_BIG = '  '
@@ -19,9 +56,17 @@ _REPR_VERTICAL_SQUARE_MEDIUM = ' | '
 
 _REPR_VERTICAL_SEP_SMALL = ' '
 
-# Dimensions of the HB6DBoard's underlying array
+# Dimensions of the HB6DBoard's underlying array for the usual 3-by-3 boxes
 _SHAPE = (3,) * 6
 
+# Axes of the underlying array to reduce along in order to get one value per
+# square, numrow, numcol and numbox, respectively
+_SQUARE_AXES = (0, 1)
+_NUMROW_AXES = (4, 5)
+_NUMCOL_AXES = (2, 3)
+_NUMBOX_AXES = (3, 5)
+_CONSTRAINT_AXES = (_SQUARE_AXES, _NUMROW_AXES, _NUMCOL_AXES, _NUMBOX_AXES)
+
 _STR_HORIZONTAL_SEP_MEDIUM = (
     '\n---------------------\n'
 )
@@ -33,12 +78,161 @@ _STR_VERTICAL_SQUARE_MEDIUM = ' | '
 _STR_VERTICAL_SEP_SMALL = ' '
 
 
+def _check_option(value, valid_values, name):
+    """
+    Raise a ValueError if the given value of an option isn't a valid one.
+    """
+    if value not in valid_values:
+        msg = "Unknown {}: {!r}."
+        raise ValueError(msg.format(name, value))
+
+
+def _make_shape(box_shape):
+    """
+    Return the dimensions of the HB6DBoard's underlying array for boxes of the
+    given shape.
+
+    Parameters
+    ----------
+    box_shape : tuple of int of shape (2,)
+        Number of rows and columns of every box, (box_rows, box_cols). The
+        board has ``box_rows * box_cols`` rows, columns and numbers.
+
+    Returns
+    -------
+    shape : tuple of int of shape (6,)
+        (_num_div, _num_mod, _boxrow, _subrow, _boxcol, _subcol) dimensions,
+        i.e. (box_rows, box_cols, box_cols, box_rows, box_rows, box_cols).
+    """
+    box_rows, box_cols = box_shape
+    return (box_rows, box_cols, box_cols, box_rows, box_rows, box_cols)
+
+
+def _default_box_shape(size):
+    """
+    Return the most square box shape of a board of the given size, with no
+    more rows than columns, e.g. (3, 3) for 9 and (2, 3) for 6.
+    """
+    box_rows = max(
+        _rows for _rows in range(1, int(size ** 0.5) + 1) if not size % _rows
+    )
+    return box_rows, size // box_rows
+
+
+def _kept_axes(axes):
+    """
+    Return the axes of the HB6DBoard's underlying array that are not in
+    `axes`, i.e. the four coordinates fixed by a constraint.
+    """
+    return tuple(axis for axis in range(len(_SHAPE)) if axis not in axes)
+
+
+@functools.lru_cache(maxsize=None)
+def _cover_columns(shape):
+    """
+    Tabulate the exact cover columns of every cell of an array of the given
+    shape.
+
+    The table is computed once per shape, and is read-only.
+
+    Parameters
+    ----------
+    shape : tuple of int of shape (6,)
+        Dimensions of the HB6DBoard's underlying array.
+
+    Returns
+    -------
+    columns : numpy.ndarray of int and of shape (n_cells, 4)
+        Index of the square, numrow, numcol, and numbox of each cell. Every
+        type of constraint is numbered linearly like in
+        `HB6DBoard._constraint_counts()`, after all constraints of the
+        previous types.
+    """
+    _idxs = np.indices(shape).reshape(len(shape), -1)
+    columns = []
+    offset = 0
+    for axes in _CONSTRAINT_AXES:
+        kept_axes = list(_kept_axes(axes))
+        kept_shape = tuple(shape[axis] for axis in kept_axes)
+        columns.append(
+            offset + np.ravel_multi_index(_idxs[kept_axes], kept_shape)
+        )
+        offset += np.prod(kept_shape)
+    columns = np.stack(columns, axis=-1)
+    columns.flags.writeable = False
+    return columns
+
+
+@functools.lru_cache(maxsize=None)
+def _cover_members(shape):
+    """
+    Tabulate the cells of every exact cover column of an array of the given
+    shape.
+
+    The table is computed once per shape, and is read-only.
+
+    Parameters
+    ----------
+    shape : tuple of int of shape (6,)
+        Dimensions of the HB6DBoard's underlying array.
+
+    Returns
+    -------
+    members : numpy.ndarray of int and of shape (n_columns, n)
+        Flat indices of the cells of every square, numrow, numcol, and numbox,
+        in increasing order, numbered like in `_cover_columns()`.
+    """
+    columns = _cover_columns(shape)
+    n_columns = len(_CONSTRAINT_AXES) * np.prod(shape[:4])
+    # Every cell is in exactly one column of each type, so sorting the cells
+    # by column groups them into rows of equal length
+    members = np.argsort(columns.T.reshape(-1), kind='mergesort')
+    members = members.reshape(n_columns, -1) % len(columns)
+    members.flags.writeable = False
+    return members
+
+
+@functools.lru_cache(maxsize=None)
+def _peers(shape):
+    """
+    Tabulate the peers of every cell of an array of the given shape.
+
+    The table is computed once per shape, and is read-only.
+
+    Parameters
+    ----------
+    shape : tuple of int of shape (6,)
+        Dimensions of the HB6DBoard's underlying array.
+
+    Returns
+    -------
+    peers : numpy.ndarray of int and of shape (n_cells, n_peers)
+        Flat indices of the square, numrow, numcol, and numbox peers of each
+        cell (excluding the cell itself), in increasing order.
+    """
+    columns = _cover_columns(shape)
+    n_cells = len(columns)
+
+    # Cells sharing each of the four constraints of every cell, including
+    # the cell itself
+    members = _cover_members(shape)[columns].reshape(n_cells, -1)
+    members = np.sort(members, axis=1)
+
+    # Drop the cell itself, and the duplicates of the cells sharing more than
+    # one constraint with it. Every cell has the same number of peers.
+    keep = members != np.arange(n_cells)[:, np.newaxis]
+    keep[:, 1:] &= members[:, 1:] != members[:, :-1]
+    peers = members[keep].reshape(n_cells, -1)
+    peers.flags.writeable = False
+    return peers
+
+
 class ConsistencyError(Exception):
     """
     Exception type for signalling the inconsistency of the sudoku board.
     """
 
-    def __init__(self, message, _idx=None):
+    def __init__(self, message, _idx=None, clashes=None):
         """
         Initialise this Exception object.
 
@@ -49,9 +243,13 @@ class ConsistencyError(Exception):
         _idx : None or tuple of int or None of shape (6,), optional
             Coordinates of the HB6DBoard object's boolean array that
             correspond to the found inconsistency. Default is None.
+        clashes : None or list of tuple of int of shape (3,), optional
+            Number, row and column (one-based) of every given that clashes
+            with another one, in row-major order. Default is None.
         """
         self.message = message
         self._idx = _idx
+        self.clashes = clashes
 
     def __str__(self):
         return self.message
@@ -62,40 +260,74 @@ class HB6DBoard(object):
     Data structure for storing and solving a sudoku board.
     """
 
-    def __init__(self):
+    def __init__(self, box_shape=(3, 3)):
+        """
+        Initialise this HB6DBoard object with every candidate valid.
+
+        Parameters
+        ----------
+        box_shape : tuple of int of shape (2,), optional
+            Number of rows and columns of every box, e.g. (2, 3) for a
+            six-by-six board. Default is (3, 3).
+
+        Raises
+        ------
+        ValueError
+            If the box shape isn't a pair of positive integers.
+        """
+        if len(box_shape) != 2 or min(box_shape) < 1:
+            msg = "Invalid box shape: {!r}."
+            raise ValueError(msg.format(box_shape))
+
         # Dimensions of the underlying 6-D boolean array
-        self._shape = _SHAPE
+        self._shape = _make_shape(tuple(int(n) for n in box_shape))
         self._cells = np.full(shape=self._shape, fill_value=True, dtype=bool)
+        # Undo trail: list of arrays of the (flat) indices of the cells set to
+        # False by each insertion, or None if not recording
+        self._trail = None
+        # Number of candidates of every exact cover column (see
+        # `_cover_columns()`), or None if not recording
+        self._counts = None
+        # Queue of arrays of the columns whose count dropped to one or zero,
+        # or None if not recording
+        self._queue = None
+        # Statistics of the search, or None if not recording
+        self._stats = None
+
+    @property
+    def _size(self):
+        """
+        Number of rows, columns and candidate numbers of this board.
+        """
+        return self._shape[0] * self._shape[1]
 
-    @staticmethod
-    def _num_row_col_to_idx(_num, _row, _col):
+    def _num_row_col_to_idx(self, _num, _row, _col):
         """
         Return the 6-D coordinate of the cell corresponding to the given
         candidate number, row, and column.
 
         Parameters
         ----------
-        _num : int between 0 and 8 inclusive
+        _num : int between 0 and `_size` - 1 inclusive
             Candidate referenced by the cell with the given index. Zero-based.
-        _row : int between 0 and 8 inclusive
+        _row : int between 0 and `_size` - 1 inclusive
             Row referenced by the the cell with the given index. Zero-based.
-        _col : int between 0 and 8 inclusive
+        _col : int between 0 and `_size` - 1 inclusive
             Column referenced by the cell with the given index. Zero-based.
 
         Returns
         -------
         _idx : numpy.ndarray of shape (6,)
             Zero-based coordinates referring to a single cell.
-            (_num_div3, _num_mod3, _boxrow, _subrow, _boxcol, _subcol)
+            (_num_div, _num_mod, _boxrow, _subrow, _boxcol, _subcol)
         """
-        _num_div3, _num_mod3 = divmod(_num, 3)
-        _boxrow, _subrow = divmod(_row, 3)
-        _boxcol, _subcol = divmod(_col, 3)
-        _idx = (_num_div3, _num_mod3, _boxrow, _subrow, _boxcol, _subcol)
+        _num_div, _num_mod = divmod(_num, self._shape[1])
+        _boxrow, _subrow = divmod(_row, self._shape[3])
+        _boxcol, _subcol = divmod(_col, self._shape[5])
+        _idx = (_num_div, _num_mod, _boxrow, _subrow, _boxcol, _subcol)
         return _idx
 
-    @staticmethod
-    def _idx_to_num_row_col(_idx):
+    def _idx_to_num_row_col(self, _idx):
         """
         Return the number, row, and column that is represented by the cell
         with the given coordinates.
@@ -104,44 +336,73 @@ class HB6DBoard(object):
         ----------
         _idx : numpy.ndarray of shape (6,)
             Zero-based coordinates referring to a single cell.
-            (_num_div3, _num_mod3, _boxrow, _subrow, _boxcol, _subcol)
+            (_num_div, _num_mod, _boxrow, _subrow, _boxcol, _subcol)
 
         Returns
         -------
-        _num : int between 0 and 8 inclusive
+        _num : int between 0 and `_size` - 1 inclusive
             Candidate referenced by the cell with the given index. Zero-based.
-        _row : int between 0 and 8 inclusive
+        _row : int between 0 and `_size` - 1 inclusive
             Row referenced by the the cell with the given index. Zero-based.
-        _col : int between 0 and 8 inclusive
+        _col : int between 0 and `_size` - 1 inclusive
             Column referenced by the cell with the given index. Zero-based.
         """
-        # _num = 3 * _idx[0] + _idx[1]
-        # _row = 3 * _idx[2] + _idx[3]
-        # _col = 3 * _idx[4] + _idx[5]
         return (
-            _idx[0] * 3 + _idx[1],
-            _idx[2] * 3 + _idx[3],
-            _idx[4] * 3 + _idx[5],
+            _idx[0] * self._shape[1] + _idx[1],
+            _idx[2] * self._shape[3] + _idx[3],
+            _idx[4] * self._shape[5] + _idx[5],
         )
 
+    def _to_array(self):
+        """
+        Return the numbers of this board as a 2-D array, like the one given
+        to `from_array()`.
+
+        Returns
+        -------
+        array : numpy.ndarray of int and of shape (`_size`, `_size`)
+            Number in each square, or zero for the squares with more than one
+            (or no) candidate. One-based.
+        """
+        # Array indexed by [_num, _row, _col]
+        cells = self._cells.reshape((self._size,) * 3)
+        return np.where(cells.sum(axis=0) == 1, cells.argmax(axis=0) + 1, 0)
+
     def __repr__(self):
         board_repr = ''
 
-        # Append three box rows to `board_repr`
-        for boxrow in range(3):
-            # Append three rows to `board_repr`
-            for subrow in range(3):
-                # Append three lines to `board_repr`
-                for num_div3 in range(3):
+        n_num_div, n_num_mod, n_boxrows, n_subrows, n_boxcols, n_subcols = (
+            self._shape
+        )
+        # Every number is right-aligned to the width of the largest one
+        width = len(str(self._size))
+        square_width = sum([
+            n_num_mod * width,
+            (n_num_mod - 1) * len(_REPR_VERTICAL_SEP_SMALL),
+        ])
+        box_width = sum([
+            n_subcols * square_width,
+            (n_subcols - 1) * len(_REPR_VERTICAL_SQUARE_MEDIUM),
+        ])
+        horizontal_sep_medium = '\n{}\n'.format(
+            _REPR_VERTICAL_SEP_BIG.join(['-' * box_width] * n_boxcols)
+        )
+
+        # Append every box row to `board_repr`
+        for boxrow in range(n_boxrows):
+            # Append every row of the box row to `board_repr`
+            for subrow in range(n_subrows):
+                # Append one line per _num_div to `board_repr`
+                for num_div in range(n_num_div):
                     # Append a single line to `board_repr`
-                    for boxcol in range(3):
-                        # Append three squares to `board_repr`
-                        for subcol in range(3):
-                            # Append three cells to `board_repr`
-                            for num_mod3 in range(3):
+                    for boxcol in range(n_boxcols):
+                        # Append every square of the box to `board_repr`
+                        for subcol in range(n_subcols):
+                            # Append one cell per _num_mod to `board_repr`
+                            for num_mod in range(n_num_mod):
                                 # Append a single cell to `board_repr`
                                 _idx = (
-                                    num_div3, num_mod3,  # number
+                                    num_div, num_mod,  # number
                                     boxrow, subrow,  # row
                                     boxcol, subcol,  # column
                                 )
@@ -151,34 +412,34 @@ class HB6DBoard(object):
                                     str_value = str(_num + 1)
                                 else:
                                     str_value = _NO_CANDIDATE_STR
-                                board_repr += str_value
+                                board_repr += str_value.rjust(width)
 
                                 # Append a vertical cell separator if needed
-                                if num_mod3 != 2:
+                                if num_mod != n_num_mod - 1:
                                     board_repr += _REPR_VERTICAL_SEP_SMALL
 
                             # Append a vertical square separator if this is
                             # not the last column of the box
-                            if subcol != 2:
+                            if subcol != n_subcols - 1:
                                 board_repr += _REPR_VERTICAL_SQUARE_MEDIUM
 
                         # Append a vertical box separator if this is not the
                         # last box column
-                        if boxcol != 2:
+                        if boxcol != n_boxcols - 1:
                             board_repr += _REPR_VERTICAL_SEP_BIG
 
                     # Append a horizontal cell separator if this is not the
                     # last line of the square
-                    if num_div3 != 2:
+                    if num_div != n_num_div - 1:
                         board_repr += _REPR_HORIZONTAL_SEP_SMALL
 
                 # Append a horizontal square separator if this is not the
                 # last row in the box
-                if subrow != 2:
-                    board_repr += _REPR_HORIZONTAL_SEP_MEDIUM
+                if subrow != n_subrows - 1:
+                    board_repr += horizontal_sep_medium
 
             # Append a horizontal box separator if this is not the last box row
-            if boxrow != 2:
+            if boxrow != n_boxrows - 1:
                 board_repr += _REPR_HORIZONTAL_SEP_BIG
 
         # Append a newline to the end
@@ -207,56 +468,310 @@ class HB6DBoard(object):
             _num, _row, _col = self._idx_to_num_row_col(_idx)
             raise ValueError(msg.format(_num, _row, _col))
 
-        _num_div3, _num_mod3, _boxrow, _subrow, _boxcol, _subcol = _idx
+        # Flat indices of the candidates to set to False: the square, numrow,
+        # numcol, and numbox peers of the cell that are still candidates
+        _cells_flat = self._cells.reshape(-1)
+        _flat_idx = np.ravel_multi_index(_idx, self._shape)
+        peers = _peers(self._shape)[_flat_idx]
+        self._remove(peers[_cells_flat[peers]])
 
-        # Set square peers to False
-        self._cells[:, :, _boxrow, _subrow, _boxcol, _subcol] = False
-        # Set numcol peers to False
-        self._cells[_num_div3, _num_mod3, :, :, _boxcol, _subcol] = False
-        # Set numrow peers to False
-        self._cells[_num_div3, _num_mod3, _boxrow, _subrow, :, :] = False
-        # Set numbox peers to False
-        self._cells[_num_div3, _num_mod3, _boxrow, :, _boxcol, :] = False
+        if self._stats is not None:
+            self._stats.puts += 1
 
-        # Set the cell itself to True
-        self._cells[_idx] = True
+    def _remove(self, removed):
+        """
+        Set the given candidates to False, in-place, and record the change.
+
+        Parameters
+        ----------
+        removed : numpy.ndarray of int
+            Flat indices of distinct cells that are candidates.
+        """
+        self._cells.reshape(-1)[removed] = False
+
+        if self._trail is not None:
+            self._trail.append(removed)
+        if self._counts is not None:
+            columns = _cover_columns(self._shape)[removed].reshape(-1)
+            self._counts -= np.bincount(columns, minlength=len(self._counts))
+            self._queue.append(columns[self._counts[columns] <= 1])
+
+    def _undo(self, mark):
+        """
+        Restore the candidates removed since the undo trail had the given
+        length, in-place.
+
+        Parameters
+        ----------
+        mark : int
+            Length of the undo trail to return to.
+        """
+        if len(self._trail) <= mark:
+            return
+        restored = np.concatenate(self._trail[mark:])
+        del self._trail[mark:]
+        self._cells.reshape(-1)[restored] = True
+
+        if self._counts is not None:
+            columns = _cover_columns(self._shape)[restored].reshape(-1)
+            self._counts += np.bincount(columns, minlength=len(self._counts))
+
+    def _start_counting(self):
+        """
+        Start keeping count of the candidates of every square, numrow, numcol
+        and numbox, and queueing the ones left with one or no candidates.
+
+        Every later change made by `_remove()` and `_undo()` updates the
+        counts incrementally, which is much cheaper than counting the whole
+        board again. The board must not be modified in any other way until
+        counting is stopped by setting `_counts` and `_queue` to None.
+        """
+        columns = _cover_columns(self._shape)
+        n_columns = len(_CONSTRAINT_AXES) * np.prod(self._shape[:4])
+        counts = np.bincount(
+            columns[np.flatnonzero(self._cells)].reshape(-1),
+            minlength=n_columns,
+        )
+        # Counts are at most `_size`, so int8 is enough for boards of up to
+        # 128-by-128 squares
+        self._counts = counts.astype(np.min_scalar_type(-self._size))
+        self._queue = [np.flatnonzero(self._counts <= 1)]
 
     @classmethod
-    def from_array(cls, array):
+    def from_array(cls, array, box_shape=None):
         """
         Create a HB6DBoard instance from the given 2-D array.
 
+        Every given is inserted at once, by setting the union of the peers of
+        the givens to False.
+
         Parameters
         ----------
-        array : numpy.ndarray of int or None and of shape (9, 9)
-            Nine-by-nine array of fill values for each square. None values
-            correspond to empty squares.
+        array : numpy.ndarray of int or None and of shape (n, n)
+            Square array of fill values for each square, e.g. nine-by-nine.
+            None values correspond to empty squares.
 
-            Candidate numbers are one-based (i.e. 1 to 9).
+            Candidate numbers are one-based (i.e. 1 to n).
+        box_shape : tuple of int of shape (2,) or None, optional
+            Number of rows and columns of every box. Default is None, i.e. the
+            most square box shape with no more rows than columns, e.g. (3, 3)
+            for a nine-by-nine array and (2, 3) for a six-by-six one.
 
         Raises
         ------
         ConsistencyError
-            If the given 2-D array is inconsistent.
+            If some givens clash, i.e. share a row, column or box. Every
+            clashing given is listed in its `clashes` attribute.
 
             Note: this function is not guaranteed to raise for every invalid
             sudoku board.
+        ValueError
+            If the size of the array doesn't match the box shape.
+        """
+        if box_shape is None:
+            box_shape = _default_box_shape(len(array))
+        obj = cls(box_shape)
+        size = obj._size
+        if len(array) != size:
+            msg = "Expected {} rows for boxes of shape {!r}, got {}."
+            raise ValueError(msg.format(size, box_shape, len(array)))
+
+        numbers = np.asarray(array)
+        if numbers.dtype.kind not in 'iu':
+            # E.g. empty squares given as None
+            numbers = np.array([
+                [number if number in range(1, size + 1) else 0
+                 for number in row]
+                for row in array
+            ], dtype=int)
+        if numbers.shape != (size, size):
+            msg = "Expected an array of shape {!r}, got {!r}."
+            raise ValueError(msg.format((size, size), numbers.shape))
+
+        # Zero-based number, row and column of every given
+        _rows, _cols = ((numbers >= 1) & (numbers <= size)).nonzero()
+        _nums = numbers[_rows, _cols].astype(int) - 1
+        _flat_idxs = np.ravel_multi_index(
+            obj._num_row_col_to_idx(_nums, _rows, _cols), obj._shape
+        )
+
+        # Givens sharing a numrow, numcol or numbox
+        columns = _cover_columns(obj._shape)[_flat_idxs]
+        counts = np.bincount(columns.reshape(-1))
+        clashing = (counts[columns] > 1).any(axis=1)
+        if clashing.any():
+            clashes = [
+                (int(_num) + 1, int(_row) + 1, int(_col) + 1)
+                for _num, _row, _col in zip(
+                    _nums[clashing], _rows[clashing], _cols[clashing]
+                )
+            ]
+            msg = "Clash found during instantiation: {}.".format(', '.join(
+                '{} ({}, {})'.format(*clash) for clash in clashes
+            ))
+            raise ConsistencyError(msg, clashes=clashes)
+
+        # The givens don't share any constraints, so none of them is a peer
+        # of another one
+        obj._cells.reshape(-1)[_peers(obj._shape)[_flat_idxs]] = False
+        return obj
+
+    @classmethod
+    def from_string(cls, string, box_shape=None):
+        """
+        Create a HB6DBoard instance from the given string of the numbers in
+        every square, in row-major order, e.g. 81 characters for a
+        nine-by-nine board.
+
+        Digits are numbers, and any other character (usually '.' or '0') is
+        an empty square.
+
+        Parameters
+        ----------
+        string : str
+            Numbers of the squares, for boards of up to nine-by-nine.
+        box_shape : tuple of int of shape (2,) or None, optional
+            Number of rows and columns of every box. See `from_array()`.
+
+        Raises
+        ------
+        ConsistencyError
+            If some givens clash. See `from_array()`.
+        ValueError
+            If the length of the string isn't the number of squares of a
+            board of up to nine-by-nine.
+        """
+        size = int(round(len(string) ** 0.5))
+        if size ** 2 != len(string) or size > 9:
+            msg = "Expected 81 characters (or n * n for n < 9), got {}."
+            raise ValueError(msg.format(len(string)))
+
+        numbers = np.frombuffer(
+            string.encode('ascii', 'replace'), dtype=np.uint8
+        ) - ord('0')
+        return cls.from_array(numbers.reshape(size, size), box_shape)
+
+    def to_bytes(self):
+        """
+        Return the candidates of this board packed into bytes, one bit per
+        cell, e.g. 92 bytes for a nine-by-nine board.
+
+        Only the candidates are kept, not the box shape, which must be given
+        to `from_bytes()`.
+
+        Returns
+        -------
+        data : bytes
+        """
+        return np.packbits(self._cells.reshape(-1)).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data, box_shape=(3, 3)):
+        """
+        Create a HB6DBoard instance from the bytes returned by `to_bytes()`.
+
+        Parameters
+        ----------
+        data : bytes
+            Candidates packed by `to_bytes()`.
+        box_shape : tuple of int of shape (2,), optional
+            Number of rows and columns of every box. Default is (3, 3).
+
+        Raises
+        ------
+        ValueError
+            If the number of bytes doesn't match the box shape.
+        """
+        obj = cls(box_shape)
+        n_cells = obj._cells.size
+        n_bytes = -(-n_cells // 8)
+        if len(data) != n_bytes:
+            msg = "Expected {} bytes for boxes of shape {!r}, got {}."
+            raise ValueError(msg.format(n_bytes, box_shape, len(data)))
+
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+        obj._cells = bits[:n_cells].astype(bool).reshape(obj._shape)
+        return obj
+
+    def to_nibbles(self):
+        """
+        Return the numbers of this solved board packed into bytes, four bits
+        per square in row-major order, e.g. 41 bytes for a nine-by-nine
+        board.
+
+        Returns
+        -------
+        data : bytes
+
+        Raises
+        ------
+        ValueError
+            If some squares have more than one (or no) candidate, or if the
+            numbers don't fit in four bits, i.e. the board is larger than
+            fifteen-by-fifteen.
+        """
+        if self._size > 15:
+            msg = "Numbers up to {} don't fit in four bits."
+            raise ValueError(msg.format(self._size))
+        if not (self._cells.sum(axis=_SQUARE_AXES) == 1).all():
+            msg = "Only solved boards can be packed into nibbles."
+            raise ValueError(msg)
+
+        numbers = self._to_array().reshape(-1).astype(np.uint8)
+        if len(numbers) % 2:
+            numbers = np.append(numbers, np.uint8(0))
+        return ((numbers[0::2] << 4) | numbers[1::2]).tobytes()
+
+    @classmethod
+    def from_nibbles(cls, data, box_shape=(3, 3)):
+        """
+        Create a solved HB6DBoard instance from the bytes returned by
+        `to_nibbles()`.
+
+        Parameters
+        ----------
+        data : bytes
+            Numbers packed by `to_nibbles()`.
+        box_shape : tuple of int of shape (2,), optional
+            Number of rows and columns of every box. Default is (3, 3).
+
+        Raises
+        ------
+        ValueError
+            If the number of bytes doesn't match the box shape, or if a
+            number is out of range.
         """
-        obj = cls()
-
-        for _row, row in enumerate(array):
-            for _col, number in enumerate(row):
-                if number in range(1, 10):
-                    _num = number - 1
-                    _idx = obj._num_row_col_to_idx(_num, _row, _col)
-                    try:
-                        obj._put(_idx)
-                    except ValueError:
-                        msg = "Clash found during instantiation: {} ({}, {})."
-                        raise ConsistencyError(
-                            msg.format(number, _row + 1, _col + 1)
-                        )
+        obj = cls(box_shape)
+        size = obj._size
+        n_bytes = -(-size ** 2 // 2)
+        if len(data) != n_bytes:
+            msg = "Expected {} bytes for boxes of shape {!r}, got {}."
+            raise ValueError(msg.format(n_bytes, box_shape, len(data)))
+
+        packed = np.frombuffer(data, dtype=np.uint8)
+        numbers = np.stack([packed >> 4, packed & 0xF], axis=-1)
+        numbers = numbers.reshape(-1)[:size ** 2].astype(int)
+        if not ((numbers >= 1) & (numbers <= size)).all():
+            msg = "Numbers must be between 1 and {}."
+            raise ValueError(msg.format(size))
+
+        # Array indexed by [_num, _row, _col]
+        cells = np.zeros((size,) * 3, dtype=bool)
+        _rows, _cols = np.divmod(np.arange(size ** 2), size)
+        cells[numbers - 1, _rows, _cols] = True
+        obj._cells = cells.reshape(obj._shape)
+        return obj
+
+    def __reduce__(self):
+        # Pickle (and copy) only the packed candidates and the box shape.
+        # Undo trails, candidate counts and statistics belong to a search in
+        # progress, and aren't kept.
+        return _unpickle, (type(self), self.to_bytes(), self._shape[:2])
 
+    def __deepcopy__(self, memo):
+        # Like unpickling, but copy the candidates directly
+        obj = type(self)(self._shape[:2])
+        np.copyto(obj._cells, self._cells)
         return obj
 
     def candidates(self, row, column):
@@ -265,16 +780,16 @@ class HB6DBoard(object):
 
         Parameters
         ----------
-        row : int between 1 and 9
-        column : int between 1 and 9
+        row : int between 1 and `_size`
+        column : int between 1 and `_size`
 
         Returns
         -------
         numbers : list of int
             Numbers that are valid candidates in the given square. One-based.
         """
-        boxrow, subrow = divmod(row - 1, 3)
-        boxcol, subcol = divmod(column - 1, 3)
+        boxrow, subrow = divmod(row - 1, self._shape[3])
+        boxcol, subcol = divmod(column - 1, self._shape[5])
         cells = self._cells[:, :, boxrow, subrow, boxcol, subcol].flat
         numbers = [
             idx + 1
@@ -286,42 +801,53 @@ class HB6DBoard(object):
     def __str__(self):
         result = ''
 
-        # Append three box rows to `result`
-        for boxrow in range(3):
-            # Append three lines to `result`
-            for subrow in range(3):
-                row = 3 * boxrow + subrow + 1
-                # Append three box columns to `result`
-                for boxcol in range(3):
-                    # Append three columns to `result`
-                    for subcol in range(3):
-                        # Append a single character to `result`
-                        column = 3 * boxcol + subcol + 1
+        n_boxrows, n_subrows, n_boxcols, n_subcols = self._shape[2:]
+        # Every number is right-aligned to the width of the largest one
+        width = len(str(self._size))
+        line_width = sum([
+            self._size * width,
+            n_boxcols * (n_subcols - 1) * len(_STR_VERTICAL_SEP_SMALL),
+            (n_boxcols - 1) * len(_STR_VERTICAL_SQUARE_MEDIUM),
+        ])
+        horizontal_sep_medium = '\n{}\n'.format('-' * line_width)
+
+        # Append every box row to `result`
+        for boxrow in range(n_boxrows):
+            # Append every line of the box row to `result`
+            for subrow in range(n_subrows):
+                row = n_subrows * boxrow + subrow + 1
+                # Append every box column to `result`
+                for boxcol in range(n_boxcols):
+                    # Append every column of the box column to `result`
+                    for subcol in range(n_subcols):
+                        # Append a single number to `result`
+                        column = n_subcols * boxcol + subcol + 1
                         numbers = self.candidates(row, column)
                         if len(numbers) == 1:
                             number, = numbers
-                            result += str(number)
+                            str_value = str(number)
                         else:
-                            result += _NO_CANDIDATE_STR
+                            str_value = _NO_CANDIDATE_STR
+                        result += str_value.rjust(width)
 
                         # Append a vertical square separator if this is not
                         # the last column of the box
-                        if subcol != 2:
+                        if subcol != n_subcols - 1:
                             result += _STR_VERTICAL_SEP_SMALL
 
                     # Append a vertical box separator if this is not the last
                     # box column
-                    if boxcol != 2:
+                    if boxcol != n_boxcols - 1:
                         result += _STR_VERTICAL_SQUARE_MEDIUM
 
                 # Append a horizontal row separator if this is not the last
                 # subrow in the box
-                if subrow != 2:
+                if subrow != n_subrows - 1:
                     result += _STR_HORIZONTAL_SEP_SMALL
 
             # Append a horizontal box separator if this is not the last box row
-            if boxrow != 2:
-                result += _STR_HORIZONTAL_SEP_MEDIUM
+            if boxrow != n_boxrows - 1:
+                result += horizontal_sep_medium
 
         # Append a newline to the end
         result += '\n'
@@ -334,9 +860,9 @@ class HB6DBoard(object):
 
         Parameters
         ----------
-        number : int between 1 and 9 (inclusive)
-        row : int between 1 and 9 (inclusive)
-        column : int between 1 and 9 (inclusive)
+        number : int between 1 and `_size` (inclusive)
+        row : int between 1 and `_size` (inclusive)
+        column : int between 1 and `_size` (inclusive)
 
         Raises
         ------
@@ -350,46 +876,292 @@ class HB6DBoard(object):
             msg = "Number {} is not a valid candidate in square ({}, {})."
             raise ValueError(msg.format(number, row, column))
 
+    def _singles(self):
+        """
+        Find every cell that is the only candidate left in one of its four
+        constraints.
+
+        Returns
+        -------
+        singles : numpy.ndarray of bool and of the same shape as `_cells`
+            True for every candidate that is the only one in its square
+            ("unique candidate"), or the only one for its number in its row,
+            column or box ("hidden single").
+        """
+        _cells = self._cells
+        return _cells & np.logical_or.reduce(np.broadcast_arrays(*[
+            _cells.sum(axis=axes, keepdims=True) == 1
+            for axes in _CONSTRAINT_AXES
+        ]))
+
+    def _put_many(self, singles):
+        """
+        Insert several numbers at once, in-place.
+
+        Parameters
+        ----------
+        singles : numpy.ndarray of bool and of the same shape as `_cells`
+            Candidates to insert. Every True cell must be a candidate.
+
+        Notes
+        -----
+        If two of the given candidates share a square, numrow, numcol or
+        numbox, they're inserted one by one (in linear order) instead, so that
+        the earlier one wins, just like repeated `_put()` calls would do. The
+        resulting board is then inconsistent, which is left for
+        `_check_consistency()` to detect.
+        """
+        # Number of insertions touching each constraint
+        sums = [
+            singles.sum(axis=axes, keepdims=True)
+            for axes in _CONSTRAINT_AXES
+        ]
+
+        if any((s > 1).any() for s in sums):
+            # Clashing insertions, so fall back to one insertion at a time
+            # Skip the cells that are the only candidate in each of their four
+            # constraints already, since inserting those changes nothing
+            _cells = self._cells
+            settled = np.logical_and.reduce(np.broadcast_arrays(*[
+                _cells.sum(axis=axes, keepdims=True) == 1
+                for axes in _CONSTRAINT_AXES
+            ]))
+            for _idx in zip(*(singles & ~settled).nonzero()):
+                if self._cells[_idx]:
+                    self._put(_idx)
+            return
+
+        # Set the peers of every insertion, except for the inserted cells
+        # themselves, to False
+        peers = (sums[0] > 0) | (sums[1] > 0) | (sums[2] > 0) | (sums[3] > 0)
+        self._remove(np.flatnonzero(self._cells & peers & ~singles))
+
     def _quick_fill(self):
         """
         Fill in some squares by repeatedly trying to apply four simple
         techniques.
 
-        Iteratively apply four basic search steps: "hidden single" for rows,
-        columns and boxes, and "unique candidate" (also called  "full house" or
-        "lone single"). Repeat until none of these four techniques result in
-        new insertions.
+        Apply four basic search steps to the whole board at once: "hidden
+        single" for rows, columns and boxes, and "unique candidate" (also
+        called "full house" or "lone single"). Repeat until none of these four
+        techniques result in new insertions.
+
+        On consistent boards the result is identical to that of the
+        original, loop-based implementation, kept in the `quick_fill`
+        benchmark.
+
+        While counting (see `_start_counting()`), only the squares, numrows,
+        numcols and numboxes queued since the last call are looked at, and
+        the filling stops as soon as one of them is found empty.
         """
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
 
-        # Repeat until there are definitely no more insertions
-        # Assume that there are at least 17 squares filled in, so it's
-        # enough to iterate 81 - 17 = 64 times
-        for _ in range(64):
+        if self._counts is not None:
+            self._quick_fill_queued()
+        else:
+            self._quick_fill_sweeps()
+
+        if stats is not None:
+            stats.propagation_time += time.perf_counter() - start
+
+    def _quick_fill_sweeps(self):
+        """
+        Quick fill this board with passes over the whole board.
+        """
+        stats = self._stats
+        while True:
+            n_candidates = np.count_nonzero(self._cells)
+            self._put_many(self._singles())
+            changed = np.count_nonzero(self._cells) != n_candidates
+            if stats is not None:
+                stats.sweeps += 1
+                stats.idle_sweeps += not changed
+            if not changed:
+                # Fixpoint reached
+                break
+
+    def _quick_fill_queued(self):
+        """
+        Quick fill this board by inserting the singles of the queued
+        constraints, until the queue is empty or a constraint is empty.
+
+        The work is proportional to the number of candidates removed, not to
+        the size of the board. Every batch of the queue counts as a sweep.
+        """
+        stats = self._stats
+        counts = self._counts
+        columns = _cover_columns(self._shape)
+        members = _cover_members(self._shape)
+        _cells_flat = self._cells.reshape(-1)
+
+        while self._queue:
+            queued = np.unique(np.concatenate(self._queue))
+            self._queue = []
+            # Constraints that got more candidates back since being queued,
+            # e.g. by `_undo()`, are skipped
+            queued = queued[counts[queued] <= 1]
+            if not counts[queued].all():
+                # A dead end, left for `_check_consistency()` to report.
+                # Keep the rest of the queue for the next call.
+                self._queue.append(queued)
+                return
+
+            # The only candidate of every queued constraint, except for the
+            # ones that are the only candidate in each of their constraints
+            # already, since inserting those changes nothing
+            singles = members[queued]
+            singles = np.unique(singles[_cells_flat[singles]])
+            singles = singles[(counts[columns[singles]] > 1).any(axis=1)]
+            if stats is not None:
+                stats.sweeps += 1
+                stats.idle_sweeps += not len(singles)
+            if not len(singles):
+                continue
+
+            single_columns = columns[singles].reshape(-1)
+            if len(np.unique(single_columns)) < len(single_columns):
+                # Clashing singles, so insert them one at a time, in linear
+                # order, like `_put_many()`
+                for _flat_idx in singles:
+                    if _cells_flat[_flat_idx]:
+                        self._put(np.unravel_index(_flat_idx, self._shape))
+                continue
+
+            # The singles don't share any constraints, so none of them is a
+            # peer of another one
+            peers = _peers(self._shape)[singles].reshape(-1)
+            self._remove(np.unique(peers[_cells_flat[peers]]))
+
+    def _propagate(self, propagation='singles'):
+        """
+        Quick fill this board, and apply the elimination techniques of the
+        given propagation level until none of them eliminates anything.
+
+        Techniques are tried from the cheapest to the strongest, and the
+        board is quick filled again after every elimination, so the stronger
+        techniques only run when the cheaper ones are stuck. Nothing is
+        eliminated once a square, numrow, numcol or numbox is found empty.
+
+        Parameters
+        ----------
+        propagation : {'singles', 'locked', 'subsets', 'fish'}, optional
+            Propagation level. See `solve()`. Default is 'singles'.
+        """
+        techniques = tuple(itertools.chain.from_iterable(
+            _PROPAGATION_TECHNIQUES[level]
+            for level in _PROPAGATION_LEVELS[
+                :_PROPAGATION_LEVELS.index(propagation) + 1
+            ]
+        ))
+        stats = self._stats
+
+        self._quick_fill()
+        while techniques and self._constraint_counts().all():
+            if stats is not None:
+                start = time.perf_counter()
+            for technique in techniques:
+                removed = np.flatnonzero(technique(self._cells))
+                if len(removed):
+                    break
+            if stats is not None:
+                stats.propagation_time += time.perf_counter() - start
+                stats.eliminations += len(removed)
+            if not len(removed):
+                # Fixpoint reached
+                break
+            self._remove(removed)
+            self._quick_fill()
+
+    def _constraint_counts(self):
+        """
+        Count the candidates of every square, numrow, numcol and numbox.
+
+        Returns
+        -------
+        counts : numpy.ndarray of int and of shape (`_size` ** 2, 4)
+            Number of candidates per constraint. The first axis is the linear
+            index of the four fixed coordinates, (_p, _q, _r, _s), and the
+            second axis is the type of the constraint: square, numrow, numcol
+            and numbox, in this order.
+        """
+        if self._counts is not None:
+            counts = self._counts.reshape(len(_CONSTRAINT_AXES), -1)
+            return counts.T.astype(int)
+        return np.stack(
+            [
+                self._cells.sum(axis=axes).reshape(-1)
+                for axes in _CONSTRAINT_AXES
+            ],
+            axis=-1,
+        )
+
+    def _constraint_idx(self, _linear_idx, _constraint):
+        """
+        Return the coordinates of the given square, numrow, numcol or numbox.
 
-            for _linear_idx in range(np.prod(self._shape[:4])):
+        Parameters
+        ----------
+        _linear_idx : int between 0 and `_size` ** 2 - 1 inclusive
+            Linear index of the four fixed coordinates, (_p, _q, _r, _s).
+        _constraint : int between 0 and 3 inclusive
+            Type of the constraint: square, numrow, numcol or numbox.
 
-                # Fix four out of the six coordinates
-                _p, _q, _r, _s = np.unravel_index(_linear_idx, self._shape[:4])
+        Returns
+        -------
+        _idx : tuple of int or None of shape (6,)
+            The four fixed coordinates, with None for the two free ones.
+        """
+        kept_axes = _kept_axes(_CONSTRAINT_AXES[_constraint])
+        kept_shape = tuple(self._shape[axis] for axis in kept_axes)
+        _idx = [None] * len(self._shape)
+        for axis, i in zip(kept_axes,
+                           np.unravel_index(_linear_idx, kept_shape)):
+            _idx[axis] = int(i)
+        return tuple(_idx)
+
+    def _inconsistency_error(self, _linear_idx, _constraint):
+        """
+        Create the ConsistencyError describing the given empty constraint.
 
-                # Inspect a single square
-                x, y = self._cells[:, :, _p, _q, _r, _s].nonzero()
-                if len(x) == 1:
-                    self._put((x[0], y[0], _p, _q, _r, _s))
+        Parameters
+        ----------
+        _linear_idx : int between 0 and `_size` ** 2 - 1 inclusive
+            Linear index of the four fixed coordinates, (_p, _q, _r, _s).
+        _constraint : int between 0 and 3 inclusive
+            Type of the constraint: square, numrow, numcol or numbox.
 
-                # Inspect a number in a single row
-                x, y = self._cells[_p, _q, _r, _s, :, :].nonzero()
-                if len(x) == 1:
-                    self._put((_p, _q, _r, _s, x[0], y[0]))
+        Returns
+        -------
+        error : ConsistencyError
+        """
+        _idx = self._constraint_idx(_linear_idx, _constraint)
+        kept_axes = _kept_axes(_CONSTRAINT_AXES[_constraint])
+        _p, _q, _r, _s = (_idx[axis] for axis in kept_axes)
+        msg = _INCONSISTENCY_MESSAGES[_constraint].format(
+            _p * self._shape[kept_axes[1]] + _q,
+            _r * self._shape[kept_axes[3]] + _s,
+        )
+        return ConsistencyError(msg, _idx)
 
-                # Inspect a number in a single column
-                x, y = self._cells[_p, _q, :, :, _r, _s].nonzero()
-                if len(x) == 1:
-                    self._put((_p, _q, x[0], y[0], _r, _s))
+    def _empty_constraints(self):
+        """
+        Find every square, numrow, numcol and numbox without candidates.
 
-                # Inspect a number in a single box
-                x, y = self._cells[_p, _q, _r, :, _s, :].nonzero()
-                if len(x) == 1:
-                    self._put((_p, _q, _r, x[0], _s, y[0]))
+        Returns
+        -------
+        _idxs : list of tuple of int or None of shape (6,)
+            Coordinates of every empty constraint, in the same format as the
+            `_idx` attribute of the ConsistencyError raised by
+            `_check_consistency()`, and in the same order as they're checked
+            there. Empty if no inconsistency is found.
+        """
+        _linear_idxs, _constraints = (self._constraint_counts() == 0).nonzero()
+        return [
+            self._inconsistency_error(_linear_idx, _constraint)._idx
+            for _linear_idx, _constraint in zip(_linear_idxs, _constraints)
+        ]
 
     def _check_consistency(self):
         """
@@ -402,6 +1174,7 @@ class HB6DBoard(object):
 
         Note: this function doesn't guarantee that the board is invalid. It
         performs a simple check that might or might not indicate inconsistency.
+        Use `_empty_constraints()` to list every inconsistency found at once.
 
         Raises
         ------
@@ -411,43 +1184,19 @@ class HB6DBoard(object):
             Note: this function is not guaranteed to raise for every invalid
             sudoku board.
         """
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+        counts = self._constraint_counts()
+        if stats is not None:
+            stats.consistency_time += time.perf_counter() - start
+
+        if counts.all():
+            return
 
-        for _linear_idx in range(np.prod(self._shape[:4])):
-
-            # Fix four out of the six coordinates
-            _p, _q, _r, _s = np.unravel_index(_linear_idx, self._shape[:4])
-
-            # Inspect a single square
-            if np.count_nonzero(self._cells[:, :, _p, _q, _r, _s]) == 0:
-                msg = "Inconsistency found at _row {} and _col {}."
-                raise ConsistencyError(
-                    msg.format(3 * _p + _q, 3 * _r + _s),
-                    (None, None, _p, _q, _r, _s)
-                )
-
-            # Inspect a number in a single row
-            if np.count_nonzero(self._cells[_p, _q, _r, _s, :, :]) == 0:
-                msg = "Inconsistency found for _num {} in _row {}."
-                raise ConsistencyError(
-                    msg.format(3 * _p + _q, 3 * _r + _s),
-                    (_p, _q, _r, _s, None, None)
-                )
-
-            # Inspect a number in a single column
-            if np.count_nonzero(self._cells[_p, _q, :, :, _r, _s]) == 0:
-                msg = "Inconsistency found for _num {} in _col {}."
-                raise ConsistencyError(
-                    msg.format(3 * _p + _q, 3 * _r + _s),
-                    (_p, _q, None, None, _r, _s)
-                )
-
-            # Inspect a number in a single box
-            if np.count_nonzero(self._cells[_p, _q, _r, :, _s, :]) == 0:
-                msg = "Inconsistency found for _num {} in _box {}."
-                raise ConsistencyError(
-                    msg.format(3 * _p + _q, 3 * _r + _s),
-                    (_p, _q, _r, None, _s, None)
-                )
+        # Report the first empty constraint
+        _linear_idx, _constraint = divmod(int(np.argmin(counts)), 4)
+        raise self._inconsistency_error(_linear_idx, _constraint)
 
     def _first_empty_square(self):
         """
@@ -457,9 +1206,9 @@ class HB6DBoard(object):
         Returns
         -------
         _candidates : 2-tuple of arrays
-            All possible _num_div3 and _num_mod3 candidates in the empty square
+            All possible _num_div and _num_mod candidates in the empty square
             found. Zero-based.
-            (_num_div3_array, _num_mod3_array)
+            (_num_div_array, _num_mod_array)
         _square : 4-tuple of ints
             Zero-based 4-D coordinates of the found square.
             (_boxrow, _subrow, _boxcol, _subcol)
@@ -472,92 +1221,627 @@ class HB6DBoard(object):
             Note, that this either means the board is full, or that it's
             invalid (and some squares have no candidate numbers).
         """
-        for _linear_idx in range(np.prod(self._shape[:4])):
-
-            # Fix four out of six coordinates
-            _boxrow, _subrow, _boxcol, _subcol = (
-                np.unravel_index(_linear_idx, self._shape[:4])
-            )
-
-            # Inspect a single square
-            x, y = (
-                self._cells[:, :, _boxrow, _subrow, _boxcol, _subcol].nonzero()
-            )
-            if 1 < len(x):
-                # There are more than one candidate numbers in this square
-                _candidates = (x, y)
-                _square = (_boxrow, _subrow, _boxcol, _subcol)
-                return _candidates, _square
-        else:
+        counts = self._constraint_counts()[:, 0].reshape(self._shape[2:])
+        _linear_idxs = np.flatnonzero(counts > 1)
+        if not len(_linear_idxs):
             msg = "No empty square found."
             raise ValueError(msg)
 
-    def _recursive_solve(self):
+        # There are more than one candidate numbers in this square
+        _square = tuple(
+            int(i) for i in np.unravel_index(_linear_idxs[0], counts.shape)
+        )
+        _candidates = self._cells[(slice(None), slice(None)) + _square]
+        return _candidates.nonzero(), _square
+
+    def _constraint_cells(self, _linear_idx, _constraint):
+        """
+        List the candidates of the given square, numrow, numcol or numbox.
+
+        Parameters
+        ----------
+        _linear_idx : int between 0 and `_size` ** 2 - 1 inclusive
+            Linear index of the four fixed coordinates, (_p, _q, _r, _s).
+        _constraint : int between 0 and 3 inclusive
+            Type of the constraint: square, numrow, numcol or numbox.
+
+        Returns
+        -------
+        _idxs : list of tuple of int of shape (6,)
+            Coordinates of every candidate in the constraint, in linear order.
+        """
+        _idx = self._constraint_idx(_linear_idx, _constraint)
+        free_axes = _CONSTRAINT_AXES[_constraint]
+        x, y = self._cells[
+            tuple(slice(None) if i is None else i for i in _idx)
+        ].nonzero()
+        _idxs = []
+        for _x, _y in zip(x, y):
+            _cell_idx = list(_idx)
+            _cell_idx[free_axes[0]] = _x
+            _cell_idx[free_axes[1]] = _y
+            _idxs.append(tuple(_cell_idx))
+        return _idxs
+
+    def _fewest_candidates_constraint(self):
         """
-        Solve completely this board, in-place.
+        Find the square, numrow, numcol or numbox with the fewest (but more
+        than one) candidates. Return its candidates.
+
+        This is the "minimum remaining values" heuristic: branching on the
+        most constrained square, or on the number with the fewest valid
+        places left in a unit, keeps the search tree small.
+
+        Returns
+        -------
+        _idxs : list of tuple of int of shape (6,)
+            Coordinates of every candidate in the constraint found, in linear
+            order.
 
         Raises
         ------
-        ConsistencyError
-            If a clash is found during the solution.
+        ValueError
+            If every constraint has at most one candidate.
+
+            Note, that this either means the board is full, or that it's
+            invalid (and some constraints have no candidates).
         """
+        counts = self._constraint_counts()
+        # Ignore filled (and empty) constraints
+        counts[counts <= 1] = counts.size
+        _linear_idx, _constraint = divmod(int(np.argmin(counts)), 4)
+        if counts[_linear_idx, _constraint] == counts.size:
+            msg = "No constraint with multiple candidates found."
+            raise ValueError(msg)
+        return self._constraint_cells(_linear_idx, _constraint)
 
-        # Fill in some easy squares
-        self._quick_fill()
+    def _branching_cells(self, branching):
+        """
+        Find the candidates to try one by one at the next branching point.
+
+        Parameters
+        ----------
+        branching : {'mrv', 'first'}
+            Branching policy. See `solve()`.
 
-        # Raise if an inconsistency is found
-        self._check_consistency()
+        Returns
+        -------
+        _idxs : list of tuple of int of shape (6,)
+            Coordinates of the candidates to try, in order. Exactly one of
+            them is part of any given solution.
+
+        Raises
+        ------
+        ValueError
+            If there's nothing to branch on, i.e. every constraint has at most
+            one candidate.
+        """
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
 
-        # Find an empty square
         try:
-            tpl = self._first_empty_square()
-        except ValueError:
-            # Didn't raise due to inconsistency (so every square has at least
-            # one candidate), and no empty square found (i.e. squares have
-            # at most one candidate), so (one of) the solution(s) is found
-            return
-        else:
-            _candidates, _square = tpl
+            if branching == 'mrv':
+                return self._fewest_candidates_constraint()
+
+            _candidates, _square = self._first_empty_square()
             x, y = _candidates
-            _p, _q, _r, _s = _square
+            return [(_x, _y) + _square for _x, _y in zip(x, y)]
+        finally:
+            if stats is not None:
+                stats.branching_time += time.perf_counter() - start
 
-        # Try a different valid candidate on each iteration
-        for _num_div3, _num_mod3 in zip(x, y):
+    def _dancing_links(self):
+        """
+        Build the exact cover problem of this board.
 
-            # Deepcopy this board
-            child_board = copy.deepcopy(self)
-            # Insert this candidate number to the square
-            child_board._put((_num_div3, _num_mod3, _p, _q, _r, _s))
+        Every candidate is a row of the exact cover matrix, and every square,
+        numrow, numcol and numbox is a column.
 
-            # Try solving the slightly simpler board recursively
-            try:
-                child_board._recursive_solve()
-            except ConsistencyError:
-                # Clash found with this candidate number
-                del child_board
-                continue
-            # One solution found, so copy its data (the boolean array)
-            self._cells = child_board._cells  # noqa: F821
-            del child_board  # noqa: F821
+        Returns
+        -------
+        _flat_idxs : numpy.ndarray of int
+            Flat index of the candidate of every row.
+        dancing_links : DancingLinks
+        """
+        _flat_idxs = np.flatnonzero(self._cells)
+        dancing_links = DancingLinks(
+            len(_CONSTRAINT_AXES) * np.prod(self._shape[:4]),
+            _cover_columns(self._shape)[_flat_idxs].tolist(),
+        )
+        return _flat_idxs, dancing_links
+
+    def _dlx_solve(self):
+        """
+        Solve completely this board, in-place, as an exact cover problem.
+
+        Solve the problem built by `_dancing_links()` with Knuth's Algorithm
+        X.
+
+        Raises
+        ------
+        ConsistencyError
+            If the board has no solution.
+        """
+        _flat_idxs, dancing_links = self._dancing_links()
+        for rows in dancing_links.solutions():
+            # One solution found, so keep only the chosen candidates
+            _cells = np.zeros(self._shape, dtype=bool)
+            _cells.reshape(-1)[_flat_idxs[rows]] = True
+            self._cells = _cells
             return
 
-        else:
-            # No candidate number results in a valid solution
-            # This indicates an inconsistency (which is not detected by the
-            # simple `_check_inconsistency()` method)
-            raise ConsistencyError('No solution found.')
+        raise ConsistencyError('No solution found.')
 
-    def solve(self):
+    def solve(self, branching='mrv', backtracking='trail', algorithm='search',
+              stats=None, propagation='singles', cache=None):
         """
         Fill in this board with a solution.
 
+        Parameters
+        ----------
+        branching : {'mrv', 'first'}, optional
+            Branching policy, i.e. which candidates to try when the simple
+            techniques of quick filling get stuck.
+
+            - 'mrv': the candidates of the square, numrow, numcol or numbox
+              with the fewest candidates ("minimum remaining values").
+            - 'first': the candidates of the first square (in row-major
+              order) with more than one candidate.
+
+            Default is 'mrv'.
+        backtracking : {'trail', 'copy'}, optional
+            Backtracking mode, i.e. how to return to the last branching point
+            after a clash.
+
+            - 'trail': modify this board in-place, and undo the insertions
+              recorded on an undo trail.
+            - 'copy': try every candidate on a deep copy of the board.
+
+            Default is 'trail'.
+
+            Both `branching` and `backtracking` are ignored by the 'dlx'
+            algorithm.
+        algorithm : {'search', 'dlx'}, optional
+            Solving algorithm.
+
+            - 'search': repeatedly quick fill the board, and guess (i.e.
+              branch) when it gets stuck.
+            - 'dlx': solve the board as an exact cover problem with Knuth's
+              Algorithm X, using dancing links.
+
+            Default is 'search'.
+        stats : SolveStats or None, optional
+            If given, add the statistics of the search to it, e.g. to find
+            out why a puzzle is slow. Only the 'search' algorithm records
+            statistics. Default is None, i.e. don't record them.
+        propagation : {'singles', 'locked', 'subsets', 'fish'}, optional
+            Propagation level of the 'search' algorithm, i.e. the techniques
+            used to fill in the board between guesses. Every level also
+            applies the techniques of the previous ones.
+
+            - 'singles': hidden singles and unique candidates, see
+              `_quick_fill()`.
+            - 'locked': locked candidates, i.e. the intersections of boxes
+              with rows and columns.
+            - 'subsets': naked and hidden pairs and triples.
+            - 'fish': X-Wings, Swordfish and Jellyfish.
+
+            Stronger levels visit fewer nodes, but spend more time per node.
+            Default is 'singles'.
+        cache : SolutionCache, SolutionStore or None, optional
+            If given, look the outcome up in it before solving, and store it
+            after. Cached outcomes, including failures, leave this board
+            exactly as solving it would, but don't add to `stats`. Default is
+            None, i.e. always solve.
+
         Raises
         ------
         ConsistencyError
             If a clash is found during the solution.
+        ValueError
+            If the branching policy, the backtracking mode, the algorithm or
+            the propagation level is unknown.
+        """
+        _check_option(branching, _BRANCHING_POLICIES, 'branching policy')
+        _check_option(backtracking, _BACKTRACKING_MODES, 'backtracking mode')
+        _check_option(algorithm, _ALGORITHMS, 'algorithm')
+        _check_option(propagation, _PROPAGATION_LEVELS, 'propagation level')
+
+        if cache is None:
+            self._solve(branching, backtracking, algorithm, stats, propagation)
+            return
+
+        # The board and every option that can change the outcome, as bytes
+        # so that persistent stores can keep it too. The backtracking mode
+        # never changes it, and the 'dlx' algorithm ignores the other ones.
+        options = [algorithm]
+        if algorithm == 'search':
+            options += [branching, propagation]
+        key = '{}:{}:'.format(
+            'x'.join(map(str, self._shape[:2])), ':'.join(options),
+        ).encode('ascii') + self.to_bytes()
+        outcome = cache.get(key)
+        if outcome is None:
+            try:
+                self._solve(
+                    branching, backtracking, algorithm, stats, propagation
+                )
+            except ConsistencyError:
+                cache.put(key, (False, self.to_bytes()))
+                raise
+            cache.put(key, (True, self.to_bytes()))
+            return
+
+        solved, data = outcome
+        self._cells = self.from_bytes(data, self._shape[:2])._cells
+        if not solved:
+            raise ConsistencyError("No solution found.")
+
+    def _solve(self, branching, backtracking, algorithm, stats, propagation):
+        """
+        Fill in this board with a solution, with valid options. See `solve()`.
         """
+        self._stats = stats
         try:
-            self._recursive_solve()
+            if algorithm == 'dlx':
+                self._dlx_solve()
+            else:
+                search = Search(
+                    self, branching, backtracking, stats, propagation
+                )
+                try:
+                    state = search.run()
+                finally:
+                    search.close()
+                if state != Search.SOLVED:
+                    raise ConsistencyError('No solution found.')
         except ConsistencyError:
             msg = "No solution found."
             raise ConsistencyError(msg)
+        finally:
+            self._stats = None
+
+    def count_solutions(self, limit=2, branching='mrv', algorithm='search',
+                        propagation='singles'):
+        """
+        Count the solutions of this board, without modifying it.
+
+        The search stops as soon as `limit` solutions are found, so the
+        default limit of 2 is a quick check of whether the puzzle is proper,
+        i.e. whether its solution is unique.
+
+        Parameters
+        ----------
+        limit : int or None, optional
+            Maximum number of solutions to find. None means no limit, i.e.
+            count every solution. Default is 2.
+        branching : {'mrv', 'first'}, optional
+            Branching policy of the 'search' algorithm. See `solve()`.
+            Default is 'mrv'.
+        algorithm : {'search', 'dlx'}, optional
+            Solving algorithm. See `solve()`. Default is 'search'.
+        propagation : {'singles', 'locked', 'subsets', 'fish'}, optional
+            Propagation level of the 'search' algorithm. See `solve()`.
+            Default is 'singles'.
+
+        Returns
+        -------
+        count : int
+            Number of solutions, or `limit` if there are at least as many.
+
+        Raises
+        ------
+        ValueError
+            If the limit isn't positive, or if the branching policy, the
+            algorithm or the propagation level is unknown.
+        """
+        if limit is not None and limit < 1:
+            msg = "Limit must be positive, not {}."
+            raise ValueError(msg.format(limit))
+        _check_option(branching, _BRANCHING_POLICIES, 'branching policy')
+        _check_option(algorithm, _ALGORITHMS, 'algorithm')
+        _check_option(propagation, _PROPAGATION_LEVELS, 'propagation level')
+
+        if algorithm == 'dlx':
+            _, dancing_links = self._dancing_links()
+            solutions = itertools.islice(dancing_links.solutions(), limit)
+            return sum(1 for _ in solutions)
+
+        search = Search(self, branching, propagation=propagation)
+        try:
+            count = 0
+            while limit is None or count < limit:
+                if search.run() != Search.SOLVED:
+                    break
+                count += 1
+            return count
+        finally:
+            self._undo(0)
+            search.close()
+
+    def iter_solutions(self, branching='mrv', algorithm='search',
+                       propagation='singles'):
+        """
+        Lazily find every solution of this board, without modifying it.
+
+        Solutions are yielded as soon as they're found, and memory use is
+        proportional to the depth of the search, not to the number of
+        solutions. Stop iterating at any time to stop the search.
+
+        Parameters
+        ----------
+        branching : {'mrv', 'first'}, optional
+            Branching policy of the 'search' algorithm. See `solve()`.
+            Default is 'mrv'.
+        algorithm : {'search', 'dlx'}, optional
+            Solving algorithm. See `solve()`. Default is 'search'.
+        propagation : {'singles', 'locked', 'subsets', 'fish'}, optional
+            Propagation level of the 'search' algorithm. See `solve()`.
+            Default is 'singles'.
+
+        Returns
+        -------
+        solutions : iterator of numpy.ndarray of int and of shape (n, n)
+            Numbers of every solution, e.g. nine-by-nine. One-based.
+
+        Raises
+        ------
+        ValueError
+            If the branching policy, the algorithm or the propagation level
+            is unknown.
+        """
+        _check_option(branching, _BRANCHING_POLICIES, 'branching policy')
+        _check_option(algorithm, _ALGORITHMS, 'algorithm')
+        _check_option(propagation, _PROPAGATION_LEVELS, 'propagation level')
+        # The options are checked here rather than in the generator, so that
+        # unknown ones raise right away rather than on the first `next()`
+        return self._iter_solutions(branching, algorithm, propagation)
+
+    def _iter_solutions(self, branching, algorithm, propagation):
+        """
+        Lazily find every solution of this board. See `iter_solutions()`.
+        """
+        if algorithm == 'dlx':
+            _flat_idxs, dancing_links = self._dancing_links()
+            solution = HB6DBoard(self._shape[:2])
+            for rows in dancing_links.solutions():
+                solution._cells[...] = False
+                solution._cells.reshape(-1)[_flat_idxs[rows]] = True
+                yield solution._to_array()
+            return
+
+        # Search a copy, so that this board isn't left half-searched when
+        # the iteration is stopped early
+        board = copy.deepcopy(self)
+        search = Search(board, branching, propagation=propagation)
+        while search.run() == Search.SOLVED:
+            yield board._to_array()
+
+
+def _unpickle(cls, data, box_shape):
+    """
+    Recreate a pickled HB6DBoard instance. See `HB6DBoard.__reduce__()`.
+    """
+    return cls.from_bytes(data, box_shape)
+
+
+class Search(object):
+    """
+    Resumable depth-first search for the solutions of a HB6DBoard.
+
+    Every node of the search tree is quick filled and checked for
+    consistency, and then branches on the candidates chosen by the
+    branching policy, just like `HB6DBoard.solve()` does. The branch points
+    are kept on an explicit stack instead of the Python call stack, so the
+    search can be paused and resumed, and its depth isn't limited by the
+    recursion limit of the interpreter.
+
+    The board is searched in-place, and must not be modified by anything
+    else until `close()` is called. In the 'trail' backtracking mode, the
+    undo trail of the board records every change from the start of the
+    search, so ``board._undo(0)`` restores the board afterwards.
+
+    Attributes
+    ----------
+    board : HB6DBoard
+        The board being searched.
+    state : {Search.PAUSED, Search.SOLVED, Search.EXHAUSTED}
+        State after the last call of `run()`.
+    nodes : int
+        Number of nodes visited so far.
+    """
+
+    # States of the search, see `run()`
+    PAUSED = 'paused'
+    SOLVED = 'solved'
+    EXHAUSTED = 'exhausted'
+
+    def __init__(self, board, branching='mrv', backtracking='trail',
+                 stats=None, propagation='singles'):
+        """
+        Initialise this Search object, starting at the root of the search
+        tree, i.e. the board as it is.
+
+        Parameters
+        ----------
+        board : HB6DBoard
+            Board to search in-place.
+        branching : {'mrv', 'first'}, optional
+            Branching policy. See `HB6DBoard.solve()`. Default is 'mrv'.
+        backtracking : {'trail', 'copy'}, optional
+            How to return to a branch point: undo the changes recorded on
+            the undo trail of the board, or copy back the candidates saved at
+            the branch point. Default is 'trail'.
+        stats : SolveStats or None, optional
+            If given, add the statistics of the search to it. Default is
+            None.
+        propagation : {'singles', 'locked', 'subsets', 'fish'}, optional
+            Propagation level. See `HB6DBoard.solve()`. Default is
+            'singles'.
+
+        Raises
+        ------
+        ValueError
+            If the branching policy, the backtracking mode or the propagation
+            level is unknown.
+        """
+        _check_option(branching, _BRANCHING_POLICIES, 'branching policy')
+        _check_option(backtracking, _BACKTRACKING_MODES, 'backtracking mode')
+        _check_option(propagation, _PROPAGATION_LEVELS, 'propagation level')
+
+        self.board = board
+        self._branching = branching
+        self._backtracking = backtracking
+        self._stats = stats
+        self._propagation = propagation
+        self.state = Search.PAUSED
+        self.nodes = 0
+        # Branch points from the root down: the restore point of the board,
+        # the candidates to try, and the index of the next one to try
+        self._stack = []
+        # Whether the board is at a node that isn't visited yet
+        self._at_new_node = True
+
+        if backtracking == 'trail':
+            board._trail = []
+        board._start_counting()
+
+    def close(self):
+        """
+        Stop recording the changes of the board, i.e. its undo trail and its
+        candidate counts. The search can't be resumed afterwards.
+        """
+        self.board._trail = None
+        self.board._counts = None
+        self.board._queue = None
+
+    def _restore_point(self):
+        """
+        Return what's needed to restore the board to its current state.
+        """
+        if self._backtracking == 'trail':
+            return len(self.board._trail)
+        return self.board._cells.copy(), self.board._counts.copy()
+
+    def _restore(self, restore_point):
+        """
+        Restore the board to the state of the given restore point.
+        """
+        if self._backtracking == 'trail':
+            self.board._undo(restore_point)
+        else:
+            _cells, counts = restore_point
+            np.copyto(self.board._cells, _cells)
+            np.copyto(self.board._counts, counts)
+
+    def _visit(self):
+        """
+        Visit the node of the current state of the board: quick fill it,
+        check its consistency, and push a branch point if needed.
+
+        Returns
+        -------
+        solved : bool
+            Whether the board is solved.
+        """
+        board = self.board
+        stats = self._stats
+        if stats is not None:
+            stats.nodes += 1
+            stats.max_depth = max(stats.max_depth, len(self._stack))
+
+        # Fill in some easy squares
+        board._propagate(self._propagation)
+
+        # A dead end if an inconsistency is found
+        try:
+            board._check_consistency()
+        except ConsistencyError:
+            return False
+
+        # Find the candidates to branch on
+        try:
+            _idxs = board._branching_cells(self._branching)
+        except ValueError:
+            # Nothing to branch on, so a solution is found
+            return True
+
+        self._stack.append([self._restore_point(), _idxs, 0])
+        return False
+
+    def _next_branch(self):
+        """
+        Backtrack to the deepest branch point with candidates left, and
+        insert its next candidate.
+
+        Returns
+        -------
+        found : bool
+            False if every branch point is exhausted.
+        """
+        stats = self._stats
+        while self._stack:
+            branch_point = self._stack[-1]
+            restore_point, _idxs, i = branch_point
+            if i:
+                # Return from the subtree of the previous candidate
+                if stats is not None:
+                    stats.backtracks += 1
+                self._restore(restore_point)
+
+            if i < len(_idxs):
+                branch_point[2] = i + 1
+                if stats is not None:
+                    stats.guesses += 1
+                self.board._put(_idxs[i])
+                return True
+
+            self._stack.pop()
+
+        return False
+
+    def run(self, max_nodes=None):
+        """
+        Search until the next solution is found, every node is visited, or
+        `max_nodes` more nodes are visited, whichever comes first.
+
+        Call it again to resume the search, e.g. to find the next solution.
+
+        Parameters
+        ----------
+        max_nodes : int or None, optional
+            Maximum number of nodes to visit in this call. Default is None,
+            i.e. no limit.
+
+        Returns
+        -------
+        state : {Search.PAUSED, Search.SOLVED, Search.EXHAUSTED}
+            PAUSED if `max_nodes` nodes are visited, SOLVED if the board
+            holds a solution, and EXHAUSTED if there are no more solutions.
+        """
+        if self.state == Search.EXHAUSTED:
+            return self.state
+
+        board = self.board
+        board._stats = self._stats
+        n_nodes = 0
+        try:
+            while True:
+                if self._at_new_node:
+                    if max_nodes is not None and n_nodes >= max_nodes:
+                        self.state = Search.PAUSED
+                        return self.state
+                    n_nodes += 1
+                    self.nodes += 1
+                    self._at_new_node = False
+                    if self._visit():
+                        self.state = Search.SOLVED
+                        return self.state
+
+                if not self._next_branch():
+                    self.state = Search.EXHAUSTED
+                    return self.state
+                self._at_new_node = True
+        finally:
+            board._stats = None
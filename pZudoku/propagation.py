@@ -0,0 +1,222 @@
+"""
+Elimination techniques for the candidates of a HB6DBoard, beyond the singles
+of `HB6DBoard._quick_fill()`.
+
+Every technique takes the boolean array of candidates of a board, indexed by
+(_num_div, _num_mod, _boxrow, _subrow, _boxcol, _subcol), and returns a
+boolean array of the same shape, True for every candidate it eliminates. The
+given array isn't modified.
+"""
+import functools
+import itertools
+
+import numpy as np
+
+
+# Permutation of the axes swapping the rows and the columns of the board
+_TRANSPOSE_AXES = (0, 1, 4, 5, 2, 3)
+
+# Axes of the candidates, ordered as (plane, plane, line, line, position,
+# position), of the 2-D planes searched for subsets
+_SUBSET_AXES = (
+    # Hidden subsets: the numbers of every row, column and box, and the
+    # squares they can go in
+    (2, 3, 0, 1, 4, 5),
+    (4, 5, 0, 1, 2, 3),
+    (2, 4, 0, 1, 3, 5),
+    # Naked subsets: the squares of every row, column and box, and their
+    # candidate numbers
+    (2, 3, 4, 5, 0, 1),
+    (4, 5, 2, 3, 0, 1),
+    (2, 4, 3, 5, 0, 1),
+)
+
+# Axes of the candidates, ordered like `_SUBSET_AXES`, of the 2-D planes
+# searched for fish
+_FISH_AXES = (
+    # The rows of every number, and the columns it can go in
+    (0, 1, 2, 3, 4, 5),
+    # The columns of every number, and the rows it can go in
+    (0, 1, 4, 5, 2, 3),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _subset_members(n_lines, size):
+    """
+    Tabulate every subset of the given size of `n_lines` lines.
+
+    Returns
+    -------
+    members : numpy.ndarray of float and of shape (n_subsets, n_lines)
+        1 where the line is in the subset, else 0. Read-only.
+    """
+    subsets = list(itertools.combinations(range(n_lines), size))
+    # Floats, so that matrix products are done by BLAS
+    members = np.zeros((len(subsets), n_lines))
+    members[np.arange(len(subsets))[:, np.newaxis], subsets] = 1
+    members.flags.writeable = False
+    return members
+
+
+def _subsets(planes, size):
+    """
+    Find the candidates eliminated by the subsets of lines of the given size
+    of 2-D planes where every line takes exactly one position, and every
+    position is taken by at most one line.
+
+    If `size` lines of a plane have only `size` positions between them, they
+    take all of these positions, which can be eliminated from the other
+    lines.
+
+    Parameters
+    ----------
+    planes : numpy.ndarray of bool and of shape (n_planes, n_lines, n)
+        Candidate positions of every line of every plane.
+    size : int
+        Number of lines per subset.
+
+    Returns
+    -------
+    eliminated : numpy.ndarray of bool and of the same shape as `planes`
+    """
+    members = _subset_members(planes.shape[1], size)
+    # Positions of every subset of lines of every plane, indexed by [plane,
+    # subset, position], kept only if they're locked to the subset
+    positions = np.matmul(members, planes.astype(float)) > 0
+    positions &= positions.sum(axis=2, keepdims=True) == size
+    # Eliminate them from the lines outside the subset
+    outside = 1 - members.T
+    return planes & (np.matmul(outside, positions.astype(float)) > 0)
+
+
+def _locked_rows(cells):
+    """
+    Find the candidates eliminated by the locked candidates where the rows
+    and the boxes intersect.
+    """
+    # Whether every number has candidates where every row meets every box,
+    # indexed by (_num_div, _num_mod, _boxrow, _subrow, _boxcol)
+    segments = cells.any(axis=5)
+    # "Pointing": the only segment of the number in its box, so the number
+    # can be eliminated from the rest of the row
+    pointing = segments & (segments.sum(axis=3, keepdims=True) == 1)
+    # "Claiming": the only segment of the number in its row, so the number
+    # can be eliminated from the rest of the box
+    claiming = segments & (segments.sum(axis=4, keepdims=True) == 1)
+    eliminated = np.logical_or(
+        pointing.sum(axis=4, keepdims=True) > pointing,
+        claiming.sum(axis=3, keepdims=True) > claiming,
+    )
+    return cells & eliminated[..., np.newaxis]
+
+
+def locked_candidates(cells):
+    """
+    Find the candidates eliminated by locked candidates.
+
+    Where a box and a row (or column) intersect, a number whose candidates in
+    the box are all in the intersection can be eliminated from the rest of
+    the row ("pointing"), and a number whose candidates in the row are all in
+    the intersection can be eliminated from the rest of the box ("claiming").
+
+    Parameters
+    ----------
+    cells : numpy.ndarray of bool and of shape (n, m, m, n, n, m)
+        Candidates of a board.
+
+    Returns
+    -------
+    eliminated : numpy.ndarray of bool and of the same shape as `cells`
+    """
+    # Intersections with the columns are intersections with the rows of the
+    # transposed board
+    return _locked_rows(cells) | _locked_rows(
+        cells.transpose(_TRANSPOSE_AXES)
+    ).transpose(_TRANSPOSE_AXES)
+
+
+def _planes(cells, axes):
+    """
+    Return the 2-D planes of the given axes of the candidates, indexed by
+    [plane, line, position]. See `_SUBSET_AXES`.
+    """
+    planes = cells.transpose(axes)
+    shape = planes.shape
+    return planes.reshape(
+        shape[0] * shape[1], shape[2] * shape[3], shape[4] * shape[5]
+    )
+
+
+def _from_planes(planes, axes, shape):
+    """
+    Return the candidates of an array of the given shape from its 2-D planes
+    of the given axes. This is the inverse of `_planes()`.
+    """
+    planes_shape = tuple(shape[axis] for axis in axes)
+    return planes.reshape(planes_shape).transpose(np.argsort(axes))
+
+
+def _all_subsets(cells, axes, size):
+    """
+    Find the candidates eliminated by the subsets of the given size of the
+    2-D planes of every given axes.
+    """
+    # Search every plane at once
+    eliminated = _subsets(
+        np.concatenate([_planes(cells, plane_axes) for plane_axes in axes]),
+        size,
+    )
+    return np.logical_or.reduce([
+        _from_planes(planes, plane_axes, cells.shape)
+        for planes, plane_axes in zip(np.split(eliminated, len(axes)), axes)
+    ])
+
+
+def subsets(cells, size):
+    """
+    Find the candidates eliminated by naked and hidden subsets.
+
+    If `size` squares of a row, column or box have only `size` candidate
+    numbers between them ("naked subset"), these numbers can be eliminated
+    from the other squares of the unit. If `size` numbers can only go in
+    `size` squares of a unit ("hidden subset"), every other number can be
+    eliminated from these squares.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray of bool and of shape (n, m, m, n, n, m)
+        Candidates of a board.
+    size : int
+        Number of squares or numbers per subset, e.g. 2 for pairs and 3 for
+        triples.
+
+    Returns
+    -------
+    eliminated : numpy.ndarray of bool and of the same shape as `cells`
+    """
+    return _all_subsets(cells, _SUBSET_AXES, size)
+
+
+def fish(cells, size):
+    """
+    Find the candidates eliminated by fish, i.e. X-Wings (of size 2),
+    Swordfish (of size 3) and Jellyfish (of size 4).
+
+    If a number can only go in `size` columns of `size` rows, it must go in
+    these columns in these rows, so it can be eliminated from the other rows
+    of these columns, and vice versa for rows and columns. These are the
+    subsets of the row-by-column plane of every number.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray of bool and of shape (n, m, m, n, n, m)
+        Candidates of a board.
+    size : int
+        Number of rows (or columns) per fish.
+
+    Returns
+    -------
+    eliminated : numpy.ndarray of bool and of the same shape as `cells`
+    """
+    return _all_subsets(cells, _FISH_AXES, size)
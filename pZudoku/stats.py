@@ -0,0 +1,90 @@
+"""
+Counters and timers of the search of `HB6DBoard.solve()`.
+"""
+
+
+# Attributes of SolveStats that are added up when aggregating
+_COUNTERS = (
+    'nodes', 'guesses', 'backtracks', 'puts', 'sweeps', 'idle_sweeps',
+    'eliminations',
+)
+
+# Attributes of SolveStats that are maximised when aggregating
+_MAXIMA = ('max_depth',)
+
+# Attributes of SolveStats that are times in seconds, added up when
+# aggregating
+_TIMERS = ('propagation_time', 'consistency_time', 'branching_time')
+
+
+class SolveStats(object):
+    """
+    Statistics of one or more searches.
+
+    Pass an instance to `HB6DBoard.solve()` to fill it in. Instances can be
+    added up to aggregate the statistics of several puzzles, e.g.
+    ``sum(stats_list, SolveStats())``.
+
+    Attributes
+    ----------
+    nodes : int
+        Number of nodes of the search tree, i.e. boards quick filled and
+        checked for consistency.
+    guesses : int
+        Number of candidates tried at branching points.
+    backtracks : int
+        Number of guesses that led to a clash.
+    puts : int
+        Number of `_put()` calls, i.e. single insertions.
+    sweeps : int
+        Number of passes of `_quick_fill()`, i.e. over the squares, numrows,
+        numcols and numboxes queued since the previous pass.
+    idle_sweeps : int
+        Number of those passes that didn't insert anything.
+    eliminations : int
+        Number of candidates eliminated by the techniques of the propagation
+        level, beyond the singles of `_quick_fill()`.
+    max_depth : int
+        Largest number of nested guesses.
+    propagation_time : float
+        Time in seconds spent in `_quick_fill()` and in the elimination
+        techniques.
+    consistency_time : float
+        Time in seconds spent in `_check_consistency()`.
+    branching_time : float
+        Time in seconds spent choosing the candidates to branch on.
+    """
+
+    def __init__(self):
+        for name in _COUNTERS + _MAXIMA:
+            setattr(self, name, 0)
+        for name in _TIMERS:
+            setattr(self, name, 0.0)
+
+    def __iadd__(self, other):
+        for name in _COUNTERS + _TIMERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for name in _MAXIMA:
+            setattr(self, name, max(getattr(self, name), getattr(other, name)))
+        return self
+
+    def __add__(self, other):
+        result = SolveStats()
+        result += self
+        result += other
+        return result
+
+    def as_dict(self):
+        """
+        Return every statistic in a dict, e.g. for serialising to JSON.
+        """
+        return {
+            name: getattr(self, name)
+            for name in _COUNTERS + _MAXIMA + _TIMERS
+        }
+
+    def __repr__(self):
+        return 'SolveStats({})'.format(', '.join(
+            '{}={!r}'.format(name, getattr(self, name))
+            for name in _COUNTERS + _MAXIMA + _TIMERS
+        ))
@@ -0,0 +1,239 @@
+"""
+Persistent solution store backed by a local SQLite database, for reusing
+solutions across processes and runs.
+"""
+import sqlite3
+import threading
+import time
+
+
+# Maximum number of keys per query of `SolutionStore.get_many()`, below the
+# default limit of 999 parameters of SQLite
+_MAX_QUERY_KEYS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key BLOB PRIMARY KEY,
+    status INTEGER NOT NULL,
+    solution BLOB NOT NULL,
+    used REAL NOT NULL
+)
+"""
+
+
+class SolutionStore(object):
+    """
+    Persistent store of solve outcomes, keyed on bytes, in a SQLite database.
+
+    The database is in write-ahead logging (WAL) mode, so that several
+    processes can read it while one writes. Lookups only read it: the times
+    of the last lookups, which `compact()` evicts by, are kept in memory and
+    written by `compact()` and `close()`. A store can be shared between the
+    threads of a process, and used as a context manager to close it.
+
+    Like a `SolutionCache`, it can be passed to `HB6DBoard.solve()`, and it
+    can also be passed to `solve_many()` and `solve_parallel()` of the
+    `batch` module.
+
+    Parameters
+    ----------
+    path : str
+        Path of the database file, created if it doesn't exist.
+    timeout : float, optional
+        Number of seconds to wait for another process to release a lock on
+        the database. Default is 30.
+
+    Attributes
+    ----------
+    path : str
+    hits : int
+        Number of keys looked up and found by this instance.
+    misses : int
+        Number of keys looked up and not found by this instance.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Time of the last lookup of every key found and not written yet
+        self._used = {}
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Write the times of the last lookups, and close the database
+        connection.
+        """
+        with self._lock:
+            self._flush_used()
+            self._connection.close()
+
+    def _flush_used(self):
+        """
+        Write the times of the last lookups in one transaction. The caller
+        must hold the lock.
+        """
+        if not self._used:
+            return
+        with self._connection:
+            # Keep the time of a later write by another process
+            self._connection.executemany(
+                'UPDATE solutions SET used = MAX(used, ?) WHERE key = ?',
+                [(used, key) for key, used in self._used.items()],
+            )
+        self._used = {}
+
+    def __len__(self):
+        with self._lock:
+            (count,), = self._connection.execute(
+                'SELECT COUNT(*) FROM solutions'
+            )
+        return count
+
+    def get_many(self, keys):
+        """
+        Look up several outcomes at once.
+
+        Parameters
+        ----------
+        keys : iterable of bytes
+
+        Returns
+        -------
+        outcomes : dict
+            (status, solution) tuple of every key found, by key.
+        """
+        keys = list(dict.fromkeys(bytes(key) for key in keys))
+        outcomes = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), _MAX_QUERY_KEYS):
+                chunk = keys[start:start + _MAX_QUERY_KEYS]
+                placeholders = ', '.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    'SELECT key, status, solution FROM solutions '
+                    'WHERE key IN ({})'.format(placeholders),
+                    chunk,
+                ).fetchall()
+                for key, status, solution in rows:
+                    outcomes[bytes(key)] = (status, bytes(solution))
+            # Record the use of the keys found, for `compact()`, without
+            # writing to the database, so that lookups never wait for or
+            # hold its write lock
+            self._used.update(dict.fromkeys(outcomes, now))
+            self.hits += len(outcomes)
+            self.misses += len(keys) - len(outcomes)
+        return outcomes
+
+    def put_many(self, outcomes):
+        """
+        Store several outcomes at once, in one transaction, replacing the
+        ones already stored under the same keys.
+
+        Parameters
+        ----------
+        outcomes : dict or iterable of tuple
+            (status, solution) tuple by key, or (key, (status, solution))
+            pairs, where `key` and `solution` are bytes and `status` is an
+            int.
+        """
+        if isinstance(outcomes, dict):
+            outcomes = outcomes.items()
+        now = time.time()
+        rows = [
+            (bytes(key), int(status), bytes(solution), now)
+            for key, (status, solution) in outcomes
+        ]
+        with self._lock, self._connection:
+            for key, _, _, _ in rows:
+                self._used.pop(key, None)
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO solutions (key, status, solution, '
+                'used) VALUES (?, ?, ?, ?)',
+                rows,
+            )
+
+    def get(self, key):
+        """
+        Look up an outcome.
+
+        Parameters
+        ----------
+        key : bytes
+
+        Returns
+        -------
+        outcome : tuple or None
+            (status, solution) tuple stored under `key`, or None if there's
+            none.
+        """
+        return self.get_many([key]).get(bytes(key))
+
+    def put(self, key, outcome):
+        """
+        Store an outcome.
+
+        Parameters
+        ----------
+        key : bytes
+        outcome : tuple
+            (status, solution) tuple, where `status` is an int and `solution`
+            is bytes.
+        """
+        self.put_many([(key, outcome)])
+
+    def compact(self, max_entries=None):
+        """
+        Evict the least recently used outcomes, and reclaim the space of the
+        database file.
+
+        Parameters
+        ----------
+        max_entries : int or None, optional
+            Number of outcomes to keep. Default is None, i.e. keep them all
+            and only reclaim the space.
+
+        Returns
+        -------
+        n_evicted : int
+            Number of outcomes evicted.
+
+        Raises
+        ------
+        ValueError
+            If `max_entries` is negative.
+        """
+        if max_entries is not None and max_entries < 0:
+            msg = "Maximum number of entries can't be negative, not {}."
+            raise ValueError(msg.format(max_entries))
+
+        n_evicted = 0
+        with self._lock:
+            self._flush_used()
+            if max_entries is not None:
+                with self._connection:
+                    n_evicted = self._connection.execute(
+                        'DELETE FROM solutions WHERE key NOT IN ('
+                        'SELECT key FROM solutions ORDER BY used DESC '
+                        'LIMIT ?)',
+                        (max_entries,),
+                    ).rowcount
+            # VACUUM can't run inside a transaction
+            self._connection.execute('VACUUM')
+        return n_evicted
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.path)
@@ -0,0 +1,123 @@
+"""
+Original implementations of `HB6DBoard` methods, kept as references for the
+tests of their replacements.
+"""
+import copy
+
+from pZudoku.hb6d_board import ConsistencyError, HB6DBoard, _default_box_shape
+
+
+def from_array_sequential(array, box_shape=None):
+    """
+    Create a HB6DBoard instance from the given 2-D array, inserting the
+    givens one by one.
+
+    This is the original implementation of `HB6DBoard.from_array()`. Unlike
+    the vectorised version, it only reports the first clashing given.
+
+    Parameters
+    ----------
+    array : array_like of int
+        Numbers of each square, with zeros (or anything else) for empty
+        squares.
+    box_shape : tuple of int or None, optional
+        Number of rows and columns of a box. See `HB6DBoard.from_array()`.
+
+    Returns
+    -------
+    board : HB6DBoard
+    """
+    if box_shape is None:
+        box_shape = _default_box_shape(len(array))
+    board = HB6DBoard(box_shape)
+    if len(array) != board._size:
+        msg = "Expected {} rows for boxes of shape {!r}, got {}."
+        raise ValueError(msg.format(board._size, box_shape, len(array)))
+
+    for _row, row in enumerate(array):
+        for _col, number in enumerate(row):
+            if number in range(1, board._size + 1):
+                _num = number - 1
+                _idx = board._num_row_col_to_idx(_num, _row, _col)
+                try:
+                    board._put(_idx)
+                except ValueError:
+                    msg = "Clash found during instantiation: {} ({}, {})."
+                    raise ConsistencyError(
+                        msg.format(number, _row + 1, _col + 1)
+                    )
+
+    return board
+
+
+def recursive_solve(board, branching='mrv', depth=0):
+    """
+    Solve completely the given board, in-place, by recursion.
+
+    This is the original implementation of the 'copy' backtracking mode of
+    `HB6DBoard.solve()`, which now uses the iterative `Search` instead. It
+    finds the same solution, but risks the recursion limit of the
+    interpreter on deep searches.
+
+    Parameters
+    ----------
+    board : HB6DBoard
+        Board to solve, in-place.
+    branching : {'mrv', 'first'}, optional
+        Branching policy. See `HB6DBoard.solve()`. Default is 'mrv'.
+    depth : int, optional
+        Number of guesses made so far. Default is 0.
+
+    Raises
+    ------
+    ConsistencyError
+        If a clash is found during the solution.
+    """
+    stats = board._stats
+    if stats is not None:
+        stats.nodes += 1
+        stats.max_depth = max(stats.max_depth, depth)
+
+    # Fill in some easy squares
+    board._quick_fill()
+
+    # Raise if an inconsistency is found
+    board._check_consistency()
+
+    # Find the candidates to branch on
+    try:
+        _idxs = board._branching_cells(branching)
+    except ValueError:
+        # Didn't raise due to inconsistency (so every square has at least
+        # one candidate), and nothing to branch on (i.e. squares have at most
+        # one candidate), so (one of) the solution(s) is found
+        return
+
+    # Try a different valid candidate on each iteration
+    for _idx in _idxs:
+
+        # Deepcopy the board, but keep recording to the same statistics
+        child_board = copy.deepcopy(board)
+        child_board._stats = stats
+        # Insert this candidate
+        if stats is not None:
+            stats.guesses += 1
+        child_board._put(_idx)
+
+        # Try solving the slightly simpler board recursively
+        try:
+            recursive_solve(child_board, branching, depth + 1)
+        except ConsistencyError:
+            # Clash found with this candidate
+            if stats is not None:
+                stats.backtracks += 1
+            continue
+        # One solution found, so copy its data (the boolean array)
+        board._cells = child_board._cells
+        board._counts = child_board._counts
+        return
+
+    # No candidate results in a valid solution
+    # This indicates an inconsistency (which is not detected by the simple
+    # `_check_consistency()` method)
+    raise ConsistencyError('No solution found.')
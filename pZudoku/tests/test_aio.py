@@ -0,0 +1,114 @@
+import asyncio
+import concurrent.futures
+import unittest
+
+import numpy as np
+
+from pZudoku.aio import solve
+from pZudoku.benchmarks.puzzles import NO_SOLUTION_PUZZLE, PUZZLES
+from pZudoku.hb6d_board import ConsistencyError, HB6DBoard
+from pZudoku.stats import SolveStats
+
+
+def _slow_board():
+    # Searching an empty 25-by-25 board takes seconds
+    return HB6DBoard((5, 5))
+
+
+class TestSolve(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.executor = concurrent.futures.ThreadPoolExecutor(1)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.loop.close()
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_solve(self):
+        expected = HB6DBoard.from_array(PUZZLES['hardest'])
+        expected.solve()
+        for mode in ('yield', 'executor'):
+            with self.subTest(mode=mode):
+                board = HB6DBoard.from_array(PUZZLES['hardest'])
+                stats = SolveStats()
+                self._run(solve(
+                    board, stats=stats, mode=mode, nodes_per_slice=2,
+                    executor=self.executor,
+                ))
+                np.testing.assert_array_equal(board._cells, expected._cells)
+                self.assertGreater(stats.nodes, 2)
+                self.assertIsNone(board._trail)
+
+    def test_no_solution(self):
+        for mode in ('yield', 'executor'):
+            with self.subTest(mode=mode):
+                board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+                with self.assertRaises(ConsistencyError):
+                    self._run(solve(board, mode=mode))
+
+    def test_timeout(self):
+        for mode in ('yield', 'executor'):
+            with self.subTest(mode=mode):
+                board = _slow_board()
+                stats = SolveStats()
+                with self.assertRaises(asyncio.TimeoutError):
+                    self._run(asyncio.wait_for(
+                        solve(board, stats=stats, mode=mode,
+                              executor=self.executor),
+                        0.05,
+                    ))
+                # The search is stopped, and the board restored
+                nodes = stats.nodes
+                self._run(asyncio.sleep(0.05))
+                self.assertEqual(stats.nodes, nodes)
+                self.assertTrue(board._cells.all())
+                self.assertIsNone(board._trail)
+
+    def test_other_tasks_run(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(self.loop.time())
+                await asyncio.sleep(0.001)
+
+        async def main(mode):
+            task = asyncio.ensure_future(ticker())
+            try:
+                await asyncio.wait_for(
+                    solve(_slow_board(), mode=mode, executor=self.executor),
+                    0.2,
+                )
+            except asyncio.TimeoutError:
+                pass
+            task.cancel()
+
+        for mode in ('yield', 'executor'):
+            with self.subTest(mode=mode):
+                del ticks[:]
+                self._run(main(mode))
+                self.assertGreater(len(ticks), 10)
+
+    def test_cancel(self):
+        async def main():
+            task = asyncio.ensure_future(solve(_slow_board()))
+            await asyncio.sleep(0.02)
+            task.cancel()
+            await asyncio.wait([task])
+            return task
+
+        task = self._run(main())
+        self.assertTrue(task.cancelled())
+
+    def test_invalid_options(self):
+        board = HB6DBoard.from_array(PUZZLES['easy'])
+        with self.assertRaises(ValueError):
+            self._run(solve(board, mode='thread'))
+        with self.assertRaises(ValueError):
+            self._run(solve(board, nodes_per_slice=0))
+        with self.assertRaises(ValueError):
+            self._run(solve(board, propagation='pairs'))
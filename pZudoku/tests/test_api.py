@@ -29,3 +29,42 @@ class TestReadmeExample(unittest.TestCase):
         str(my_board)
 
         # Then there's no error
+
+
+class TestBoardClass(unittest.TestCase):
+
+    def test_default_backend(self):
+        from pZudoku.api import Board, board_class
+
+        self.assertIs(board_class(), Board)
+
+    def test_backends_agree(self):
+        # Given
+        squares = [
+            [4, 0, 0, 0, 0, 0, 8, 0, 5],
+            [0, 3, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 7, 0, 0, 0, 0, 0],
+            [0, 2, 0, 0, 0, 0, 0, 6, 0],
+            [0, 0, 0, 0, 8, 0, 4, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0, 0],
+            [0, 0, 0, 6, 0, 3, 0, 7, 0],
+            [5, 0, 0, 2, 0, 0, 0, 0, 0],
+            [1, 0, 4, 0, 0, 0, 0, 0, 0],
+        ]
+        from pZudoku.api import BACKENDS, board_class
+        solutions = []
+
+        # When
+        for backend in BACKENDS:
+            my_board = board_class(backend).from_array(squares)
+            my_board.solve()
+            solutions.append(str(my_board))
+
+        # Then
+        self.assertEqual(len(set(solutions)), 1)
+
+    def test_unknown_backend(self):
+        from pZudoku.api import board_class
+
+        with self.assertRaises(ValueError):
+            board_class('dlx')
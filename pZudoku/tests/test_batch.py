@@ -0,0 +1,197 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from pZudoku.batch import (
+    ERROR,
+    NO_SOLUTION,
+    SOLVED,
+    SOLVED_BY_SEARCH,
+    solve_many,
+    solve_parallel,
+)
+from pZudoku.benchmarks.puzzles import NO_SOLUTION_PUZZLE
+from pZudoku.stats import SolveStats
+
+
+# Solved completely by quick filling
+EASY_PUZZLE = [
+    [0, 0, 3, 0, 2, 0, 6, 0, 0],
+    [9, 0, 0, 3, 0, 5, 0, 0, 1],
+    [0, 0, 1, 8, 0, 6, 4, 0, 0],
+    [0, 0, 8, 1, 0, 2, 9, 0, 0],
+    [7, 0, 0, 0, 0, 0, 0, 0, 8],
+    [0, 0, 6, 7, 0, 8, 2, 0, 0],
+    [0, 0, 2, 6, 0, 9, 5, 0, 0],
+    [8, 0, 0, 2, 0, 3, 0, 0, 9],
+    [0, 0, 5, 0, 1, 0, 3, 0, 0],
+]
+
+EASY_SOLUTION = [
+    [4, 8, 3, 9, 2, 1, 6, 5, 7],
+    [9, 6, 7, 3, 4, 5, 8, 2, 1],
+    [2, 5, 1, 8, 7, 6, 4, 9, 3],
+    [5, 4, 8, 1, 3, 2, 9, 7, 6],
+    [7, 2, 9, 5, 6, 4, 1, 3, 8],
+    [1, 3, 6, 7, 9, 8, 2, 4, 5],
+    [3, 7, 2, 6, 8, 9, 5, 1, 4],
+    [8, 1, 4, 2, 5, 3, 7, 6, 9],
+    [6, 9, 5, 4, 1, 7, 3, 8, 2],
+]
+
+# Needs backtracking
+HARD_PUZZLE = [
+    [0, 8, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 3, 0, 0, 9, 0, 7],
+    [0, 7, 6, 0, 2, 0, 3, 0, 0],
+    [0, 0, 0, 0, 7, 0, 0, 3, 0],
+    [0, 0, 1, 2, 0, 5, 4, 0, 0],
+    [0, 9, 0, 0, 4, 0, 0, 0, 0],
+    [0, 0, 5, 0, 6, 0, 2, 9, 0],
+    [6, 0, 4, 0, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 5, 0],
+]
+
+HARD_SOLUTION = [
+    [1, 8, 3, 7, 9, 6, 5, 4, 2],
+    [4, 5, 2, 3, 1, 8, 9, 6, 7],
+    [9, 7, 6, 5, 2, 4, 3, 1, 8],
+    [2, 4, 8, 6, 7, 9, 1, 3, 5],
+    [3, 6, 1, 2, 8, 5, 4, 7, 9],
+    [5, 9, 7, 1, 4, 3, 8, 2, 6],
+    [8, 3, 5, 4, 6, 7, 2, 9, 1],
+    [6, 2, 4, 9, 5, 1, 7, 8, 3],
+    [7, 1, 9, 8, 3, 2, 6, 5, 4],
+]
+
+
+class TestSolveMany(unittest.TestCase):
+
+    def test_solve_many(self):
+        # Given
+        # Two 6s in the top row
+        clashing_puzzle = [row[:] for row in EASY_PUZZLE]
+        clashing_puzzle[0][0] = 6
+        # No candidate in the top left square
+        empty_square_puzzle = np.zeros((9, 9), dtype=int)
+        empty_square_puzzle[0, 1:] = range(2, 10)
+        empty_square_puzzle[1, 0] = 1
+        puzzles = [
+            EASY_PUZZLE,
+            HARD_PUZZLE,
+            clashing_puzzle,
+            empty_square_puzzle,
+            EASY_SOLUTION,
+        ]
+        expected_solutions = np.array([
+            EASY_SOLUTION,
+            HARD_SOLUTION,
+            np.zeros((9, 9), dtype=int),
+            np.zeros((9, 9), dtype=int),
+            EASY_SOLUTION,
+        ])
+        expected_status = [
+            SOLVED, SOLVED_BY_SEARCH, NO_SOLUTION, NO_SOLUTION, SOLVED,
+        ]
+
+        # When
+        solutions, status = solve_many(puzzles)
+
+        # Then
+        np.testing.assert_array_equal(solutions, expected_solutions)
+        np.testing.assert_array_equal(status, expected_status)
+
+    def test_solve_many_with_nones(self):
+        # Given
+        puzzle = [
+            [None if number == 0 else number for number in row]
+            for row in EASY_PUZZLE
+        ]
+
+        # When
+        solutions, status = solve_many([puzzle])
+
+        # Then
+        np.testing.assert_array_equal(solutions, [EASY_SOLUTION])
+        np.testing.assert_array_equal(status, [SOLVED])
+
+    def test_solve_many_unsolvable_by_search(self):
+        """
+        See `test_consistency_check_doesnt_always_raise` of HB6DBoard.
+        """
+        # When
+        solutions, status = solve_many([NO_SOLUTION_PUZZLE])
+
+        # Then
+        np.testing.assert_array_equal(solutions, np.zeros((1, 9, 9)))
+        np.testing.assert_array_equal(status, [NO_SOLUTION])
+
+    def test_solve_many_return_stats(self):
+        # When
+        solutions, status, stats = solve_many(
+            [EASY_PUZZLE, HARD_PUZZLE], return_stats=True
+        )
+
+        # Then
+        np.testing.assert_array_equal(
+            solutions, [EASY_SOLUTION, HARD_SOLUTION]
+        )
+        # The easy puzzle isn't searched
+        self.assertEqual(stats[0].nodes, 0)
+        self.assertGreater(stats[1].nodes, 1)
+        total = sum(stats, SolveStats())
+        self.assertEqual(total.nodes, stats[1].nodes)
+
+
+class TestSolveParallel(unittest.TestCase):
+
+    def test_solve_parallel(self):
+        # Given
+        # Only eight rows
+        malformed_puzzle = EASY_PUZZLE[:-1]
+        puzzles = [
+            EASY_PUZZLE,
+            HARD_PUZZLE,
+            malformed_puzzle,
+            EASY_PUZZLE,
+            HARD_PUZZLE,
+        ]
+        expected_solutions = [
+            EASY_SOLUTION,
+            HARD_SOLUTION,
+            np.zeros((9, 9), dtype=int),
+            EASY_SOLUTION,
+            HARD_SOLUTION,
+        ]
+        expected_status = [
+            SOLVED, SOLVED_BY_SEARCH, ERROR, SOLVED, SOLVED_BY_SEARCH,
+        ]
+
+        # When
+        results = list(solve_parallel(
+            iter(puzzles), n_workers=2, chunk_size=2, max_in_flight=2,
+        ))
+
+        # Then
+        solutions, status = zip(*results)
+        np.testing.assert_array_equal(solutions, expected_solutions)
+        self.assertEqual(list(status), expected_status)
+
+    def test_solve_parallel_stops_early(self):
+        # Given
+        puzzles = itertools.repeat(EASY_PUZZLE)
+
+        # When
+        results = solve_parallel(puzzles, n_workers=1, chunk_size=3)
+        first_results = list(itertools.islice(results, 4))
+        results.close()
+
+        # Then
+        solutions, status = zip(*first_results)
+        np.testing.assert_array_equal(solutions, [EASY_SOLUTION] * 4)
+        self.assertEqual(list(status), [SOLVED] * 4)
+
+    def test_solve_parallel_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            next(solve_parallel([EASY_PUZZLE], chunk_size=0))
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.benchmarks.suite import OPERATIONS, compare, run
+from pZudoku.benchmarks.tiers import TIERS, make_tier
+from pZudoku.hb6d_board import HB6DBoard
+
+
+class TestMakeTier(unittest.TestCase):
+
+    def test_make_tier_is_deterministic(self):
+        for tier in TIERS:
+            first = make_tier(tier, 2, seed=1)
+            second = make_tier(tier, 2, seed=1)
+            for first_puzzle, second_puzzle in zip(first, second):
+                np.testing.assert_array_equal(first_puzzle, second_puzzle)
+
+    def test_make_tier_puzzles_are_proper(self):
+        for tier in TIERS:
+            for puzzle in make_tier(tier, 2):
+                self.assertEqual(puzzle.shape, (9, 9))
+                board = HB6DBoard.from_array(puzzle)
+                self.assertEqual(board.count_solutions(algorithm='dlx'), 1)
+
+    def test_make_tier_clues(self):
+        easy_puzzle, = make_tier('easy', 1)
+        self.assertEqual((easy_puzzle > 0).sum(), 36)
+        for puzzle in make_tier('17-clue', 4):
+            self.assertEqual((puzzle > 0).sum(), 17)
+
+    def test_make_tier_hard_puzzles_are_minimal(self):
+        puzzle, = make_tier('hard', 1)
+        for _row, _col in zip(*puzzle.nonzero()):
+            reduced_puzzle = puzzle.copy()
+            reduced_puzzle[_row, _col] = 0
+            board = HB6DBoard.from_array(reduced_puzzle)
+            self.assertEqual(board.count_solutions(algorithm='dlx'), 2)
+
+    def test_make_tier_pathological_puzzles_are_untransformed(self):
+        puzzles = make_tier('pathological', 4, seed=1)
+        np.testing.assert_array_equal(puzzles[0], PUZZLES['hardest'])
+        np.testing.assert_array_equal(puzzles[3], puzzles[0])
+        # Still an empty first row, whose solution is 987654321
+        self.assertFalse(puzzles[2][0].any())
+        board = HB6DBoard.from_array(puzzles[2])
+        board.solve()
+        np.testing.assert_array_equal(board._to_array()[0], range(9, 0, -1))
+
+    def test_make_tier_unknown_tier(self):
+        with self.assertRaises(ValueError):
+            make_tier('expert', 1)
+
+
+class TestSuite(unittest.TestCase):
+
+    def test_run(self):
+        report = run(number=2, tiers=['easy'])
+
+        self.assertEqual(report['meta']['number'], 2)
+        self.assertEqual(set(report['tiers']), {'easy'})
+        self.assertEqual(set(report['tiers']['easy']), set(OPERATIONS))
+        statistics = report['tiers']['easy']['solve']
+        self.assertLessEqual(statistics['min_ms'], statistics['p50_ms'])
+        self.assertLessEqual(statistics['p50_ms'], statistics['max_ms'])
+        self.assertGreater(statistics['puzzles_per_second'], 0)
+
+    def test_compare(self):
+        baseline = {'tiers': {'easy': {
+            'solve': {'p50_ms': 1.0},
+            'str': {'p50_ms': 1.0},
+        }}}
+        report = {'tiers': {
+            'easy': {
+                'solve': {'p50_ms': 1.5},
+                'str': {'p50_ms': 1.1},
+            },
+            # Not in the baseline
+            'hard': {
+                'solve': {'p50_ms': 100.0},
+            },
+        }}
+
+        regressions = compare(report, baseline, threshold=0.2)
+
+        self.assertEqual(regressions, [('easy', 'solve', 1.0, 1.5)])
@@ -0,0 +1,154 @@
+import unittest
+
+import numpy as np
+
+from pZudoku.benchmarks.puzzles import NO_SOLUTION_PUZZLE
+from pZudoku.bitmask_board import BitmaskBoard
+from pZudoku.hb6d_board import ConsistencyError, HB6DBoard
+
+
+class TestBitmaskBoard(unittest.TestCase):
+
+    def test_init(self):
+        board = BitmaskBoard()
+
+        self.assertEqual(board.candidates(5, 5), list(range(1, 10)))
+
+    def test_instantiation_from_array(self):
+        squares = np.array([
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 6, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        ])
+
+        board = BitmaskBoard.from_array(squares)
+
+        self.assertEqual(board.candidates(6, 7), [6])
+        # Same row
+        self.assertEqual(board.candidates(6, 1), [1, 2, 3, 4, 5, 7, 8, 9])
+        # Same column
+        self.assertEqual(board.candidates(1, 7), [1, 2, 3, 4, 5, 7, 8, 9])
+        # Same box
+        self.assertEqual(board.candidates(4, 9), [1, 2, 3, 4, 5, 7, 8, 9])
+        # Not a peer
+        self.assertEqual(board.candidates(1, 1), list(range(1, 10)))
+
+    def test_instantiation_from_array_raises(self):
+        squares = np.array([
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 6, 0, 6],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0, 0],
+        ])
+
+        with self.assertRaises(ConsistencyError) as exc_cm:
+            BitmaskBoard.from_array(squares)
+
+        self.assertIn("Clash found", str(exc_cm.exception))
+        self.assertIn("6 (6, 9)", str(exc_cm.exception))
+
+    def test_insert(self):
+        board = BitmaskBoard()
+
+        board.insert(number=2, row=6, column=7)
+
+        self.assertEqual(board.candidates(6, 7), [2])
+        self.assertNotIn(2, board.candidates(6, 1))
+
+    def test_insert_raises(self):
+        board = BitmaskBoard()
+        board.insert(number=2, row=6, column=1)
+
+        with self.assertRaises(ValueError) as exc_cm:
+            board.insert(number=2, row=6, column=7)
+
+        self.assertIn("not a valid candidate", str(exc_cm.exception))
+
+
+class TestSolve(unittest.TestCase):
+
+    def test_quick_fill(self):
+        squares = np.array([
+            [0, 0, 3, 0, 2, 0, 6, 0, 0],
+            [9, 0, 0, 3, 0, 5, 0, 0, 1],
+            [0, 0, 1, 8, 0, 6, 4, 0, 0],
+            [0, 0, 8, 1, 0, 2, 9, 0, 0],
+            [7, 0, 0, 0, 0, 0, 0, 0, 8],
+            [0, 0, 6, 7, 0, 8, 2, 0, 0],
+            [0, 0, 2, 6, 0, 9, 5, 0, 0],
+            [8, 0, 0, 2, 0, 3, 0, 0, 9],
+            [0, 0, 5, 0, 1, 0, 3, 0, 0],
+        ])
+        board = BitmaskBoard.from_array(squares)
+        expected_str = (
+            "4 8 3 | 9 2 1 | 6 5 7\n"
+            "9 6 7 | 3 4 5 | 8 2 1\n"
+            "2 5 1 | 8 7 6 | 4 9 3\n"
+            "---------------------\n"
+            "5 4 8 | 1 3 2 | 9 7 6\n"
+            "7 2 9 | 5 6 4 | 1 3 8\n"
+            "1 3 6 | 7 9 8 | 2 4 5\n"
+            "---------------------\n"
+            "3 7 2 | 6 8 9 | 5 1 4\n"
+            "8 1 4 | 2 5 3 | 7 6 9\n"
+            "6 9 5 | 4 1 7 | 3 8 2\n"
+        )
+
+        board._quick_fill()
+
+        self.assertEqual(str(board), expected_str)
+
+    def test_solve_matches_hb6d_board(self):
+        # Given
+        squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+        board = BitmaskBoard.from_array(squares)
+        hb6d_board = HB6DBoard.from_array(squares)
+        hb6d_board.solve()
+
+        # When
+        board.solve()
+
+        # Then
+        self.assertEqual(str(board), str(hb6d_board))
+
+    def test_str_of_partially_filled_board(self):
+        board = BitmaskBoard()
+        board.insert(number=1, row=1, column=1)
+        board.insert(number=9, row=9, column=9)
+        hb6d_board = HB6DBoard()
+        hb6d_board.insert(number=1, row=1, column=1)
+        hb6d_board.insert(number=9, row=9, column=9)
+
+        self.assertEqual(str(board), str(hb6d_board))
+
+    def test_solve_invalid_board(self):
+        """
+        See `test_consistency_check_doesnt_always_raise` of HB6DBoard.
+        """
+        board = BitmaskBoard.from_array(NO_SOLUTION_PUZZLE)
+
+        with self.assertRaises(ConsistencyError) as exc_cm:
+            board.solve()
+
+        self.assertEqual("No solution found.", str(exc_cm.exception))
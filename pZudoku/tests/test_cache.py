@@ -0,0 +1,124 @@
+import threading
+import unittest
+
+from pZudoku.benchmarks.puzzles import NO_SOLUTION_PUZZLE, PUZZLES
+from pZudoku.cache import SolutionCache
+from pZudoku.hb6d_board import ConsistencyError, HB6DBoard
+from pZudoku.stats import SolveStats
+
+
+class TestSolutionCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = SolutionCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(
+            cache.info(),
+            {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2},
+        )
+
+    def test_clear(self):
+        cache = SolutionCache()
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            SolutionCache(maxsize=0)
+
+    def test_threads(self):
+        cache = SolutionCache(maxsize=10)
+
+        def work(offset):
+            for n in range(200):
+                key = (offset + n) % 20
+                if cache.get(key) is None:
+                    cache.put(key, n)
+
+        threads = [
+            threading.Thread(target=work, args=(offset,))
+            for offset in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = cache.info()
+        self.assertEqual(info['hits'] + info['misses'], 8 * 200)
+        self.assertEqual(info['size'], 10)
+        self.assertEqual(info['misses'] - info['evictions'], 10)
+
+
+class TestSolveWithCache(unittest.TestCase):
+
+    def test_solution(self):
+        cache = SolutionCache()
+        fresh = HB6DBoard.from_array(PUZZLES['hard'])
+        fresh.solve()
+
+        for _ in range(2):
+            board = HB6DBoard.from_array(PUZZLES['hard'])
+            board.solve(cache=cache)
+            self.assertEqual(board.to_bytes(), fresh.to_bytes())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_no_solution(self):
+        cache = SolutionCache()
+        fresh = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+        with self.assertRaises(ConsistencyError):
+            fresh.solve()
+
+        for _ in range(2):
+            board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+            with self.assertRaises(ConsistencyError) as exc_cm:
+                board.solve(cache=cache)
+            self.assertEqual("No solution found.", str(exc_cm.exception))
+            self.assertEqual(board.to_bytes(), fresh.to_bytes())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_options_in_key(self):
+        cache = SolutionCache()
+        HB6DBoard.from_array(PUZZLES['easy']).solve(cache=cache)
+        HB6DBoard.from_array(PUZZLES['easy']).solve(
+            algorithm='dlx', cache=cache
+        )
+        HB6DBoard.from_array(PUZZLES['medium']).solve(cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+    def test_ignored_options_not_in_key(self):
+        cache = SolutionCache()
+        for backtracking in ('trail', 'copy'):
+            HB6DBoard.from_array(PUZZLES['hard']).solve(
+                backtracking=backtracking, cache=cache
+            )
+        for branching, propagation in (('mrv', 'singles'), ('first', 'fish')):
+            HB6DBoard.from_array(PUZZLES['hard']).solve(
+                branching=branching, algorithm='dlx',
+                propagation=propagation, cache=cache,
+            )
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertEqual(len(cache), 2)
+
+    def test_hits_dont_add_stats(self):
+        cache = SolutionCache()
+        stats = SolveStats()
+        for _ in range(2):
+            HB6DBoard.from_array(PUZZLES['hardest']).solve(
+                stats=stats, cache=cache
+            )
+        nodes = stats.nodes
+        HB6DBoard.from_array(PUZZLES['hardest']).solve(
+            stats=stats, cache=cache
+        )
+        self.assertEqual(stats.nodes, nodes)
+        self.assertGreater(nodes, 0)
@@ -0,0 +1,146 @@
+import unittest
+
+import numpy as np
+
+from pZudoku.benchmarks.puzzles import PUZZLES
+from pZudoku.canonical import (
+    Transform,
+    canonical_form,
+    canonical_forms,
+    canonical_hash,
+    deduplicate,
+)
+from pZudoku.generator import shuffle
+from pZudoku.hb6d_board import HB6DBoard
+
+
+class TestCanonicalForm(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = np.random.RandomState(0)
+
+    def test_shuffled_copies(self):
+        for name, puzzle in PUZZLES.items():
+            with self.subTest(name=name):
+                canonical, _ = canonical_form(puzzle)
+                for _ in range(3):
+                    copy = shuffle(np.array(puzzle), self.rng)
+                    np.testing.assert_array_equal(
+                        canonical_form(copy)[0], canonical
+                    )
+
+    def test_is_smallest(self):
+        # The canonical form is its own canonical form, and no shuffled copy
+        # is smaller
+        puzzle = np.array(PUZZLES['hard'])
+        canonical, _ = canonical_form(puzzle)
+        np.testing.assert_array_equal(canonical_form(canonical)[0], canonical)
+        for _ in range(20):
+            copy = shuffle(canonical, self.rng).ravel()
+            differ = np.flatnonzero(copy != canonical.ravel())
+            if len(differ):
+                self.assertGreater(
+                    copy[differ[0]], canonical.ravel()[differ[0]]
+                )
+
+    def test_labels(self):
+        # Numbers are labelled in order of first appearance
+        canonical, _ = canonical_form(PUZZLES['medium'])
+        numbers = canonical[canonical > 0]
+        _, first = np.unique(numbers, return_index=True)
+        np.testing.assert_array_equal(numbers[np.sort(first)],
+                                      np.arange(1, 10))
+
+    def test_transform(self):
+        puzzle = shuffle(np.array(PUZZLES['hardest']), self.rng)
+        canonical, transform = canonical_form(puzzle)
+        np.testing.assert_array_equal(transform.apply(puzzle), canonical)
+        np.testing.assert_array_equal(transform.invert(canonical), puzzle)
+
+    def test_invert_solution(self):
+        puzzle = np.array(PUZZLES['hard'])
+        canonical, transform = canonical_form(puzzle)
+        board = HB6DBoard.from_array(canonical)
+        board.solve()
+        solution = transform.invert(board._to_array())
+        np.testing.assert_array_equal(solution[puzzle > 0],
+                                      puzzle[puzzle > 0])
+        for grid in (solution, solution.T):
+            np.testing.assert_array_equal(np.sort(grid, axis=1),
+                                          np.tile(np.arange(1, 10), (9, 1)))
+
+    def test_empty_and_missing_numbers(self):
+        canonical, transform = canonical_form(np.zeros((9, 9), dtype=int))
+        np.testing.assert_array_equal(canonical, np.zeros((9, 9)))
+        np.testing.assert_array_equal(np.sort(transform.labels),
+                                      np.arange(10))
+
+        grid = np.zeros((9, 9), dtype=int)
+        grid[4, 4] = 7
+        canonical, transform = canonical_form(grid)
+        # Empty squares come first
+        self.assertEqual(canonical[8, 8], 1)
+        self.assertEqual(canonical.sum(), 1)
+        np.testing.assert_array_equal(np.sort(transform.labels),
+                                      np.arange(10))
+
+    def test_none(self):
+        puzzle = np.array(PUZZLES['easy'], dtype=object)
+        puzzle[puzzle == 0] = None
+        np.testing.assert_array_equal(canonical_form(puzzle)[0],
+                                      canonical_form(PUZZLES['easy'])[0])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            canonical_form(np.zeros((6, 6), dtype=int))
+        with self.assertRaises(ValueError):
+            canonical_forms([PUZZLES['easy']], chunk_size=0)
+
+    def test_repr(self):
+        transform = Transform(False, range(9), range(9), range(10))
+        self.assertEqual(
+            repr(transform),
+            'Transform(transpose=False, rows=[0, 1, 2, 3, 4, 5, 6, 7, 8], '
+            'cols=[0, 1, 2, 3, 4, 5, 6, 7, 8], '
+            'labels=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9])',
+        )
+
+
+class TestCanonicalHash(unittest.TestCase):
+
+    def test_hash(self):
+        rng = np.random.RandomState(0)
+        puzzle = np.array(PUZZLES['medium'])
+        digest = canonical_hash(puzzle)
+        self.assertEqual(len(digest), 40)
+        self.assertEqual(canonical_hash(shuffle(puzzle, rng)), digest)
+        self.assertNotEqual(canonical_hash(PUZZLES['hard']), digest)
+
+
+class TestBulk(unittest.TestCase):
+
+    def test_canonical_forms(self):
+        puzzles = list(PUZZLES.values())
+        canonical, transforms = canonical_forms(puzzles, chunk_size=3)
+        self.assertEqual(canonical.shape, (len(puzzles), 9, 9))
+        for puzzle, grid, transform in zip(puzzles, canonical, transforms):
+            np.testing.assert_array_equal(canonical_form(puzzle)[0], grid)
+            np.testing.assert_array_equal(transform.invert(grid), puzzle)
+
+    def test_deduplicate(self):
+        rng = np.random.RandomState(0)
+        medium = np.array(PUZZLES['medium'])
+        hard = np.array(PUZZLES['hard'])
+        puzzles = [hard, shuffle(medium, rng), shuffle(hard, rng), medium]
+        unique, index, transforms = deduplicate(puzzles)
+        self.assertEqual(unique.shape, (2, 9, 9))
+        np.testing.assert_array_equal(index, [0, 1, 0, 1])
+        for puzzle, n, transform in zip(puzzles, index, transforms):
+            np.testing.assert_array_equal(transform.invert(unique[n]),
+                                          puzzle)
+
+    def test_deduplicate_nothing(self):
+        unique, index, transforms = deduplicate(np.zeros((0, 9, 9), int))
+        self.assertEqual(unique.shape, (0, 9, 9))
+        self.assertEqual(len(index), 0)
+        self.assertEqual(transforms, [])
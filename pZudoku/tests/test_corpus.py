@@ -0,0 +1,174 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pZudoku.corpus import read_grids, write_grids
+from pZudoku.hb6d_board import HB6DBoard
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), 'examples')
+
+PUZZLE = [
+    [4, 0, 0, 0, 0, 0, 8, 0, 5],
+    [0, 3, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 7, 0, 0, 0, 0, 0],
+    [0, 2, 0, 0, 0, 0, 0, 6, 0],
+    [0, 0, 0, 0, 8, 0, 4, 0, 0],
+    [0, 0, 0, 0, 1, 0, 0, 0, 0],
+    [0, 0, 0, 6, 0, 3, 0, 7, 0],
+    [5, 0, 0, 2, 0, 0, 0, 0, 0],
+    [1, 0, 4, 0, 0, 0, 0, 0, 0],
+]
+
+PUZZLE_LINE = (
+    '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....'
+    '1.4......'
+)
+
+
+class TestReadGrids(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _write(self, name, data, compress=False):
+        path = os.path.join(self.tmp_dir, name)
+        opener = gzip.open if compress else open
+        with opener(path, 'wb') as f:
+            f.write(data.encode())
+        return path
+
+    def test_read_line_format(self):
+        # Given
+        data = ''.join([
+            '# Two puzzles, with dots and with zeros\n',
+            PUZZLE_LINE, '\r\n',
+            '\n',
+            PUZZLE_LINE.replace('.', '0'), ' some rating\n',
+        ])
+        path = self._write('puzzles.txt', data)
+
+        # When
+        grids = list(read_grids(path))
+
+        # Then
+        np.testing.assert_array_equal(grids, [PUZZLE, PUZZLE])
+
+    def test_read_gzip_file(self):
+        # Given
+        path = self._write('puzzles', PUZZLE_LINE + '\n', compress=True)
+
+        # When
+        grids = list(read_grids(path))
+
+        # Then
+        np.testing.assert_array_equal(grids, [PUZZLE])
+
+    def test_read_grid_format(self):
+        # Given
+        path = os.path.join(EXAMPLES_DIR, 'rectangular_2x3', 'example1.txt')
+        expected_grid = [
+            [1, 2, 3, 4, 5, 6],
+            [4, 5, 6, 1, 2, 3],
+            [2, 3, 1, 5, 6, 4],
+            [5, 6, 4, 2, 3, 1],
+            [3, 1, 2, 6, 4, 5],
+            [6, 4, 5, 3, 1, 2],
+        ]
+
+        # When
+        grids = list(read_grids(path))
+
+        # Then
+        np.testing.assert_array_equal(grids, [expected_grid])
+
+    def test_read_board_str(self):
+        # Given
+        board = HB6DBoard.from_array(PUZZLE)
+        path = self._write('boards.txt', str(board) + '\n' + str(board))
+
+        # When
+        boards = list(read_grids(path, board_class=HB6DBoard))
+
+        # Then
+        self.assertEqual(len(boards), 2)
+        for read_board in boards:
+            self.assertEqual(str(read_board), str(board))
+
+    def test_read_malformed_file(self):
+        path = self._write('puzzles.txt', PUZZLE_LINE[:-1] + '\n')
+
+        with self.assertRaises(ValueError):
+            list(read_grids(path, format='line'))
+
+    def test_read_line_starting_with_comma(self):
+        lines = ['# Comment', PUZZLE_LINE, ',' + PUZZLE_LINE]
+        path = self._write('puzzles.txt', '\n'.join(lines) + '\n')
+
+        with self.assertRaisesRegex(ValueError, 'line 3'):
+            list(read_grids(path, format='line'))
+
+    def test_read_incomplete_grid(self):
+        path = self._write('puzzles.txt', '123\n456\n')
+
+        with self.assertRaises(ValueError):
+            list(read_grids(path, format='grid'))
+
+
+class TestWriteGrids(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_write_line_format(self):
+        # Given
+        path = os.path.join(self.tmp_dir, 'puzzles.txt')
+
+        # When
+        write_grids(path, iter([PUZZLE, PUZZLE]))
+
+        # Then
+        with open(path) as f:
+            self.assertEqual(f.read(), (PUZZLE_LINE + '\n') * 2)
+
+    def test_write_grid_format(self):
+        # Given
+        path = os.path.join(self.tmp_dir, 'puzzles.txt')
+        grid = [[1, 2], [None, 0]]
+
+        # When
+        write_grids(path, [grid, grid], format='grid')
+
+        # Then
+        with open(path) as f:
+            self.assertEqual(f.read(), '12\n..\n\n12\n..\n')
+
+    def test_write_invalid_numbers(self):
+        path = os.path.join(self.tmp_dir, 'puzzles.txt')
+        for number in (-1, 10):
+            grid = [[1, 2], [number, 0]]
+            with self.assertRaises(ValueError):
+                write_grids(path, [grid])
+
+    def test_round_trip(self):
+        for name in ('puzzles.txt', 'puzzles.txt.gz'):
+            for format in ('line', 'grid'):
+                # Given
+                path = os.path.join(self.tmp_dir, name)
+
+                # When
+                write_grids(path, [PUZZLE] * 3, format=format)
+                grids = list(read_grids(path))
+
+                # Then
+                np.testing.assert_array_equal(grids, [PUZZLE] * 3)
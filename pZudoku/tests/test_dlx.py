@@ -0,0 +1,51 @@
+import unittest
+
+from pZudoku.dlx import DancingLinks
+
+
+# Example from Knuth's "Dancing Links" paper, with columns A to G numbered
+# from 0 to 6
+KNUTH_ROWS = [
+    [2, 4, 5],
+    [0, 3, 6],
+    [1, 2, 5],
+    [0, 3],
+    [1, 6],
+    [3, 4, 6],
+]
+
+
+class TestDancingLinks(unittest.TestCase):
+
+    def test_unique_solution(self):
+        dancing_links = DancingLinks(7, KNUTH_ROWS)
+
+        solutions = list(dancing_links.solutions())
+
+        self.assertEqual(len(solutions), 1)
+        self.assertEqual(sorted(solutions[0]), [0, 3, 4])
+
+    def test_multiple_solutions(self):
+        rows = [[0], [1], [0, 1]]
+        dancing_links = DancingLinks(2, rows)
+
+        solutions = [sorted(rows) for rows in dancing_links.solutions()]
+
+        self.assertEqual(sorted(solutions), [[0, 1], [2]])
+
+    def test_no_solution(self):
+        # Column 2 can't be covered
+        rows = [[0], [1], [0, 1]]
+        dancing_links = DancingLinks(3, rows)
+
+        solutions = list(dancing_links.solutions())
+
+        self.assertEqual(solutions, [])
+
+    def test_matrix_is_restored(self):
+        dancing_links = DancingLinks(7, KNUTH_ROWS)
+        first_solutions = list(dancing_links.solutions())
+
+        second_solutions = list(dancing_links.solutions())
+
+        self.assertEqual(second_solutions, first_solutions)
@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pZudoku.corpus import read_grids
+from pZudoku.generator import (
+    generate,
+    generate_many,
+    shuffle,
+    write_puzzles,
+)
+from pZudoku.hb6d_board import HB6DBoard
+
+
+def _count_solutions(puzzle):
+    return HB6DBoard.from_array(puzzle).count_solutions(algorithm='dlx')
+
+
+class TestGenerate(unittest.TestCase):
+
+    def test_minimal(self):
+        puzzle, solution = generate(seed=0, return_solution=True)
+        self.assertEqual(_count_solutions(puzzle), 1)
+        np.testing.assert_array_equal(solution[puzzle > 0],
+                                      puzzle[puzzle > 0])
+        for _row, _col in zip(*puzzle.nonzero()):
+            reduced_puzzle = puzzle.copy()
+            reduced_puzzle[_row, _col] = 0
+            self.assertEqual(_count_solutions(reduced_puzzle), 2)
+
+    def test_n_clues(self):
+        for n_clues in (81, 40, 28):
+            puzzle = generate(n_clues, seed=1)
+            self.assertEqual((puzzle > 0).sum(), n_clues)
+            self.assertEqual(_count_solutions(puzzle), 1)
+
+    def test_solution(self):
+        _, solution = generate(30, seed=2, return_solution=True)
+        for grid in (solution, solution.T):
+            np.testing.assert_array_equal(np.sort(grid, axis=1),
+                                          np.tile(np.arange(1, 10), (9, 1)))
+
+    def test_seed(self):
+        np.testing.assert_array_equal(generate(seed=3), generate(seed=3))
+        self.assertFalse(np.array_equal(generate(seed=3), generate(seed=4)))
+
+    def test_invalid_n_clues(self):
+        for n_clues in (-1, 82):
+            with self.assertRaises(ValueError):
+                generate(n_clues)
+
+    def test_random_state(self):
+        rng = np.random.RandomState(7)
+        puzzles = [generate(30, seed=rng) for _ in range(2)]
+        self.assertFalse(np.array_equal(*puzzles))
+        rng = np.random.RandomState(7)
+        np.testing.assert_array_equal(generate(30, seed=rng), puzzles[0])
+
+
+class TestShuffle(unittest.TestCase):
+
+    def test_shuffle(self):
+        puzzle, solution = generate(30, seed=8, return_solution=True)
+        copy = shuffle(puzzle, seed=0)
+        self.assertEqual((copy > 0).sum(), 30)
+        self.assertEqual(_count_solutions(copy), 1)
+        np.testing.assert_array_equal(copy, shuffle(puzzle, seed=0))
+        np.testing.assert_array_equal(
+            shuffle(solution, seed=0)[copy > 0], copy[copy > 0]
+        )
+
+
+class TestGenerateMany(unittest.TestCase):
+
+    def test_generate_many(self):
+        puzzles = list(generate_many(4, n_clues=30, seed=0))
+        self.assertEqual(len(puzzles), 4)
+        for puzzle in puzzles:
+            self.assertEqual(_count_solutions(puzzle), 1)
+        self.assertEqual(len({puzzle.tobytes() for puzzle in puzzles}), 4)
+
+    def test_start(self):
+        puzzles = list(generate_many(3, n_clues=30, seed=5))
+        rest = list(generate_many(2, n_clues=30, seed=5, start=1))
+        np.testing.assert_array_equal(puzzles[1:], rest)
+
+    def test_write_puzzles(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, 'puzzles.txt.gz')
+            write_puzzles(path, 3, n_clues=30, seed=6)
+            grids = list(read_grids(path))
+        finally:
+            shutil.rmtree(tmp_dir)
+        np.testing.assert_array_equal(
+            grids, list(generate_many(3, n_clues=30, seed=6))
+        )
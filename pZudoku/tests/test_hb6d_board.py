@@ -1,8 +1,31 @@
+import copy
+import inspect
+import os
+import pickle
+import sys
 import unittest
 
 import numpy as np
 
-from pZudoku.hb6d_board import ConsistencyError, HB6DBoard
+from pZudoku.benchmarks.puzzles import NO_SOLUTION_PUZZLE, PUZZLES
+from pZudoku.benchmarks.quick_fill import quick_fill_sequential
+from pZudoku.hb6d_board import (
+    ConsistencyError,
+    HB6DBoard,
+    Search,
+    _BACKTRACKING_MODES,
+    _BRANCHING_POLICIES,
+    _CONSTRAINT_AXES,
+    _PROPAGATION_LEVELS,
+    _default_box_shape,
+    _make_shape,
+    _peers,
+)
+from pZudoku.stats import SolveStats
+from pZudoku.tests.reference import from_array_sequential, recursive_solve
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), 'examples')
 
 
 class TestHB6DBoard(unittest.TestCase):
@@ -153,6 +176,139 @@ class TestPutMethod(unittest.TestCase):
             board._put((2, 2, 0, 2, 0, 0))
 
 
+class TestUndo(unittest.TestCase):
+
+    def test_undo_put(self):
+        # Given
+        board = HB6DBoard()
+        board._put(board._num_row_col_to_idx(0, 0, 0))
+        board._trail = []
+        expected_repr = repr(board)
+
+        # When
+        board._put(board._num_row_col_to_idx(4, 4, 4))
+        board._quick_fill()
+        self.assertNotEqual(repr(board), expected_repr)
+        board._undo(0)
+
+        # Then
+        self.assertEqual(repr(board), expected_repr)
+        self.assertEqual(board._trail, [])
+
+    def test_undo_to_mark(self):
+        # Given
+        board = HB6DBoard()
+        board._trail = []
+        board._put(board._num_row_col_to_idx(0, 0, 0))
+        mark = len(board._trail)
+        expected_repr = repr(board)
+
+        # When
+        board._put(board._num_row_col_to_idx(1, 8, 8))
+        board._undo(mark)
+
+        # Then
+        self.assertEqual(repr(board), expected_repr)
+        self.assertEqual(len(board._trail), mark)
+
+
+class TestCounting(unittest.TestCase):
+
+    def setUp(self):
+        self.squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+
+    def assertCountsUpToDate(self, board):
+        """
+        Assert that the counts kept by the board match a full recount.
+        """
+        counts = board._constraint_counts()
+        _counts, board._counts = board._counts, None
+        try:
+            np.testing.assert_array_equal(counts, board._constraint_counts())
+        finally:
+            board._counts = _counts
+
+    def test_start_counting(self):
+        # Given
+        board = HB6DBoard.from_array(self.squares)
+
+        # When
+        board._start_counting()
+
+        # Then
+        self.assertEqual(board._counts.dtype, np.int8)
+        self.assertCountsUpToDate(board)
+        # Every constraint of the givens is queued
+        queued = np.concatenate(board._queue)
+        self.assertEqual(len(queued), 4 * 21)
+        np.testing.assert_array_equal(
+            queued, np.flatnonzero(board._counts == 1)
+        )
+
+    def test_counts_follow_put_and_undo(self):
+        # Given
+        board = HB6DBoard.from_array(self.squares)
+        board._trail = []
+        board._start_counting()
+
+        # When, then
+        board._quick_fill()
+        self.assertCountsUpToDate(board)
+        board._put(board._constraint_cells(
+            *divmod(int(np.argmax(board._constraint_counts() > 1)), 4)
+        )[0])
+        board._quick_fill()
+        self.assertCountsUpToDate(board)
+        board._undo(0)
+        self.assertCountsUpToDate(board)
+
+    def test_quick_fill_queued_matches_sweeps(self):
+        for squares in list(PUZZLES.values()) + [self.squares]:
+            # Given
+            board = HB6DBoard.from_array(squares)
+            expected_board = HB6DBoard.from_array(squares)
+            board._start_counting()
+
+            # When
+            board._quick_fill()
+            expected_board._quick_fill()
+
+            # Then
+            np.testing.assert_array_equal(board._cells, expected_board._cells)
+            self.assertCountsUpToDate(board)
+
+    def test_quick_fill_queued_stops_at_dead_end(self):
+        # Given
+        board = HB6DBoard()
+        board._cells[:, :, 0, 0, 0, 0] = False
+        board._start_counting()
+
+        # When
+        board._quick_fill()
+
+        # Then
+        with self.assertRaises(ConsistencyError):
+            board._check_consistency()
+        self.assertTrue(board._queue)
+
+    def test_solve_stops_counting(self):
+        for backtracking in _BACKTRACKING_MODES:
+            board = HB6DBoard.from_array(self.squares)
+            board.solve(backtracking=backtracking)
+            self.assertIsNone(board._counts)
+            self.assertIsNone(board._queue)
+
+
 class TestBoardFromArray(unittest.TestCase):
 
     def test_instantiation_from_array(self):
@@ -203,6 +359,159 @@ class TestBoardFromArray(unittest.TestCase):
 
         self.assertIn("Clash found", str(exc_cm.exception))
 
+    def test_instantiation_from_array_reports_every_clash(self):
+        # Given
+        squares = np.zeros((9, 9), dtype=int)
+        squares[0, 0] = squares[1, 0] = 7
+        squares[4, 4] = squares[4, 8] = 3
+        squares[8, 8] = 1
+
+        # When
+        with self.assertRaises(ConsistencyError) as exc_cm:
+            HB6DBoard.from_array(squares)
+
+        # Then
+        self.assertEqual(
+            exc_cm.exception.clashes,
+            [(7, 1, 1), (7, 2, 1), (3, 5, 5), (3, 5, 9)],
+        )
+        self.assertEqual(
+            str(exc_cm.exception),
+            "Clash found during instantiation: "
+            "7 (1, 1), 7 (2, 1), 3 (5, 5), 3 (5, 9).",
+        )
+
+    def test_instantiation_from_array_matches_sequential(self):
+        for squares in PUZZLES.values():
+            board = HB6DBoard.from_array(squares)
+            expected_board = from_array_sequential(squares)
+            np.testing.assert_array_equal(board._cells, expected_board._cells)
+
+        squares = np.zeros((6, 6), dtype=int)
+        squares[0, 0], squares[2, 3], squares[5, 1] = 1, 4, 6
+        board = HB6DBoard.from_array(squares, box_shape=(3, 2))
+        expected_board = from_array_sequential(squares, (3, 2))
+        np.testing.assert_array_equal(board._cells, expected_board._cells)
+
+    def test_instantiation_from_array_not_square(self):
+        with self.assertRaises(ValueError):
+            HB6DBoard.from_array([[1, 2, 3]] * 9)
+
+    def test_instantiation_from_string(self):
+        # Given
+        squares = np.array(PUZZLES['hard'])
+        string = ''.join(str(number) for number in squares.flat)
+        string = string.replace('0', '.', 10)
+
+        # When
+        board = HB6DBoard.from_string(string)
+
+        # Then
+        expected_board = HB6DBoard.from_array(squares)
+        np.testing.assert_array_equal(board._cells, expected_board._cells)
+
+    def test_instantiation_from_string_rectangular(self):
+        board = HB6DBoard.from_string('1' + '.' * 35)
+
+        self.assertEqual(board._shape, HB6DBoard((2, 3))._shape)
+        self.assertEqual(board.candidates(1, 1), [1])
+
+    def test_instantiation_from_string_wrong_length(self):
+        for string in ('1' * 80, '1' * 256):
+            with self.assertRaises(ValueError):
+                HB6DBoard.from_string(string)
+
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        self.board = HB6DBoard.from_array(PUZZLES['hard'])
+        self.board._quick_fill()
+        self.solved_board = HB6DBoard.from_array(PUZZLES['hard'])
+        self.solved_board.solve()
+
+    def test_to_bytes(self):
+        data = self.board.to_bytes()
+
+        self.assertEqual(len(data), 92)
+        board = HB6DBoard.from_bytes(data)
+        np.testing.assert_array_equal(board._cells, self.board._cells)
+
+    def test_to_bytes_rectangular(self):
+        # Given
+        board = HB6DBoard((2, 3))
+        board._put(board._num_row_col_to_idx(4, 1, 2))
+
+        # When
+        data = board.to_bytes()
+        new_board = HB6DBoard.from_bytes(data, box_shape=(2, 3))
+
+        # Then
+        self.assertEqual(len(data), 27)
+        self.assertEqual(new_board._shape, board._shape)
+        np.testing.assert_array_equal(new_board._cells, board._cells)
+
+    def test_from_bytes_wrong_length(self):
+        with self.assertRaises(ValueError):
+            HB6DBoard.from_bytes(self.board.to_bytes(), box_shape=(2, 3))
+
+    def test_to_nibbles(self):
+        data = self.solved_board.to_nibbles()
+
+        self.assertEqual(len(data), 41)
+        board = HB6DBoard.from_nibbles(data)
+        np.testing.assert_array_equal(board._cells, self.solved_board._cells)
+
+    def test_to_nibbles_unsolved_board(self):
+        with self.assertRaises(ValueError):
+            self.board.to_nibbles()
+
+    def test_to_nibbles_too_large_board(self):
+        board = HB6DBoard((4, 4))
+        board.solve()
+
+        with self.assertRaises(ValueError):
+            board.to_nibbles()
+
+    def test_from_nibbles_invalid_number(self):
+        data = bytearray(self.solved_board.to_nibbles())
+        data[0] &= 0x0F
+
+        with self.assertRaises(ValueError):
+            HB6DBoard.from_nibbles(bytes(data))
+
+    def test_pickle(self):
+        # Given
+        self.board._trail = []
+
+        # When
+        data = pickle.dumps(self.board)
+        board = pickle.loads(data)
+
+        # Then
+        np.testing.assert_array_equal(board._cells, self.board._cells)
+        self.assertIsNone(board._trail)
+        self.assertLess(len(data), 2 * 92)
+
+    def test_pickle_rectangular(self):
+        board = HB6DBoard((2, 3))
+
+        new_board = pickle.loads(pickle.dumps(board))
+
+        self.assertEqual(new_board._shape, board._shape)
+
+    def test_deepcopy(self):
+        # Given
+        board = copy.deepcopy(self.board)
+
+        # When
+        board._put(board._constraint_cells(
+            *divmod(int(np.argmax(board._constraint_counts() > 1)), 4)
+        )[0])
+
+        # Then
+        self.assertLess(board._cells.sum(), self.board._cells.sum())
+
 
 class TestCandidates(unittest.TestCase):
 
@@ -363,6 +672,86 @@ class TestQuickFill(unittest.TestCase):
         # Then
         self.assertEqual(after_repr, before_repr)
 
+    def test_quick_fill_matches_sequential(self):
+        """
+        Check that `_quick_fill()` reaches the same fixpoint as the original,
+        loop-based `quick_fill_sequential()`.
+        """
+        # Given
+        boards = [
+            # Solved completely by _quick_fill()
+            [
+                [0, 0, 3, 0, 2, 0, 6, 0, 0],
+                [9, 0, 0, 3, 0, 5, 0, 0, 1],
+                [0, 0, 1, 8, 0, 6, 4, 0, 0],
+                [0, 0, 8, 1, 0, 2, 9, 0, 0],
+                [7, 0, 0, 0, 0, 0, 0, 0, 8],
+                [0, 0, 6, 7, 0, 8, 2, 0, 0],
+                [0, 0, 2, 6, 0, 9, 5, 0, 0],
+                [8, 0, 0, 2, 0, 3, 0, 0, 9],
+                [0, 0, 5, 0, 1, 0, 3, 0, 0],
+            ],
+            # Partially filled in by _quick_fill()
+            [
+                [0, 8, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 3, 0, 0, 9, 0, 7],
+                [0, 7, 6, 0, 2, 0, 3, 0, 0],
+                [0, 0, 0, 0, 7, 0, 0, 3, 0],
+                [0, 0, 1, 2, 0, 5, 4, 0, 0],
+                [0, 9, 0, 0, 4, 0, 0, 0, 0],
+                [0, 0, 5, 0, 6, 0, 2, 9, 0],
+                [6, 0, 4, 0, 0, 1, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 5, 0],
+            ],
+            # Hardly changed by _quick_fill()
+            [
+                [4, 0, 0, 0, 0, 0, 8, 0, 5],
+                [0, 3, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 7, 0, 0, 0, 0, 0],
+                [0, 2, 0, 0, 0, 0, 0, 6, 0],
+                [0, 0, 0, 0, 8, 0, 4, 0, 0],
+                [0, 0, 0, 0, 1, 0, 0, 0, 0],
+                [0, 0, 0, 6, 0, 3, 0, 7, 0],
+                [5, 0, 0, 2, 0, 0, 0, 0, 0],
+                [1, 0, 4, 0, 0, 0, 0, 0, 0],
+            ],
+        ]
+
+        for squares in boards:
+            board = HB6DBoard.from_array(squares)
+            sequential_board = HB6DBoard.from_array(squares)
+
+            # When
+            board._quick_fill()
+            quick_fill_sequential(sequential_board)
+
+            # Then
+            np.testing.assert_array_equal(
+                board._cells, sequential_board._cells
+            )
+
+    def test_put_many_with_clashing_singles(self):
+        """
+        Check that clashing insertions are applied one at a time, so that the
+        first one wins.
+        """
+        # Given
+        board = HB6DBoard()
+        singles = np.zeros(board._shape, dtype=bool)
+        # Number 1 in the first two squares of the top row
+        _first_idx = board._num_row_col_to_idx(0, 0, 0)
+        _second_idx = board._num_row_col_to_idx(0, 0, 1)
+        singles[_first_idx] = True
+        singles[_second_idx] = True
+        expected_board = HB6DBoard()
+        expected_board._put(_first_idx)
+
+        # When
+        board._put_many(singles)
+
+        # Then
+        np.testing.assert_array_equal(board._cells, expected_board._cells)
+
 
 class TestConsistencyCheck(unittest.TestCase):
 
@@ -524,32 +913,21 @@ class TestConsistencyCheck(unittest.TestCase):
         # In square (2, 8) neither of the two candidates (4 and 9) lead
         # to a valid solution (so the board has no solution), but this is
         # not discovered by `_consistency_check()`.
-        squares = [
-            [4, 1, 7, 3, 6, 9, 8, 2,    5],  # noqa: E241
-            [2, 3, 6, 1, 5, 8, 7, None, 0],  # noqa: E241
-            [0, 5, 0, 7, 2, 4, 0, 1,    0],  # noqa: E241
-            [0, 2, 5, 4, 3, 7, 1, 6,    0],  # noqa: E241
-            [0, 0, 1, 0, 8, 0, 4, 0,    0],  # noqa: E241
-            [0, 4, 0, 0, 1, 0, 0, 0,    0],  # noqa: E241
-            [0, 0, 2, 6, 4, 3, 5, 7,    1],  # noqa: E241
-            [5, 0, 3, 2, 0, 1, 0, 0,    0],  # noqa: E241
-            [1, 0, 4, 8, 0, 5, 0, 0,    0],  # noqa: E241
-        ]
         # Try the first candidate number: 4
-        board_1 = HB6DBoard.from_array(squares)
+        board_1 = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
         board_1.insert(4, 2, 8)
         with self.assertRaises(ConsistencyError):
             board_1._quick_fill()
             board_1._check_consistency()
         # Try the second candidate number: 9
-        board_1 = HB6DBoard.from_array(squares)
+        board_1 = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
         board_1.insert(9, 2, 8)
         with self.assertRaises(ConsistencyError):
             board_1._quick_fill()
             board_1._check_consistency()
 
         # Given
-        board = HB6DBoard.from_array(squares)
+        board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
         # Make sure that there are no other candidates
         self.assertEqual(board.candidates(2, 8), [4, 9])
 
@@ -559,6 +937,44 @@ class TestConsistencyCheck(unittest.TestCase):
         # Then
         # No errors
 
+    def test_empty_constraints(self):
+        """
+        Check that every empty constraint is reported at once, in the order
+        `_check_consistency()` would find them.
+        """
+        # Given
+        board = HB6DBoard()
+        # No candidate in the middle square
+        board._cells[:, :, 1, 1, 1, 1] = False
+        # Number 2 has no valid place in the fourth row
+        board._cells[0, 1, 1, 0, :, :] = False
+        # Number 1 has no valid place in the first column
+        board._cells[0, 0, :, :, 0, 0] = False
+        _expected_idxs = [
+            # _num is 0, Nones are for 'no row', _col is 0
+            (0, 0, None, None, 0, 0),
+            # _num is 1, _row is 3, Nones are for 'no column'
+            (0, 1, 1, 0, None, None),
+            # Nones are for 'no candidate', _row is 4, _col is 4
+            (None, None, 1, 1, 1, 1),
+        ]
+
+        # When
+        _idxs = board._empty_constraints()
+
+        # Then
+        self.assertEqual(_idxs, _expected_idxs)
+        with self.assertRaises(ConsistencyError) as exc_cm:
+            board._check_consistency()
+        self.assertEqual(exc_cm.exception._idx, _expected_idxs[0])
+
+    def test_empty_constraints_for_valid_board(self):
+        board = HB6DBoard()
+
+        _idxs = board._empty_constraints()
+
+        self.assertEqual(_idxs, [])
+
 
 class TestFirstEmptySquare(unittest.TestCase):
 
@@ -634,6 +1050,56 @@ class TestFirstEmptySquare(unittest.TestCase):
         np.testing.assert_array_equal(_square, _expected_square)
 
 
+class TestFewestCandidatesConstraint(unittest.TestCase):
+
+    def test_fewest_candidates_square(self):
+        # Given
+        board = HB6DBoard()
+        # Only numbers 1 and 2 are candidates in the top left square
+        board._cells[:, :, 0, 0, 0, 0] = False
+        board._cells[0, 0:2, 0, 0, 0, 0] = True
+        _expected_idxs = [(0, 0, 0, 0, 0, 0), (0, 1, 0, 0, 0, 0)]
+
+        # When
+        _idxs = board._fewest_candidates_constraint()
+
+        # Then
+        self.assertEqual(_idxs, _expected_idxs)
+
+    def test_fewest_candidates_numrow(self):
+        # Given
+        board = HB6DBoard()
+        # Number 5 can only go to the first and last column of the fifth row
+        board._cells[1, 1, 1, 1, :, :] = False
+        board._cells[1, 1, 1, 1, 0, 0] = True
+        board._cells[1, 1, 1, 1, 2, 2] = True
+        _expected_idxs = [(1, 1, 1, 1, 0, 0), (1, 1, 1, 1, 2, 2)]
+
+        # When
+        _idxs = board._fewest_candidates_constraint()
+
+        # Then
+        self.assertEqual(_idxs, _expected_idxs)
+
+    def test_fewest_candidates_constraint_raises(self):
+        # Board is already filled
+        squares = np.array([
+            [4, 8, 3, 9, 2, 1, 6, 5, 7],
+            [9, 6, 7, 3, 4, 5, 8, 2, 1],
+            [2, 5, 1, 8, 7, 6, 4, 9, 3],
+            [5, 4, 8, 1, 3, 2, 9, 7, 6],
+            [7, 2, 9, 5, 6, 4, 1, 3, 8],
+            [1, 3, 6, 7, 9, 8, 2, 4, 5],
+            [3, 7, 2, 6, 8, 9, 5, 1, 4],
+            [8, 1, 4, 2, 5, 3, 7, 6, 9],
+            [6, 9, 5, 4, 1, 7, 3, 8, 2],
+        ])
+        board = HB6DBoard.from_array(squares)
+
+        with self.assertRaises(ValueError):
+            board._fewest_candidates_constraint()
+
+
 class TestRecursiveSolve(unittest.TestCase):
 
     def test_recursive_solve_filled_board(self):
@@ -664,7 +1130,7 @@ class TestRecursiveSolve(unittest.TestCase):
             "6 9 5 | 4 1 7 | 3 8 2\n"
         )
 
-        board._recursive_solve()
+        board.solve(backtracking='copy')
 
         self.assertEqual(str(board), expected_str)
 
@@ -686,7 +1152,7 @@ class TestRecursiveSolve(unittest.TestCase):
         board = HB6DBoard.from_array(squares)
 
         with self.assertRaises(ConsistencyError):
-            board._recursive_solve()
+            board.solve(backtracking='copy')
 
     def test_recursive_solve_changes_invalid_board(self):
         # Invalid board with no possible candidate in the top left square
@@ -741,7 +1207,7 @@ class TestRecursiveSolve(unittest.TestCase):
         )
 
         with self.assertRaises(ConsistencyError):
-            board._recursive_solve()
+            board.solve(backtracking='copy')
 
         # Some candidates are removed despite the board being invalid
         self.assertEqual(repr(board), expected_repr)
@@ -780,7 +1246,7 @@ class TestRecursiveSolve(unittest.TestCase):
         )
 
         # When
-        board._recursive_solve()
+        board.solve(backtracking='copy')
 
         # Then
         self.assertEqual(str(board), expected_str)
@@ -789,24 +1255,13 @@ class TestRecursiveSolve(unittest.TestCase):
         """
         See `test_consistency_check_doesnt_always_raise`.
         """
-        # Recursively solving this board happens to exercise the rare case
-        # when the `_recursive_solve()` method raises because of an
-        # inconsistency that isn't detected by `_consistency_check()`.
-        squares = [
-            [4,    1,    7,    3,    6,    9,    8,    2,    5],  # noqa: E241
-            [2,    3,    6,    1,    5,    8,    7,    None, None],  # noqa: E241, E501
-            [None, 5,    None, 7,    2,    4,    None, 1,    None],  # noqa: E241, E501
-            [None, 2,    5,    4,    3,    7,    1,    6,    None],  # noqa: E241, E501
-            [None, None, 1,    None, 8,    None, 4,    None, None],  # noqa: E241, E501
-            [None, 4,    None, None, 1,    None, None, None, None],  # noqa: E241, E501
-            [None, None, 2,    6,    4,    3,    5,    7,    1],  # noqa: E241
-            [5,    None, 3,    2,    None, 1,    None, None, None],  # noqa: E241, E501
-            [1,    None, 4,    8,    None, 5,    None, None, None],  # noqa: E241, E501
-        ]
-        board = HB6DBoard.from_array(squares)
+        # Solving this board happens to exercise the rare case when the
+        # search raises because of an inconsistency that isn't detected by
+        # `_consistency_check()`.
+        board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
 
         with self.assertRaises(ConsistencyError) as exc_cm:
-            board._recursive_solve()
+            board.solve(backtracking='copy')
         self.assertEqual("No solution found.", str(exc_cm.exception))
 
 
@@ -831,3 +1286,580 @@ class TestSolve(unittest.TestCase):
 
         with self.assertRaises(ConsistencyError):
             board.solve()
+
+    def test_solve_branching_policies_agree(self):
+        # Given
+        squares = np.array([
+            [4, 0, 0, 0, 0, 0, 8, 0, 5],
+            [0, 3, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 7, 0, 0, 0, 0, 0],
+            [0, 2, 0, 0, 0, 0, 0, 6, 0],
+            [0, 0, 0, 0, 8, 0, 4, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0, 0],
+            [0, 0, 0, 6, 0, 3, 0, 7, 0],
+            [5, 0, 0, 2, 0, 0, 0, 0, 0],
+            [1, 0, 4, 0, 0, 0, 0, 0, 0],
+        ])
+        mrv_board = HB6DBoard.from_array(squares)
+        first_board = HB6DBoard.from_array(squares)
+
+        # When
+        mrv_board.solve(branching='mrv')
+        first_board.solve(branching='first')
+
+        # Then
+        # The puzzle has a unique solution
+        self.assertEqual(str(mrv_board), str(first_board))
+        self.assertEqual(mrv_board._cells.sum(), 81)
+
+    def test_solve_unknown_branching_policy(self):
+        board = HB6DBoard()
+
+        with self.assertRaises(ValueError):
+            board.solve(branching='last')
+
+    def test_solve_backtracking_modes_agree(self):
+        # Given
+        squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+        trail_board = HB6DBoard.from_array(squares)
+        copy_board = HB6DBoard.from_array(squares)
+
+        # When
+        trail_board.solve(backtracking='trail')
+        copy_board.solve(backtracking='copy')
+
+        # Then
+        np.testing.assert_array_equal(trail_board._cells, copy_board._cells)
+        self.assertEqual(trail_board._cells.sum(), 81)
+        # The undo trail isn't kept after solving
+        self.assertIsNone(trail_board._trail)
+
+    def test_solve_backtracking_modes_agree_for_invalid_board(self):
+        """
+        Check that both backtracking modes leave an invalid board in the
+        same state.
+        """
+        # Given
+        # See `test_consistency_check_doesnt_always_raise`.
+        trail_board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+        copy_board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+
+        # When
+        with self.assertRaises(ConsistencyError):
+            trail_board.solve(backtracking='trail')
+        with self.assertRaises(ConsistencyError):
+            copy_board.solve(backtracking='copy')
+
+        # Then
+        np.testing.assert_array_equal(trail_board._cells, copy_board._cells)
+
+    def test_solve_unknown_backtracking_mode(self):
+        board = HB6DBoard()
+
+        with self.assertRaises(ValueError):
+            board.solve(backtracking='undo')
+
+    def test_solve_algorithms_agree(self):
+        # Given
+        squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+        search_board = HB6DBoard.from_array(squares)
+        dlx_board = HB6DBoard.from_array(squares)
+
+        # When
+        search_board.solve(algorithm='search')
+        dlx_board.solve(algorithm='dlx')
+
+        # Then
+        np.testing.assert_array_equal(dlx_board._cells, search_board._cells)
+
+    def test_solve_dlx_invalid_board(self):
+        """
+        See `test_consistency_check_doesnt_always_raise`.
+        """
+        board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+
+        with self.assertRaises(ConsistencyError) as exc_cm:
+            board.solve(algorithm='dlx')
+
+        self.assertEqual("No solution found.", str(exc_cm.exception))
+
+    def test_solve_unknown_algorithm(self):
+        board = HB6DBoard()
+
+        with self.assertRaises(ValueError):
+            board.solve(algorithm='brute_force')
+
+    def test_solve_propagation_levels_agree(self):
+        # Given
+        squares = np.array(PUZZLES['hardest'])
+        expected_board = HB6DBoard.from_array(squares)
+        expected_stats = SolveStats()
+        expected_board.solve(stats=expected_stats)
+        singles_nodes = expected_stats.nodes
+
+        for propagation in _PROPAGATION_LEVELS[1:]:
+            board = HB6DBoard.from_array(squares)
+            stats = SolveStats()
+
+            # When
+            board.solve(stats=stats, propagation=propagation)
+
+            # Then
+            np.testing.assert_array_equal(board._cells, expected_board._cells)
+            self.assertGreater(stats.eliminations, 0)
+            # Stronger propagation needs no more guesses on this puzzle
+            self.assertLessEqual(stats.nodes, expected_stats.nodes)
+            expected_stats = stats
+
+        self.assertLess(expected_stats.nodes, singles_nodes)
+
+    def test_solve_propagation_invalid_board(self):
+        """
+        See `test_consistency_check_doesnt_always_raise`.
+        """
+        for propagation in _PROPAGATION_LEVELS:
+            board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+            with self.assertRaises(ConsistencyError):
+                board.solve(propagation=propagation)
+
+    def test_solve_unknown_propagation_level(self):
+        board = HB6DBoard()
+
+        with self.assertRaises(ValueError):
+            board.solve(propagation='brute_force')
+
+    def test_solve_stats(self):
+        # Given
+        squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+
+        for backtracking in _BACKTRACKING_MODES:
+            board = HB6DBoard.from_array(squares)
+            expected_board = HB6DBoard.from_array(squares)
+            stats = SolveStats()
+
+            # When
+            board.solve(backtracking=backtracking, stats=stats)
+            expected_board.solve(backtracking=backtracking)
+
+            # Then
+            # Recording statistics doesn't change the result
+            np.testing.assert_array_equal(board._cells, expected_board._cells)
+            self.assertIsNone(board._stats)
+            # Every node but the root one is reached by a guess
+            self.assertEqual(stats.nodes, stats.guesses + 1)
+            self.assertLess(stats.backtracks, stats.guesses)
+            self.assertGreaterEqual(stats.puts, stats.guesses)
+            self.assertGreater(stats.max_depth, 1)
+            self.assertGreater(stats.sweeps, stats.idle_sweeps)
+            self.assertGreater(stats.propagation_time, 0)
+            self.assertGreater(stats.consistency_time, 0)
+            self.assertGreater(stats.branching_time, 0)
+
+    def test_solve_stats_without_search(self):
+        squares = np.array([
+            [0, 0, 3, 0, 2, 0, 6, 0, 0],
+            [9, 0, 0, 3, 0, 5, 0, 0, 1],
+            [0, 0, 1, 8, 0, 6, 4, 0, 0],
+            [0, 0, 8, 1, 0, 2, 9, 0, 0],
+            [7, 0, 0, 0, 0, 0, 0, 0, 8],
+            [0, 0, 6, 7, 0, 8, 2, 0, 0],
+            [0, 0, 2, 6, 0, 9, 5, 0, 0],
+            [8, 0, 0, 2, 0, 3, 0, 0, 9],
+            [0, 0, 5, 0, 1, 0, 3, 0, 0],
+        ])
+        board = HB6DBoard.from_array(squares)
+        stats = SolveStats()
+
+        board.solve(stats=stats)
+
+        self.assertEqual(stats.nodes, 1)
+        self.assertEqual(stats.guesses, 0)
+        self.assertEqual(stats.max_depth, 0)
+
+
+class TestSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+
+    def test_search_matches_recursive_solve(self):
+        for branching in _BRANCHING_POLICIES:
+            for backtracking in _BACKTRACKING_MODES:
+                # Given
+                board = HB6DBoard.from_array(self.squares)
+                expected_board = HB6DBoard.from_array(self.squares)
+                stats = SolveStats()
+                expected_stats = SolveStats()
+
+                # When
+                search = Search(board, branching, backtracking, stats)
+                state = search.run()
+                expected_board._stats = expected_stats
+                recursive_solve(expected_board, branching)
+
+                # Then
+                self.assertEqual(state, Search.SOLVED)
+                np.testing.assert_array_equal(
+                    board._cells, expected_board._cells
+                )
+                self.assertEqual(search.nodes, expected_stats.nodes)
+                self.assertEqual(stats.guesses, expected_stats.guesses)
+                self.assertEqual(stats.backtracks, expected_stats.backtracks)
+                self.assertEqual(stats.max_depth, expected_stats.max_depth)
+
+    def test_search_pause_and_resume(self):
+        # Given
+        board = HB6DBoard.from_array(self.squares)
+        expected_board = HB6DBoard.from_array(self.squares)
+        expected_search = Search(expected_board)
+        expected_search.run()
+
+        # When
+        search = Search(board)
+        states = []
+        while search.run(max_nodes=3) == Search.PAUSED:
+            states.append(search.state)
+
+        # Then
+        self.assertEqual(search.state, Search.SOLVED)
+        self.assertEqual(search.nodes, expected_search.nodes)
+        self.assertEqual(
+            len(states), (expected_search.nodes - 1) // 3
+        )
+        np.testing.assert_array_equal(board._cells, expected_board._cells)
+
+    def test_search_every_solution(self):
+        # There are 288 four-by-four sudoku grids
+        board = HB6DBoard((2, 2))
+        search = Search(board, backtracking='copy')
+
+        count = 0
+        while search.run() == Search.SOLVED:
+            self.assertEqual(board._cells.sum(), 16)
+            count += 1
+
+        self.assertEqual(count, 288)
+        self.assertEqual(search.run(), Search.EXHAUSTED)
+
+    def test_search_deeper_than_recursion_limit(self):
+        # Solving an empty sixteen-by-sixteen board takes more than 100
+        # nested guesses
+        board = HB6DBoard((4, 4))
+        recursive_board = HB6DBoard((4, 4))
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 100)
+        try:
+            board.solve()
+            with self.assertRaises(RecursionError):
+                recursive_solve(recursive_board)
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+
+        self.assertEqual(board._cells.sum(), 256)
+
+    def test_search_unknown_backtracking_mode(self):
+        with self.assertRaises(ValueError):
+            Search(HB6DBoard(), backtracking='undo')
+
+
+class TestCountSolutions(unittest.TestCase):
+
+    def setUp(self):
+        # Proper puzzle, i.e. with a unique solution
+        self.squares = np.array([
+            [4, 0, 0, 0, 0, 0, 8, 0, 5],
+            [0, 3, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 7, 0, 0, 0, 0, 0],
+            [0, 2, 0, 0, 0, 0, 0, 6, 0],
+            [0, 0, 0, 0, 8, 0, 4, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0, 0],
+            [0, 0, 0, 6, 0, 3, 0, 7, 0],
+            [5, 0, 0, 2, 0, 0, 0, 0, 0],
+            [1, 0, 4, 0, 0, 0, 0, 0, 0],
+        ])
+
+    def test_count_solutions_proper_puzzle(self):
+        for algorithm in ('search', 'dlx'):
+            board = HB6DBoard.from_array(self.squares)
+            self.assertEqual(board.count_solutions(algorithm=algorithm), 1)
+
+    def test_count_solutions_doesnt_mutate_board(self):
+        board = HB6DBoard.from_array(self.squares)
+        expected_cells = board._cells.copy()
+
+        board.count_solutions()
+
+        np.testing.assert_array_equal(board._cells, expected_cells)
+        self.assertIsNone(board._trail)
+
+    def test_count_solutions_stops_at_limit(self):
+        # Remove a given, which leaves many solutions
+        self.squares[0, 0] = 0
+        for algorithm in ('search', 'dlx'):
+            board = HB6DBoard.from_array(self.squares)
+            self.assertEqual(board.count_solutions(algorithm=algorithm), 2)
+            self.assertEqual(
+                board.count_solutions(limit=5, algorithm=algorithm), 5
+            )
+
+    def test_count_solutions_without_limit(self):
+        # There are 288 four-by-four sudoku grids
+        for branching, algorithm in [
+            ('mrv', 'search'), ('first', 'search'), ('mrv', 'dlx'),
+        ]:
+            board = HB6DBoard((2, 2))
+            count = board.count_solutions(
+                limit=None, branching=branching, algorithm=algorithm
+            )
+            self.assertEqual(count, 288)
+
+    def test_count_solutions_invalid_board(self):
+        """
+        See `test_consistency_check_doesnt_always_raise`.
+        """
+        for algorithm in ('search', 'dlx'):
+            board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+            self.assertEqual(board.count_solutions(algorithm=algorithm), 0)
+
+    def test_count_solutions_invalid_limit(self):
+        board = HB6DBoard()
+
+        with self.assertRaises(ValueError):
+            board.count_solutions(limit=0)
+
+
+class TestIterSolutions(unittest.TestCase):
+
+    def test_iter_solutions_proper_puzzle(self):
+        squares = np.array([
+            [8, 0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 3, 6, 0, 0, 0, 0, 0],
+            [0, 7, 0, 0, 9, 0, 2, 0, 0],
+            [0, 5, 0, 0, 0, 7, 0, 0, 0],
+            [0, 0, 0, 0, 4, 5, 7, 0, 0],
+            [0, 0, 0, 1, 0, 0, 0, 3, 0],
+            [0, 0, 1, 0, 0, 0, 0, 6, 8],
+            [0, 0, 8, 5, 0, 0, 0, 1, 0],
+            [0, 9, 0, 0, 0, 0, 4, 0, 0],
+        ])
+        board = HB6DBoard.from_array(squares)
+        expected_board = HB6DBoard.from_array(squares)
+        expected_board.solve()
+
+        for algorithm in ('search', 'dlx'):
+            solutions = list(board.iter_solutions(algorithm=algorithm))
+
+            self.assertEqual(len(solutions), 1)
+            np.testing.assert_array_equal(
+                HB6DBoard.from_array(solutions[0])._cells,
+                expected_board._cells,
+            )
+
+    def test_iter_solutions_every_solution(self):
+        # There are 288 four-by-four sudoku grids
+        board = HB6DBoard((2, 2))
+
+        for algorithm in ('search', 'dlx'):
+            solutions = set()
+            for solution in board.iter_solutions(algorithm=algorithm):
+                self.assertEqual(solution.shape, (4, 4))
+                # Every solution is a valid grid
+                solved_board = HB6DBoard.from_array(solution)
+                self.assertEqual(solved_board._cells.sum(), 16)
+                self.assertEqual(solved_board._empty_constraints(), [])
+                solutions.add(solution.tobytes())
+
+            self.assertEqual(len(solutions), 288)
+
+    def test_iter_solutions_stops_early(self):
+        board = HB6DBoard()
+        expected_cells = board._cells.copy()
+
+        solutions = board.iter_solutions()
+        first = next(solutions)
+        second = next(solutions)
+        solutions.close()
+
+        self.assertFalse((first == second).all())
+        # The board isn't modified
+        np.testing.assert_array_equal(board._cells, expected_cells)
+        self.assertIsNone(board._trail)
+
+    def test_iter_solutions_invalid_board(self):
+        board = HB6DBoard()
+        board._cells[:, :, 0, 0, 0, 0] = False
+
+        self.assertEqual(list(board.iter_solutions()), [])
+
+    def test_iter_solutions_unknown_option(self):
+        board = HB6DBoard()
+        for kwargs in ({'branching': 'last'}, {'algorithm': 'dancing'},
+                       {'propagation': 'pairs'}):
+            # Raises before the first solution is asked for
+            with self.assertRaises(ValueError):
+                board.iter_solutions(**kwargs)
+
+
+class TestGeometry(unittest.TestCase):
+
+    def setUp(self):
+        path = os.path.join(EXAMPLES_DIR, 'rectangular_2x3', 'example1.txt')
+        with open(path) as f:
+            self.solution = np.array(
+                [[int(char) for char in line.strip()] for line in f]
+            )
+        # Empty the main diagonal and another diagonal
+        empty = np.eye(6, dtype=bool) | np.eye(6, k=2, dtype=bool)
+        self.puzzle = np.where(empty, 0, self.solution)
+
+    def test_default_box_shape(self):
+        for size, box_shape in [
+            (4, (2, 2)), (6, (2, 3)), (9, (3, 3)), (12, (3, 4)),
+            (16, (4, 4)), (25, (5, 5)),
+        ]:
+            self.assertEqual(_default_box_shape(size), box_shape)
+
+    def test_init_invalid_box_shape(self):
+        with self.assertRaises(ValueError):
+            HB6DBoard((0, 3))
+        with self.assertRaises(ValueError):
+            HB6DBoard((3,))
+
+    def test_from_array_wrong_size(self):
+        with self.assertRaises(ValueError):
+            HB6DBoard.from_array(self.puzzle, box_shape=(3, 3))
+
+    def test_num_row_col_to_idx_rectangular(self):
+        board = HB6DBoard((2, 3))
+        _idx = board._num_row_col_to_idx(4, 3, 5)
+        self.assertEqual(_idx, (1, 1, 1, 1, 1, 2))
+        self.assertEqual(board._idx_to_num_row_col(_idx), (4, 3, 5))
+
+    def test_peers(self):
+        # Compare with a brute-force search for every cell
+        shape = _make_shape((2, 3))
+        peers = _peers(shape)
+        for _flat_idx in range(np.prod(shape)):
+            _idx = np.unravel_index(_flat_idx, shape)
+            mask = np.zeros(shape, dtype=bool)
+            mask[(slice(None),) * 2 + _idx[2:]] = True
+            mask[_idx[:4]] = True
+            mask[_idx[:2] + (slice(None),) * 2 + _idx[4:]] = True
+            mask[_idx[:3] + (slice(None), _idx[4], slice(None))] = True
+            mask[_idx] = False
+            np.testing.assert_array_equal(
+                peers[_flat_idx], np.flatnonzero(mask)
+            )
+
+    def test_peers_are_cached(self):
+        shape = _make_shape((4, 4))
+        self.assertIs(_peers(shape), _peers(shape))
+
+    def test_str_rectangular(self):
+        board = HB6DBoard.from_array(self.solution)
+        expected_str = (
+            "1 2 3 | 4 5 6\n"
+            "4 5 6 | 1 2 3\n"
+            "-------------\n"
+            "2 3 1 | 5 6 4\n"
+            "5 6 4 | 2 3 1\n"
+            "-------------\n"
+            "3 1 2 | 6 4 5\n"
+            "6 4 5 | 3 1 2\n"
+        )
+        self.assertEqual(str(board), expected_str)
+
+    def test_str_wide_numbers(self):
+        board = HB6DBoard((4, 4))
+        board.insert(12, 1, 1)
+        board.insert(3, 1, 2)
+        first_line = str(board).split('\n')[0]
+        self.assertEqual(
+            first_line,
+            "12  3  .  . |  .  .  .  . |  .  .  .  . |  .  .  .  .",
+        )
+
+    def test_inconsistency_message_rectangular(self):
+        board = HB6DBoard((2, 3))
+        # Remove number 5 from every square of the last box
+        board._cells[1, 1, 2, :, 1, :] = False
+        with self.assertRaises(ConsistencyError) as cm:
+            board._check_consistency()
+        self.assertEqual(
+            str(cm.exception), "Inconsistency found for _num 4 in _box 5."
+        )
+        self.assertIn((1, 1, 2, None, 1, None), board._empty_constraints())
+
+    def test_solve_rectangular(self):
+        for kwargs in [
+            {'branching': 'first'},
+            {'branching': 'mrv', 'backtracking': 'copy'},
+            {'backtracking': 'trail'},
+            {'algorithm': 'dlx'},
+        ]:
+            board = HB6DBoard.from_array(self.puzzle)
+            board.solve(**kwargs)
+            expected_board = HB6DBoard.from_array(self.solution)
+            np.testing.assert_array_equal(
+                board._cells, expected_board._cells
+            )
+
+    def test_solve_16_by_16(self):
+        _rows, _cols = np.indices((16, 16))
+        solution = (4 * (_rows % 4) + _rows // 4 + _cols) % 16 + 1
+        puzzle = np.where((_rows + 3 * _cols) % 5 < 2, 0, solution)
+
+        for algorithm in ('search', 'dlx'):
+            board = HB6DBoard.from_array(puzzle)
+            board.solve(algorithm=algorithm)
+
+            # Every square has one candidate, the givens are kept, and every
+            # number appears once per row, column and box
+            self.assertEqual(board._cells.sum(), 256)
+            grid = np.array([
+                [board.candidates(row, column)[0] for column in range(1, 17)]
+                for row in range(1, 17)
+            ])
+            np.testing.assert_array_equal(grid[puzzle > 0], puzzle[puzzle > 0])
+            for axes in _CONSTRAINT_AXES:
+                self.assertTrue((board._cells.sum(axis=axes) == 1).all())
@@ -0,0 +1,174 @@
+import unittest
+
+import numpy as np
+
+from pZudoku.hb6d_board import HB6DBoard
+from pZudoku.propagation import fish, locked_candidates, subsets
+
+
+class TestLockedCandidates(unittest.TestCase):
+
+    def setUp(self):
+        self.board = HB6DBoard()
+        # Candidates indexed by [_num, _row, _col]
+        self.cells = self.board._cells.reshape(9, 9, 9)
+
+    def test_locked_candidates_pointing(self):
+        # Given: number 1 is only in the first row of the first box
+        self.cells[0, 1:3, 0:3] = False
+        expected = np.zeros_like(self.cells)
+        expected[0, 0, 3:] = True
+
+        # When
+        eliminated = locked_candidates(self.board._cells)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+
+    def test_locked_candidates_claiming(self):
+        # Given: number 1 is only in the first box of the first column
+        self.cells[0, 3:, 0] = False
+        expected = np.zeros_like(self.cells)
+        expected[0, 0:3, 1:3] = True
+
+        # When
+        eliminated = locked_candidates(self.board._cells)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+
+    def test_locked_candidates_rectangular_boxes(self):
+        # Given: number 1 is only in the first row of the first 2-by-3 box
+        board = HB6DBoard((2, 3))
+        cells = board._cells.reshape(6, 6, 6)
+        cells[0, 1, 0:3] = False
+        expected = np.zeros_like(cells)
+        expected[0, 0, 3:] = True
+
+        # When
+        eliminated = locked_candidates(board._cells)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(6, 6, 6), expected)
+
+    def test_locked_candidates_does_not_modify_cells(self):
+        self.cells[0, 1:3, 0:3] = False
+        expected_cells = self.board._cells.copy()
+
+        locked_candidates(self.board._cells)
+
+        np.testing.assert_array_equal(self.board._cells, expected_cells)
+
+
+class TestSubsets(unittest.TestCase):
+
+    def setUp(self):
+        self.board = HB6DBoard()
+        # Candidates indexed by [_num, _row, _col]
+        self.cells = self.board._cells.reshape(9, 9, 9)
+
+    def test_subsets_naked_pair(self):
+        # Given: the first two squares can only hold numbers 1 and 2
+        self.cells[2:, 0, 0:2] = False
+        expected = np.zeros_like(self.cells)
+        # The rest of the row and of the box
+        expected[0:2, 0, 2:] = True
+        expected[0:2, 1:3, 0:3] = True
+
+        # When
+        eliminated = subsets(self.board._cells, 2)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+
+    def test_subsets_hidden_pair(self):
+        # Given: numbers 1 and 2 can only go in the first two squares of the
+        # first row
+        self.cells[0:2, 0, 2:] = False
+        expected = np.zeros_like(self.cells)
+        expected[2:, 0, 0:2] = True
+
+        # When
+        eliminated = subsets(self.board._cells, 2)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+
+    def test_subsets_naked_triple(self):
+        # Given: three squares of the first column can only hold numbers 1, 2
+        # and 3, but none of them can hold all three
+        self.cells[3:, [0, 4, 8], 0] = False
+        self.cells[0, 0, 0] = False
+        self.cells[1, 4, 0] = False
+        self.cells[2, 8, 0] = False
+        expected = np.zeros_like(self.cells)
+        expected[0:3, [1, 2, 3, 5, 6, 7], 0] = True
+
+        # When
+        eliminated = subsets(self.board._cells, 3)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+        self.assertFalse(subsets(self.board._cells, 2).any())
+
+    def test_subsets_nothing_on_empty_board(self):
+        for size in (2, 3):
+            self.assertFalse(subsets(self.board._cells, size).any())
+
+
+class TestFish(unittest.TestCase):
+
+    def setUp(self):
+        self.board = HB6DBoard()
+        # Candidates indexed by [_num, _row, _col]
+        self.cells = self.board._cells.reshape(9, 9, 9)
+
+    def test_fish_x_wing(self):
+        # Given: number 1 can only go in columns 1 and 5 of rows 1 and 5
+        for _row in (0, 4):
+            self.cells[0, _row, :] = False
+            self.cells[0, _row, [0, 4]] = True
+        expected = np.zeros_like(self.cells)
+        expected[0, [1, 2, 3, 5, 6, 7, 8], 0] = True
+        expected[0, [1, 2, 3, 5, 6, 7, 8], 4] = True
+
+        # When
+        eliminated = fish(self.board._cells, 2)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+
+    def test_fish_swordfish(self):
+        # Given: number 1 can only go in columns 1, 4 and 7 of rows 1, 4 and
+        # 7, but no X-Wing
+        for _row, _cols in ((0, [0, 3]), (3, [3, 6]), (6, [0, 6])):
+            self.cells[0, _row, :] = False
+            self.cells[0, _row, _cols] = True
+        expected = np.zeros_like(self.cells)
+        for _col in (0, 3, 6):
+            expected[0, [1, 2, 4, 5, 7, 8], _col] = True
+
+        # When
+        eliminated = fish(self.board._cells, 3)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
+        self.assertFalse(fish(self.board._cells, 2).any())
+
+    def test_fish_jellyfish_in_columns(self):
+        # Given: number 2 can only go in rows 1, 3, 5 and 7 of columns 1, 3,
+        # 5 and 7
+        for _col, _rows in (
+            (0, [0, 2]), (2, [2, 4]), (4, [4, 6]), (6, [6, 0]),
+        ):
+            self.cells[1, :, _col] = False
+            self.cells[1, _rows, _col] = True
+        expected = np.zeros_like(self.cells)
+        for _row in (0, 2, 4, 6):
+            expected[1, _row, [1, 3, 5, 7, 8]] = True
+
+        # When
+        eliminated = fish(self.board._cells, 4)
+
+        # Then
+        np.testing.assert_array_equal(eliminated.reshape(9, 9, 9), expected)
@@ -0,0 +1,53 @@
+import unittest
+
+from pZudoku.stats import SolveStats
+
+
+class TestSolveStats(unittest.TestCase):
+
+    def test_init(self):
+        stats = SolveStats()
+
+        self.assertEqual(stats.nodes, 0)
+        self.assertEqual(stats.max_depth, 0)
+        self.assertEqual(stats.propagation_time, 0.0)
+
+    def test_add(self):
+        # Given
+        first = SolveStats()
+        first.nodes = 3
+        first.max_depth = 2
+        first.branching_time = 0.5
+        second = SolveStats()
+        second.nodes = 4
+        second.max_depth = 5
+        second.branching_time = 0.25
+
+        # When
+        total = first + second
+
+        # Then
+        self.assertEqual(total.nodes, 7)
+        self.assertEqual(total.max_depth, 5)
+        self.assertEqual(total.branching_time, 0.75)
+        # The operands aren't modified
+        self.assertEqual(first.nodes, 3)
+
+    def test_sum(self):
+        stats_list = [SolveStats() for _ in range(3)]
+        for n, stats in enumerate(stats_list):
+            stats.guesses = n
+
+        total = sum(stats_list, SolveStats())
+
+        self.assertEqual(total.guesses, 3)
+
+    def test_as_dict(self):
+        stats = SolveStats()
+        stats.backtracks = 2
+
+        stats_dict = stats.as_dict()
+
+        self.assertEqual(stats_dict['backtracks'], 2)
+        self.assertEqual(len(stats_dict), 11)
+        self.assertIn('backtracks=2', repr(stats))
@@ -0,0 +1,143 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+import numpy as np
+
+from pZudoku.batch import ERROR, NO_SOLUTION, solve_many, solve_parallel
+from pZudoku.benchmarks.puzzles import NO_SOLUTION_PUZZLE, PUZZLES
+from pZudoku.hb6d_board import ConsistencyError, HB6DBoard
+from pZudoku.store import SolutionStore
+
+
+class _StoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'solutions.sqlite')
+        self.store = SolutionStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmp_dir)
+
+
+class TestSolutionStore(_StoreTestCase):
+
+    def test_get_put_many(self):
+        self.store.put_many({b'a': (0, b'x'), b'b': (2, b'')})
+        self.store.put(b'c', (1, b'z'))
+        self.assertEqual(
+            self.store.get_many([b'a', b'c', b'd']),
+            {b'a': (0, b'x'), b'c': (1, b'z')},
+        )
+        self.assertEqual(self.store.get(b'b'), (2, b''))
+        self.assertIsNone(self.store.get(b'd'))
+        self.assertEqual((self.store.hits, self.store.misses), (3, 2))
+        self.assertEqual(len(self.store), 3)
+
+    def test_many_keys(self):
+        outcomes = {str(n).encode(): (n, b'') for n in range(1200)}
+        self.store.put_many(outcomes)
+        self.assertEqual(self.store.get_many(outcomes), outcomes)
+
+    def test_persistent(self):
+        self.store.put(b'a', (0, b'x'))
+        self.store.close()
+        with SolutionStore(self.path) as store:
+            self.assertEqual(store.get(b'a'), (0, b'x'))
+
+    def test_wal(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            (mode,), = connection.execute('PRAGMA journal_mode')
+        finally:
+            connection.close()
+        self.assertEqual(mode, 'wal')
+
+    def test_compact(self):
+        self.store.put_many([(b'a', (0, b'')), (b'b', (0, b''))])
+        self.store.put(b'c', (0, b''))
+        self.assertEqual(self.store.compact(), 0)
+        self.assertEqual(self.store.compact(max_entries=1), 2)
+        self.assertEqual(self.store.get_many([b'a', b'b', b'c']).keys(),
+                         {b'c'})
+        with self.assertRaises(ValueError):
+            self.store.compact(max_entries=-1)
+
+    def test_compact_after_lookups(self):
+        self.store.put(b'a', (0, b''))
+        self.store.put(b'b', (0, b''))
+        self.store.get(b'a')
+        self.assertEqual(self.store.compact(max_entries=1), 1)
+        self.assertEqual(self.store.get_many([b'a', b'b']).keys(), {b'a'})
+
+    def test_lookups_dont_write(self):
+        self.store.put(b'a', (0, b'x'))
+        # Another process holding the write lock doesn't block lookups
+        connection = sqlite3.connect(self.path)
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            with SolutionStore(self.path, timeout=0.1) as store:
+                self.assertEqual(store.get(b'a'), (0, b'x'))
+                connection.rollback()
+        finally:
+            connection.close()
+
+
+class TestSolveWithStore(_StoreTestCase):
+
+    def test_solve(self):
+        fresh = HB6DBoard.from_array(PUZZLES['hard'])
+        fresh.solve()
+        for _ in range(2):
+            board = HB6DBoard.from_array(PUZZLES['hard'])
+            board.solve(cache=self.store)
+            self.assertEqual(board.to_bytes(), fresh.to_bytes())
+        self.assertEqual((self.store.hits, self.store.misses), (1, 1))
+
+    def test_solve_no_solution(self):
+        fresh = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+        with self.assertRaises(ConsistencyError):
+            fresh.solve()
+        for _ in range(2):
+            board = HB6DBoard.from_array(NO_SOLUTION_PUZZLE)
+            with self.assertRaises(ConsistencyError):
+                board.solve(cache=self.store)
+            self.assertEqual(board.to_bytes(), fresh.to_bytes())
+        self.assertEqual((self.store.hits, self.store.misses), (1, 1))
+
+    def test_solve_many(self):
+        puzzles = [PUZZLES['easy'], PUZZLES['hardest'], NO_SOLUTION_PUZZLE]
+        expected_solutions, expected_status = solve_many(puzzles)
+
+        solve_many(puzzles[1:], store=self.store)
+        solutions, status, stats = solve_many(
+            puzzles, return_stats=True, store=self.store
+        )
+
+        np.testing.assert_array_equal(solutions, expected_solutions)
+        np.testing.assert_array_equal(status, expected_status)
+        self.assertEqual(status[2], NO_SOLUTION)
+        self.assertEqual((self.store.hits, self.store.misses), (2, 3))
+        # Only the puzzle that wasn't stored is solved
+        self.assertEqual(sum(s.nodes for s in stats), 0)
+        self.assertEqual(len(self.store), 3)
+
+    def test_solve_parallel(self):
+        puzzles = [PUZZLES['easy'], PUZZLES['hard'], PUZZLES['easy'][:-1]]
+        expected_solutions, _ = solve_many(puzzles[:2])
+
+        for _ in range(2):
+            results = list(solve_parallel(
+                puzzles, n_workers=1, chunk_size=2, store=self.store,
+            ))
+            solutions, status = zip(*results)
+            np.testing.assert_array_equal(solutions[:2], expected_solutions)
+            self.assertEqual(status[2], ERROR)
+
+        # Malformed puzzles are neither looked up nor stored
+        self.assertEqual((self.store.hits, self.store.misses), (2, 2))
+        self.assertEqual(len(self.store), 2)
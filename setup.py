@@ -6,7 +6,6 @@ TROVE_CLASSIFIERS = [
     "Operating System :: OS Independent",
     "Programming Language :: Python :: 3 :: Only",
     "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.4",
     "Programming Language :: Python :: 3.5",
     "Programming Language :: Python :: 3.6",
     "Programming Language :: Python :: 3.7",
@@ -53,7 +52,7 @@ setuptools.setup(
         "numpy >= 1.14.5",
     ],
 
-    python_requires=">=3.4",
+    python_requires=">=3.5",
 
     project_urls={
         "Tracker": "https://github.com/pzahemszky/pZudoku/issues",